@@ -0,0 +1,111 @@
+import logging
+from typing import Optional
+
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, col, select
+
+from app.api.cruds.pagination import Page, paginate
+from app.api.cruds.seat_template import compile_template
+from app.common.exceptions import (
+    AircraftConfigurationAlreadyExistsError,
+    AircraftConfigurationNotFoundError,
+    FlightError,
+)
+from app.domain.models import AircraftConfiguration
+from app.domain.schemas import AircraftConfigurationCreate, CountStrategy
+
+logger = logging.getLogger(__name__)
+
+
+def create(
+    session: Session, configuration_in: AircraftConfigurationCreate
+) -> AircraftConfiguration:
+    """
+    Create a new aircraft configuration in the database.
+    """
+    logger.info(f"Creating aircraft configuration: {configuration_in.name}")
+
+    query = select(AircraftConfiguration).where(
+        AircraftConfiguration.name == configuration_in.name
+    )
+    if session.exec(query).first():
+        logger.warning(f"Aircraft configuration {configuration_in.name} already exists")
+        raise AircraftConfigurationAlreadyExistsError(name=configuration_in.name)
+
+    template = compile_template(
+        configuration_in.rows,
+        configuration_in.layout,
+        frozenset(configuration_in.blocked_seats),
+    )
+
+    try:
+        configuration_db = AircraftConfiguration.model_validate(
+            configuration_in,
+            update={
+                "seat_count": len(template.seat_numbers),
+                "cabins": [cabin.model_dump() for cabin in configuration_in.cabins],
+            },
+        )
+
+        session.add(configuration_db)
+        session.commit()
+
+        logger.info(
+            f"Successfully created aircraft configuration with ID: "
+            f"{configuration_db.id}"
+        )
+        return configuration_db
+
+    except IntegrityError as e:
+        session.rollback()
+        logger.error(
+            f"Database integrity error during aircraft configuration creation: {str(e)}"
+        )
+        raise FlightError(
+            500, f"Failed to create aircraft configuration: {str(e)}"
+        ) from e
+
+
+def get_by_id(session: Session, configuration_id: str) -> AircraftConfiguration:
+    """
+    Get aircraft configuration by ID.
+    """
+    logger.debug(f"Getting aircraft configuration by ID: {configuration_id}")
+
+    configuration_db = session.get(AircraftConfiguration, configuration_id)
+    if not configuration_db:
+        logger.warning(f"Aircraft configuration not found with ID: {configuration_id}")
+        raise AircraftConfigurationNotFoundError(configuration_id=configuration_id)
+    return configuration_db
+
+
+def get_all(
+    session: Session,
+    skip: int = 0,
+    limit: int = 100,
+    count_strategy: CountStrategy = CountStrategy.EXACT,
+    cursor: Optional[str] = None,
+) -> Page[AircraftConfiguration]:
+    """
+    Get all aircraft configurations.
+
+    Returns:
+        Page of aircraft configurations with the total count, if requested
+    """
+    logger.info("Getting all aircraft configurations")
+
+    page = paginate(
+        session,
+        select(AircraftConfiguration),
+        skip,
+        limit,
+        count_strategy,
+        order_by=(col(AircraftConfiguration.name), col(AircraftConfiguration.id)),
+        cursor=cursor,
+    )
+
+    logger.info(
+        f"Found {page.total} aircraft configurations, "
+        f"returning {len(page.data)} results"
+    )
+    return page
@@ -2,22 +2,33 @@ import logging
 from datetime import datetime
 from typing import Any, Optional
 
+import sqlalchemy as sa
 from pydantic import BaseModel
 from sqlalchemy.exc import IntegrityError
-from sqlmodel import Session, func, select
+from sqlmodel import Session, col, select
 
-from app.api.cruds import ViewFilter, passenger_crud, ticket_crud
+from app.api.cruds import (
+    ViewFilter,
+    idempotency_crud,
+    seat_crud,
+    seat_hold_crud,
+)
+from app.api.cruds.pagination import Page, paginate
 from app.common.exceptions import (
     BookingError,
     BookingNotFoundError,
     BookingStatusError,
-    UnauthorizedBookingAccessError,
+    NoAvailableSeatsError,
+    SeatError,
+    TicketError,
 )
-from app.domain.models import Booking, BookingStatus, User
+from app.domain.models import Booking, BookingStatus, Passenger, Seat, Ticket, User
 from app.domain.schemas import (
     BookingCreate,
+    BookingPublic,
     BookingStatusUpdate,
     BookingUpdate,
+    CountStrategy,
     PassengerCreate,
     TicketCreate,
     TicketWithSeat,
@@ -37,7 +48,6 @@ def create(session: Session, booking_in: BookingCreate) -> Booking:
 
         session.add(booking_db)
         session.commit()
-        session.refresh(booking_db)
 
         logger.info(f"Successfully created booking with ID: {booking_db.id}")
         return booking_db
@@ -48,67 +58,149 @@ def create(session: Session, booking_in: BookingCreate) -> Booking:
         raise BookingError(500, f"Failed to create booking: {str(e)}") from e
 
 
-def create_detailed_booking(session: Session, booking_in: BookingCreate) -> Booking:
+def create_detailed_booking(
+    session: Session, booking_in: BookingCreate, idempotency_key: Optional[str] = None
+) -> Booking:
     """
-    Create a booking with passengers and tickets.
+    Create a booking with passengers and tickets in a single transaction.
+
+    All inputs are validated before the database is touched. Seats held
+    under the booking's hold token are consumed, chosen seats are claimed
+    with one all-or-nothing UPDATE and unseated passengers are seated
+    together. Passengers and tickets are then bulk-inserted and the whole
+    booking is committed once, so the number of statements doesn't grow
+    with the number of passengers.
+
+    Raises:
+        BookingError: If the booking input is invalid
+        IdempotencyKeyReusedError: If the key was used for a different booking
+        SeatError: If a chosen seat doesn't exist or is taken
+        NoAvailableSeatsError: If there aren't enough seats left
     """
     logger.info(f"Creating detailed booking for user ID: {booking_in.user_id}")
 
-    try:
-        # Create the booking - Use direct instantiation instead of model_validate
-        # to avoid issues with nested Pydantic models like PassengerInfo
-        booking_db = Booking(
-            total_price=booking_in.total_price,
-            status=booking_in.status,
-            user_id=booking_in.user_id,
+    flight_id = booking_in.flight_info.flight_id
+    seat_ids = list(booking_in.flight_info.seat_ids)
+    if not booking_in.passengers:
+        raise BookingError(400, "At least one passenger is required")
+    if len(seat_ids) != len(booking_in.passengers):
+        raise BookingError(400, "Number of seat IDs must match number of passengers")
+    chosen_seat_ids = [seat_id for seat_id in seat_ids if seat_id]
+    if len(set(chosen_seat_ids)) != len(chosen_seat_ids):
+        raise BookingError(400, "A seat can only be assigned to one passenger")
+
+    # Use direct instantiation instead of model_validate to avoid issues
+    # with nested Pydantic models like PassengerInfo
+    booking_db = Booking(
+        total_price=booking_in.total_price,
+        status=booking_in.status,
+        user_id=booking_in.user_id,
+    )
+    passengers = [
+        Passenger.model_validate(
+            PassengerCreate(**passenger.model_dump(), booking_id=booking_db.id)
         )
+        for passenger in booking_in.passengers
+    ]
 
-        # Add to session to get an ID
-        session.add(booking_db)
-        session.flush()  # This assigns an ID without committing
+    try:
+        if idempotency_key:
+            replayed = idempotency_crud.begin(
+                session,
+                booking_in.user_id,
+                idempotency_key,
+                idempotency_crud.fingerprint("booking", booking_in.model_dump_json()),
+            )
+            if replayed is not None:
+                session.rollback()
+                return Booking.model_validate(replayed)
 
-        logger.info(f"Booking created successfully: {booking_db.id}")
+        session.add(booking_db)
 
-        # Create the passengers
-        logger.info(
-            f"Creating {len(booking_in.passengers)} passengers "
-            f"for booking {booking_db.id}"
-        )
-        created_passengers = []
-        for passenger_data in booking_in.passengers:
-            passenger_create = PassengerCreate(
-                **passenger_data.model_dump(), booking_id=booking_db.id
+        # Seats held for this checkout are already off sale
+        held_seat_ids: set[str] = set()
+        if booking_in.flight_info.hold_token and chosen_seat_ids:
+            held_seat_ids = seat_hold_crud.consume(
+                session,
+                booking_in.flight_info.hold_token,
+                booking_in.user_id,
+                flight_id,
+                chosen_seat_ids,
             )
-            passenger_db = passenger_crud.create(session, passenger_create)
 
-            logger.info(f"Passenger created successfully: {passenger_db.id}")
-            created_passengers.append(passenger_db)
+        # Claim the other chosen seats, all or none
+        claimed = seat_crud.claim_seats(
+            session,
+            flight_id,
+            [seat_id for seat_id in chosen_seat_ids if seat_id not in held_seat_ids],
+        )
 
-        # Create the tickets
-        flight_id = booking_in.flight_info.flight_id
-        seat_ids = booking_in.flight_info.seat_ids
-        logger.info(f"Creating {len(seat_ids)} tickets for flight {flight_id}")
+        # Seat passengers without a chosen seat together
+        unseated = [i for i, seat_id in enumerate(seat_ids) if not seat_id]
+        if len(unseated) > 1:
+            seated = seat_crud.claim_seat_block(session, flight_id, len(unseated))
+        elif unseated:
+            seat = seat_crud.claim_available_seat(session, flight_id)
+            seated = [seat] if seat else []
+        else:
+            seated = []
+        if len(seated) < len(unseated):
+            logger.warning(f"Not enough available seats for flight {flight_id}")
+            raise NoAvailableSeatsError()
+        for i, seat in zip(unseated, seated, strict=True):
+            seat_ids[i] = seat.id
+
+        sold = len(claimed) + len(seated)
+        if sold:
+            seat_crud.adjust_seats_remaining(session, flight_id, -sold)
+
+        # Insert the passengers and their tickets in bulk
+        session.execute(
+            sa.insert(Passenger), [passenger.model_dump() for passenger in passengers]
+        )
+        session.execute(
+            sa.insert(Ticket),
+            [
+                Ticket.model_validate(
+                    TicketCreate(
+                        passenger_id=passenger.id,
+                        flight_id=flight_id,
+                        seat_id=seat_id,
+                    )
+                ).model_dump()
+                for passenger, seat_id in zip(passengers, seat_ids, strict=True)
+            ],
+        )
 
-        for i, passenger in enumerate(created_passengers):
-            ticket_create = TicketCreate(
-                passenger_id=passenger.id,
-                flight_id=flight_id,
-                seat_id=seat_ids[i],
+        if idempotency_key:
+            idempotency_crud.save_response(
+                session,
+                booking_in.user_id,
+                idempotency_key,
+                BookingPublic.model_validate(
+                    booking_db, from_attributes=True
+                ).model_dump(mode="json"),
             )
-            ticket_db = ticket_crud.create(session, ticket_create)
-            logger.info(f"Ticket created successfully: {ticket_db.id}")
 
-        # Commit the transaction
         session.commit()
-        session.refresh(booking_db)
-
-        return booking_db
 
+    except (BookingError, SeatError, TicketError):
+        session.rollback()
+        raise
     except Exception as e:
         session.rollback()
         logger.error(f"Error creating detailed booking: {str(e)}")
         raise BookingError(500, f"Failed to create detailed booking: {str(e)}") from e
 
+    if sold:
+        seat_crud.notify_seats_changed(flight_id)
+
+    logger.info(
+        f"Booking created successfully: {booking_db.id} "
+        f"with {len(passengers)} passengers"
+    )
+    return booking_db
+
 
 def get_by_id(session: Session, booking_id: str) -> Booking:
     """
@@ -123,6 +215,24 @@ def get_by_id(session: Session, booking_id: str) -> Booking:
     return booking_db
 
 
+def get_owned(session: Session, booking_id: str, current_user: User) -> Booking:
+    """
+    Get a booking the user can access with one ownership-scoped query.
+
+    Raises:
+        BookingNotFoundError: If the booking doesn't exist or the user can't
+        access it
+    """
+    logger.debug(f"Getting booking {booking_id} for user {current_user.id}")
+
+    query = select(Booking).where(Booking.id == booking_id, owned_by(current_user))
+    booking_db = session.exec(query).first()
+    if not booking_db:
+        logger.warning(f"Booking {booking_id} not found for user {current_user.id}")
+        raise BookingNotFoundError(booking_id=booking_id)
+    return booking_db
+
+
 def get_by_booking_number(session: Session, booking_number: str) -> Booking | None:
     """
     Get booking by booking number.
@@ -136,6 +246,10 @@ def get_by_booking_number(session: Session, booking_number: str) -> Booking | No
 def get_booking_with_details(session: Session, booking_id: str) -> dict[str, Any]:
     """
     Get booking with nested passengers and tickets.
+
+    Passengers, their tickets and the ticket seat numbers are read with one
+    outer-joined query, so the number of statements doesn't grow with the
+    number of passengers.
     """
     logger.info(f"Getting booking with details for ID: {booking_id}")
 
@@ -145,30 +259,35 @@ def get_booking_with_details(session: Session, booking_id: str) -> dict[str, Any
         # Convert to dict for building the response
         booking_data = booking_db.model_dump()
 
-        # Get all passengers for this booking
-        passengers, _ = passenger_crud.get_passengers_by_booking(session, booking_id)
-
-        booking_data["passengers"] = []
-
-        # For each passenger, get their tickets and add to the result
-        for passenger in passengers:
-            passenger_data = passenger.model_dump()
+        query = (
+            select(Passenger, Ticket, Seat.seat_number)
+            .outerjoin(Ticket, col(Ticket.passenger_id) == col(Passenger.id))
+            .outerjoin(Seat, col(Seat.id) == col(Ticket.seat_id))
+            .where(Passenger.booking_id == booking_id)
+            .order_by(col(Passenger.id), col(Ticket.id))
+        )
 
-            # Get tickets for this passenger
-            tickets, _ = ticket_crud.get_tickets_by_passenger(session, passenger.id)
-            passenger_data["tickets"] = [
-                TicketWithSeat(
-                    **ticket.model_dump(), seat_number=ticket.seat.seat_number
+        # Group the joined rows by passenger, keeping the query order
+        passengers: dict[str, dict[str, Any]] = {}
+        for passenger, ticket, seat_number in session.exec(query).all():
+            passenger_data = passengers.get(passenger.id)
+            if passenger_data is None:
+                passenger_data = passenger.model_dump()
+                passenger_data["tickets"] = []
+                passengers[passenger.id] = passenger_data
+
+            if ticket is not None:
+                passenger_data["tickets"].append(
+                    TicketWithSeat(**ticket.model_dump(), seat_number=seat_number)
                 )
-                for ticket in tickets
-            ]
 
-            # Add passenger with tickets to the booking
-            booking_data["passengers"].append(passenger_data)
+        booking_data["passengers"] = list(passengers.values())
 
         logger.info(f"Successfully retrieved booking with details for ID: {booking_id}")
         return booking_data
 
+    except BookingError:
+        raise
     except Exception as e:
         logger.error(f"Error retrieving booking with details: {str(e)}")
         raise BookingError(500, f"Failed to retrieve booking details: {str(e)}") from e
@@ -181,12 +300,14 @@ def get_bookings_by_user(
     limit: int = 100,
     status: Optional[BookingStatus] = None,
     view_filter: ViewFilter = ViewFilter.ACTIVE,
-) -> tuple[list[Booking], int]:
+    count_strategy: CountStrategy = CountStrategy.EXACT,
+    cursor: Optional[str] = None,
+) -> Page[Booking]:
     """
     Get all bookings for a specific user.
 
     Returns:
-        Tuple of (list of bookings, count)
+        Page of bookings with the total count, if requested
     """
     logger.info(f"Getting bookings for user ID: {user_id}")
 
@@ -200,18 +321,22 @@ def get_bookings_by_user(
     elif view_filter == ViewFilter.DELETED:
         query = query.where(Booking.deleted == True)
 
-    # Get total count
-    count_stmt = select(func.count()).select_from(query.subquery())
-    count = session.exec(count_stmt).one()
-
-    # Apply pagination
-    query = query.offset(skip).limit(limit)
-    bookings = list(session.exec(query).all())
+    page = paginate(
+        session,
+        query,
+        skip,
+        limit,
+        count_strategy,
+        order_by=(col(Booking.booking_date), col(Booking.id)),
+        cursor=cursor,
+        descending=True,
+    )
 
     logger.info(
-        f"Found {count} bookings for user {user_id}, returning {len(bookings)} results"
+        f"Found {page.total} bookings for user {user_id}, "
+        f"returning {len(page.data)} results"
     )
-    return bookings, count
+    return page
 
 
 def get_all_bookings(
@@ -220,12 +345,14 @@ def get_all_bookings(
     limit: int = 100,
     status: Optional[BookingStatus] = None,
     view_filter: ViewFilter = ViewFilter.ACTIVE,
-) -> tuple[list[Booking], int]:
+    count_strategy: CountStrategy = CountStrategy.EXACT,
+    cursor: Optional[str] = None,
+) -> Page[Booking]:
     """
     Get all bookings with optional status filter.
 
     Returns:
-        Tuple of (list of bookings, count)
+        Page of bookings with the total count, if requested
     """
     logger.info("Getting all bookings")
 
@@ -239,16 +366,19 @@ def get_all_bookings(
     elif view_filter == ViewFilter.DELETED:
         query = query.where(Booking.deleted == True)
 
-    # Get total count
-    count_stmt = select(func.count()).select_from(query.subquery())
-    count = session.exec(count_stmt).one()
-
-    # Apply pagination
-    query = query.offset(skip).limit(limit)
-    bookings = list(session.exec(query).all())
+    page = paginate(
+        session,
+        query,
+        skip,
+        limit,
+        count_strategy,
+        order_by=(col(Booking.booking_date), col(Booking.id)),
+        cursor=cursor,
+        descending=True,
+    )
 
-    logger.info(f"Found {count} bookings, returning {len(bookings)} results")
-    return bookings, count
+    logger.info(f"Found {page.total} bookings, returning {len(page.data)} results")
+    return page
 
 
 def update(
@@ -269,7 +399,6 @@ def update(
 
         session.add(booking_db)
         session.commit()
-        session.refresh(booking_db)
 
         logger.info(f"Successfully updated booking with ID: {booking_db.id}")
         return booking_db
@@ -305,7 +434,6 @@ def update_booking_status(
         booking_db.status = new_status
         session.add(booking_db)
         session.commit()
-        session.refresh(booking_db)
 
         logger.info(
             f"Successfully updated status for booking {booking_db.id} to {new_status}"
@@ -369,7 +497,6 @@ def restore(session: Session, booking_db: Booking) -> Booking:
         booking_db.deleted_at = None
         session.add(booking_db)
         session.commit()
-        session.refresh(booking_db)
 
         logger.info(f"Successfully restored booking with ID: {booking_db.id}")
         return booking_db
@@ -380,17 +507,11 @@ def restore(session: Session, booking_db: Booking) -> Booking:
         raise BookingError(500, f"Failed to restore booking: {str(e)}") from e
 
 
-def verify_user_can_access_booking(booking_db: Booking, current_user: User) -> None:
+def owned_by(current_user: User) -> sa.ColumnElement[bool]:
     """
-    Verify that a user has permission to access a booking.
-
-    Raises:
-        UnauthorizedBookingAccessError: If the user does not own the booking
-        and is not a superuser
+    Filter on the bookings a user can access: their own, or any booking for
+    a superuser.
     """
-    if not current_user.is_superuser and booking_db.user_id != current_user.id:
-        logger.warning(
-            f"Unauthorized access attempt to booking {booking_db.id} "
-            f"by user {current_user.id}"
-        )
-        raise UnauthorizedBookingAccessError()
+    if current_user.is_superuser:
+        return sa.true()
+    return col(Booking.user_id) == current_user.id
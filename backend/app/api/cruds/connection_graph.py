@@ -0,0 +1,242 @@
+import bisect
+import heapq
+import logging
+import threading
+import time
+from collections.abc import Callable
+from datetime import date, datetime, timedelta
+from typing import NamedTuple
+
+import sqlalchemy as sa
+from sqlmodel import Session, col
+
+from app.domain.models import Flight
+from app.utils import naive_utc
+
+logger = logging.getLogger(__name__)
+
+
+class Leg(NamedTuple):
+    """A flight as an edge of the time-expanded route graph."""
+
+    departure_time: datetime
+    flight_id: str
+    departure_code: str
+    arrival_code: str
+    arrival_time: datetime
+    price: float
+    flight_date: date
+
+
+class Itinerary(NamedTuple):
+    """A sequence of connecting legs from origin to destination."""
+
+    legs: tuple[Leg, ...]
+    total_price: float
+    duration: timedelta
+
+
+def _departure_time(leg: Leg) -> datetime:
+    return leg.departure_time
+
+
+class ConnectionGraph:
+    """
+    In-memory time-expanded graph of the flight network.
+
+    Each airport holds its outgoing legs sorted by departure time, so the
+    legs that can follow an arrival within a connection window are found
+    with a binary search. The graph is loaded from the flight table with one
+    query on first use and kept current by flight_crud writes, those of
+    other workers through flight_changes.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._departures: dict[str, list[Leg]] = {}
+        self._legs: dict[str, Leg] = {}
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    def load(self, session: Session) -> None:
+        """
+        (Re)build the graph from the flight table.
+        """
+        start_time = time.perf_counter()
+
+        query = sa.select(
+            col(Flight.departure_time),
+            col(Flight.id),
+            col(Flight.departure_code),
+            col(Flight.arrival_code),
+            col(Flight.arrival_time),
+            col(Flight.price),
+            col(Flight.flight_date),
+        )
+        legs = [
+            Leg(*row)._replace(
+                departure_time=naive_utc(row.departure_time),
+                arrival_time=naive_utc(row.arrival_time),
+            )
+            for row in session.execute(query).all()
+        ]
+
+        departures: dict[str, list[Leg]] = {}
+        for leg in legs:
+            departures.setdefault(leg.departure_code, []).append(leg)
+        for airport_legs in departures.values():
+            airport_legs.sort()
+
+        with self._lock:
+            self._departures = departures
+            self._legs = {leg.flight_id: leg for leg in legs}
+            self._loaded = True
+
+        logger.info(
+            f"Loaded {len(legs)} flights into the connection graph "
+            f"in {(time.perf_counter() - start_time) * 1000:.1f} ms"
+        )
+
+    def ensure_loaded(self, session: Session) -> None:
+        """
+        Load the graph if it hasn't been loaded yet.
+        """
+        with self._lock:
+            if not self._loaded:
+                self.load(session)
+
+    def upsert(self, flight: Flight) -> None:
+        """
+        Add a flight to the graph or replace its leg.
+        """
+        if not self._loaded:
+            return
+
+        leg = Leg(
+            departure_time=naive_utc(flight.departure_time),
+            flight_id=flight.id,
+            departure_code=flight.departure_code,
+            arrival_code=flight.arrival_code,
+            arrival_time=naive_utc(flight.arrival_time),
+            price=flight.price,
+            flight_date=flight.flight_date,
+        )
+        with self._lock:
+            self._discard(flight.id)
+            self._legs[flight.id] = leg
+            bisect.insort(self._departures.setdefault(leg.departure_code, []), leg)
+
+    def remove(self, flight_id: str) -> None:
+        """
+        Remove a flight from the graph.
+        """
+        if not self._loaded:
+            return
+
+        with self._lock:
+            self._discard(flight_id)
+
+    def search(
+        self,
+        departure_code: str,
+        arrival_code: str,
+        departure_date: date,
+        max_legs: int,
+        min_connection: timedelta,
+        max_connection: timedelta,
+        sort_key: Callable[[float, timedelta], float],
+        limit: int,
+    ) -> list[Itinerary]:
+        """
+        Find the best itineraries whose first flight is on the given date.
+
+        Does a depth-first search over connecting legs, keeping the best
+        `limit` itineraries by sort_key in a bounded heap. Since price and
+        duration only grow as legs are added, partial itineraries that
+        already score worse than the current k-th best are pruned.
+        """
+        # Flight dates are local, so look a day either side of the UTC day
+        day_start = datetime.combine(departure_date, datetime.min.time())
+        earliest = day_start - timedelta(days=1)
+        latest = day_start + timedelta(days=2)
+
+        # Max-heap of (-score, sequence, itinerary) holding the best results
+        best: list[tuple[float, int, Itinerary]] = []
+        sequence = 0
+
+        def bound() -> float:
+            return -best[0][0] if len(best) >= limit else float("inf")
+
+        def extend(path: list[Leg], visited: set[str], price: float) -> None:
+            nonlocal sequence
+            last = path[-1]
+            duration = last.arrival_time - path[0].departure_time
+            if sort_key(price, duration) >= bound():
+                return
+
+            if last.arrival_code == arrival_code:
+                sequence += 1
+                itinerary = Itinerary(tuple(path), price, duration)
+                entry = (-sort_key(price, duration), sequence, itinerary)
+                if len(best) >= limit:
+                    heapq.heapreplace(best, entry)
+                else:
+                    heapq.heappush(best, entry)
+                return
+
+            if len(path) >= max_legs:
+                return
+
+            for leg in self._legs_between(
+                last.arrival_code,
+                last.arrival_time + min_connection,
+                last.arrival_time + max_connection,
+            ):
+                if leg.arrival_code in visited:
+                    continue
+                path.append(leg)
+                visited.add(leg.arrival_code)
+                extend(path, visited, price + leg.price)
+                visited.discard(leg.arrival_code)
+                path.pop()
+
+        with self._lock:
+            if limit <= 0:
+                return []
+
+            for leg in self._legs_between(departure_code, earliest, latest):
+                if (
+                    leg.flight_date != departure_date
+                    or leg.arrival_code == departure_code
+                ):
+                    continue
+                extend([leg], {departure_code, leg.arrival_code}, leg.price)
+
+        return [
+            itinerary
+            for _, _, itinerary in sorted(best, key=lambda entry: (-entry[0], entry[1]))
+        ]
+
+    def _legs_between(
+        self, airport_code: str, earliest: datetime, latest: datetime
+    ) -> list[Leg]:
+        legs = self._departures.get(airport_code, [])
+        start = bisect.bisect_left(legs, earliest, key=_departure_time)
+        end = bisect.bisect_right(legs, latest, key=_departure_time)
+        return legs[start:end]
+
+    def _discard(self, flight_id: str) -> None:
+        leg = self._legs.pop(flight_id, None)
+        if leg is None:
+            return
+
+        legs = self._departures.get(leg.departure_code, [])
+        position = bisect.bisect_left(legs, leg)
+        if position < len(legs) and legs[position].flight_id == flight_id:
+            del legs[position]
+
+
+connection_graph = ConnectionGraph()
@@ -0,0 +1,155 @@
+import logging
+from collections.abc import Iterable
+from datetime import date
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import Session, col, delete, func, select
+
+from app.common.exceptions import FlightError
+from app.domain.models import Flight, RouteDayFare
+
+logger = logging.getLogger(__name__)
+
+# Longest date range a single calendar request may span
+MAX_CALENDAR_DAYS = 366
+
+# (departure_code, arrival_code, flight_date)
+RouteDay = tuple[str, str, date]
+
+# First key of the transaction-level advisory locks taken on route days
+_ROUTE_DAY_LOCK_SPACE = 1
+
+# Lock the route days in a fixed order so concurrent refreshes can't deadlock
+_LOCK_ROUTE_DAYS = sa.text(
+    "SELECT pg_advisory_xact_lock(:space, hashtext(route_day)) "
+    "FROM (SELECT unnest(CAST(:route_days AS text[])) AS route_day "
+    "ORDER BY route_day) AS route_days"
+)
+
+
+def refresh_route_days(session: Session, route_days: Iterable[RouteDay]) -> None:
+    """
+    Recompute the fare aggregate of the given route days from the flight table.
+
+    All route days are refreshed with one upsert and one delete, however
+    many there are. Runs in the caller's transaction, which is expected to
+    have flushed its flight changes, so the aggregate commits together with
+    them.
+
+    Each route day is locked until the transaction ends first. Otherwise two
+    transactions changing flights of the same day would each aggregate
+    without the other's uncommitted flight, and the last to commit would
+    overwrite the day with a total missing the other's change.
+    """
+    route_days = list(set(route_days))
+    if not route_days:
+        return
+
+    session.execute(
+        _LOCK_ROUTE_DAYS,
+        {
+            "space": _ROUTE_DAY_LOCK_SPACE,
+            "route_days": [
+                f"{departure}-{arrival}-{day.isoformat()}"
+                for departure, arrival, day in route_days
+            ],
+        },
+    )
+
+    flight_route_day = sa.tuple_(
+        col(Flight.departure_code), col(Flight.arrival_code), col(Flight.flight_date)
+    )
+    aggregate = (
+        sa.select(
+            col(Flight.departure_code),
+            col(Flight.arrival_code),
+            col(Flight.flight_date),
+            func.min(Flight.price),
+            func.count(),
+        )
+        .where(flight_route_day.in_(route_days))
+        .group_by(
+            col(Flight.departure_code),
+            col(Flight.arrival_code),
+            col(Flight.flight_date),
+        )
+    )
+    upsert = insert(RouteDayFare).from_select(
+        [
+            "departure_code",
+            "arrival_code",
+            "flight_date",
+            "min_price",
+            "flight_count",
+        ],
+        aggregate,
+    )
+    upsert = upsert.on_conflict_do_update(
+        index_elements=["departure_code", "arrival_code", "flight_date"],
+        set_={
+            "min_price": upsert.excluded.min_price,
+            "flight_count": upsert.excluded.flight_count,
+        },
+    )
+    session.execute(upsert)
+
+    # Drop the days whose last flight is gone
+    session.execute(
+        delete(RouteDayFare).where(
+            sa.tuple_(
+                col(RouteDayFare.departure_code),
+                col(RouteDayFare.arrival_code),
+                col(RouteDayFare.flight_date),
+            ).in_(route_days),
+            ~sa.exists().where(
+                col(Flight.departure_code) == col(RouteDayFare.departure_code),
+                col(Flight.arrival_code) == col(RouteDayFare.arrival_code),
+                col(Flight.flight_date) == col(RouteDayFare.flight_date),
+            ),
+        )
+    )
+
+    logger.debug(f"Refreshed fare aggregates for {len(route_days)} route days")
+
+
+def get_calendar(
+    session: Session,
+    departure_code: str,
+    arrival_code: str,
+    start_date: date,
+    end_date: date,
+) -> list[RouteDayFare]:
+    """
+    Get the cheapest price and number of flights per day for a route.
+
+    Days without flights are omitted.
+
+    Raises:
+        FlightError: If the date range is empty or longer than MAX_CALENDAR_DAYS
+    """
+    logger.info(
+        f"Getting fare calendar for {departure_code}-{arrival_code} "
+        f"from {start_date} to {end_date}"
+    )
+
+    if end_date < start_date:
+        raise FlightError(400, "End date must not be before start date")
+    if (end_date - start_date).days >= MAX_CALENDAR_DAYS:
+        raise FlightError(
+            400, f"Date range must not span more than {MAX_CALENDAR_DAYS} days"
+        )
+
+    query = (
+        select(RouteDayFare)
+        .where(
+            RouteDayFare.departure_code == departure_code,
+            RouteDayFare.arrival_code == arrival_code,
+            col(RouteDayFare.flight_date).between(start_date, end_date),
+        )
+        .order_by(col(RouteDayFare.flight_date))
+    )
+    days = list(session.exec(query).all())
+
+    logger.info(f"Found fares for {len(days)} days")
+    return days
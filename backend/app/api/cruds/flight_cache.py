@@ -0,0 +1,185 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import NamedTuple, Optional
+
+from app.api.cruds.pagination import Page
+from app.core.config import settings
+from app.domain.models import Flight
+from app.domain.schemas import CountStrategy, FlightSearch, FlightSearchCacheStats
+
+logger = logging.getLogger(__name__)
+
+
+class _CacheEntry(NamedTuple):
+    search: FlightSearch
+    page: Page[Flight]
+    flight_ids: frozenset[str]
+    expires_at: float
+
+
+class FlightSearchCache:
+    """
+    LRU cache of flight search pages with a time-to-live bound.
+
+    Entries are keyed on the normalized search parameters and count strategy.
+    Writers invalidate the entries that contain a changed flight or whose
+    filters it matches, and the TTL bounds staleness for changes made by
+    other processes. Pages are only stored if no invalidation happened while
+    they were being read, so a slow read can't re-cache data a writer dropped.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._keys_by_flight: dict[str, set[str]] = {}
+        self._lock = threading.Lock()
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @property
+    def generation(self) -> int:
+        """
+        Counter bumped by every invalidation, to be read before a search runs.
+        """
+        return self._generation
+
+    @staticmethod
+    def _key(search: FlightSearch, count_strategy: CountStrategy) -> str:
+        return f"{count_strategy.value}|{search.model_dump_json()}"
+
+    def get(
+        self, search: FlightSearch, count_strategy: CountStrategy
+    ) -> Optional[Page[Flight]]:
+        """
+        Get a cached page for the search, if one exists and hasn't expired.
+        """
+        key = self._key(search, count_strategy)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            if entry.expires_at <= time.monotonic():
+                self._remove(key)
+                self.evictions += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.page
+
+    def put(
+        self,
+        search: FlightSearch,
+        count_strategy: CountStrategy,
+        page: Page[Flight],
+        generation: int,
+    ) -> None:
+        """
+        Cache a page for the search, unless the cache was invalidated since
+        the given generation was read.
+
+        The flights are stored as detached copies so cached pages don't
+        depend on the session that loaded them.
+        """
+        if self.max_entries <= 0 or generation != self._generation:
+            return
+
+        flights = [Flight.model_validate(flight.model_dump()) for flight in page.data]
+        cached_page = Page(flights, page.total, page.next_cursor)
+        key = self._key(search, count_strategy)
+        entry = _CacheEntry(
+            search=search,
+            page=cached_page,
+            flight_ids=frozenset(flight.id for flight in flights),
+            expires_at=time.monotonic() + self.ttl_seconds,
+        )
+
+        with self._lock:
+            if generation != self._generation:
+                return
+
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            for flight_id in entry.flight_ids:
+                self._keys_by_flight.setdefault(flight_id, set()).add(key)
+
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate(
+        self,
+        flight_id: str,
+        matches: Optional[Callable[[FlightSearch], bool]] = None,
+    ) -> None:
+        """
+        Drop the entries that contain the flight, and those whose search
+        the flight matches before or after the change.
+        """
+        with self._lock:
+            self._generation += 1
+            keys = set(self._keys_by_flight.get(flight_id, ()))
+            if matches is not None:
+                keys.update(
+                    key for key, entry in self._entries.items() if matches(entry.search)
+                )
+
+            for key in keys:
+                self._remove(key)
+            self.invalidations += len(keys)
+
+        if keys:
+            logger.debug(
+                f"Invalidated {len(keys)} cached searches for flight {flight_id}"
+            )
+
+    def clear(self) -> None:
+        """
+        Drop all cached entries.
+        """
+        with self._lock:
+            self._generation += 1
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+            self._keys_by_flight.clear()
+
+    def stats(self) -> FlightSearchCacheStats:
+        """
+        Get the cache size and hit/miss/eviction counters.
+        """
+        with self._lock:
+            return FlightSearchCacheStats(
+                size=len(self._entries),
+                max_entries=self.max_entries,
+                ttl_seconds=self.ttl_seconds,
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                invalidations=self.invalidations,
+            )
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        for flight_id in entry.flight_ids:
+            keys = self._keys_by_flight.get(flight_id)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_flight[flight_id]
+
+
+flight_search_cache = FlightSearchCache(
+    max_entries=settings.FLIGHT_SEARCH_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.FLIGHT_SEARCH_CACHE_TTL_SECONDS,
+)
@@ -0,0 +1,152 @@
+import asyncio
+import logging
+import uuid
+from collections.abc import Sequence
+from typing import Any, Optional
+
+import psycopg
+import sqlalchemy as sa
+from sqlalchemy import Engine
+from sqlmodel import Session
+
+from app.api.cruds.connection_graph import connection_graph
+from app.api.cruds.flight_cache import flight_search_cache
+from app.api.cruds.flight_index import flight_index
+from app.api.cruds.loader import load_many
+from app.domain.models import Flight
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "flight_changes"
+
+# Flight IDs per notification, keeping payloads under the 8000 byte limit
+_IDS_PER_PAYLOAD = 200
+
+# Seconds between attempts to get a lost listener connection back
+_RECONNECT_SECONDS = 5.0
+
+# Tags the notifications of this process, whose writes are applied locally
+_ORIGIN = uuid.uuid4().hex
+
+_NOTIFY = sa.text(
+    "SELECT pg_notify(:channel, payload) "
+    "FROM unnest(CAST(:payloads AS text[])) AS payload"
+)
+
+
+def notify(session: Session, flight_ids: Sequence[str]) -> None:
+    """
+    Announce changed flights to the other workers within the caller's
+    transaction.
+
+    Notifications are only delivered if the transaction commits, and take no
+    row locks, so concurrent flight writers don't wait for each other.
+    """
+    if not flight_ids:
+        return
+
+    payloads = [
+        f"{_ORIGIN}:{','.join(flight_ids[start : start + _IDS_PER_PAYLOAD])}"
+        for start in range(0, len(flight_ids), _IDS_PER_PAYLOAD)
+    ]
+    session.execute(_NOTIFY, {"channel": CHANNEL, "payloads": payloads})
+
+
+def apply(session: Session, flight_ids: Sequence[str]) -> None:
+    """
+    Bring the search cache, flight index and connection graph up to date
+    with the current rows of the given flights.
+    """
+    flights = load_many(session, Flight, flight_ids)
+    for flight_id in flight_ids:
+        flight = flights.get(flight_id)
+        if flight is None:
+            flight_index.remove(flight_id)
+            connection_graph.remove(flight_id)
+        else:
+            flight_index.upsert(flight)
+            connection_graph.upsert(flight)
+
+    # Only once the index is current, so no search re-caches the old results
+    flight_search_cache.clear()
+
+
+class FlightChangeListener:
+    """
+    Applies the flight writes of other workers to this worker's in-memory
+    search structures.
+
+    Notifications are received on a dedicated connection and applied as
+    per-flight deltas in a worker thread, off the request path. Any that
+    were sent while the connection was lost are unknown, so once it is back
+    the index and graph are rebuilt aside and swapped in.
+    """
+
+    def __init__(self) -> None:
+        self._engine: Optional[Engine] = None
+        self._task: Optional[asyncio.Task[None]] = None
+
+    async def start(self, engine: Engine) -> None:
+        """
+        Start listening, returning once notifications are being received.
+        """
+        self._engine = engine
+        connection = await self._connect()
+        self._task = asyncio.create_task(self._follow(connection))
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _connect(self) -> psycopg.AsyncConnection[Any]:
+        assert self._engine is not None
+        conninfo = self._engine.url.set(drivername="postgresql").render_as_string(
+            hide_password=False
+        )
+        connection = await psycopg.AsyncConnection.connect(conninfo, autocommit=True)
+        await connection.execute(f"LISTEN {CHANNEL}")
+        return connection
+
+    async def _follow(self, connection: psycopg.AsyncConnection[Any]) -> None:
+        reconnected = False
+        while True:
+            try:
+                async with connection:
+                    if reconnected:
+                        await asyncio.to_thread(self._rebuild)
+                    async for notification in connection.notifies():
+                        origin, _, payload = notification.payload.partition(":")
+                        if origin != _ORIGIN:
+                            await asyncio.to_thread(self._apply, payload.split(","))
+            except Exception as e:
+                logger.error(f"Stopped receiving flight changes: {str(e)}")
+
+            connection = await self._reconnect()
+            reconnected = True
+
+    async def _reconnect(self) -> psycopg.AsyncConnection[Any]:
+        while True:
+            await asyncio.sleep(_RECONNECT_SECONDS)
+            try:
+                connection = await self._connect()
+            except psycopg.Error as e:
+                logger.error(f"Failed to listen for flight changes: {str(e)}")
+                continue
+            logger.info("Listening for flight changes again")
+            return connection
+
+    def _apply(self, flight_ids: list[str]) -> None:
+        with Session(self._engine) as session:
+            apply(session, flight_ids)
+
+    def _rebuild(self) -> None:
+        with Session(self._engine) as session:
+            if flight_index.loaded:
+                flight_index.load(session)
+            if connection_graph.loaded:
+                connection_graph.load(session)
+        flight_search_cache.clear()
+
+
+flight_change_listener = FlightChangeListener()
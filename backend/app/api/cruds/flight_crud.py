@@ -1,63 +1,229 @@
 import logging
-from datetime import date
+from collections.abc import Sequence
+from datetime import date, time, timedelta
 from typing import Any, Optional
 
+import sqlalchemy as sa
 from pydantic import BaseModel
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import IntegrityError
-from sqlmodel import Session, Time, col, func, select
-
-from app.api.cruds import seat_crud
+from sqlalchemy.orm import aliased
+from sqlmodel import Session, col, func, select
+
+from app.api.cruds import fare_calendar_crud, flight_changes, seat_crud
+from app.api.cruds.connection_graph import connection_graph
+from app.api.cruds.flight_cache import flight_search_cache
+from app.api.cruds.flight_index import flight_index
+from app.api.cruds.loader import load_many
+from app.api.cruds.pagination import Page, decode_cursor, encode_cursor, paginate
+from app.api.cruds.seat_template import (
+    SeatTemplate,
+    default_template,
+    seat_templates,
+)
 from app.common.exceptions import (
+    AircraftConfigurationNotFoundError,
     FlightAlreadyExistsError,
     FlightError,
     FlightNotFoundError,
 )
-from app.domain.models import Flight
-from app.domain.schemas import FlightCreate, FlightSearch, FlightUpdate, SeatCreate
-from app.utils import generate_seat_numbers
+from app.core.config import settings
+from app.domain.models import Flight, Seat
+from app.domain.schemas import (
+    ConnectionSearch,
+    ConnectionSort,
+    CountStrategy,
+    FlightCreate,
+    FlightSearch,
+    FlightUpdate,
+    RoundTripSearch,
+)
+from app.utils import minute_of_day
 
 logger = logging.getLogger(__name__)
 
+_FLIGHT_UNIQUE_CONSTRAINT = "uq_flight_number_date_departure"
+
+# Attributes that search filters on, as snapshotted by _search_values
+_SEARCH_FIELDS = (
+    "flight_date",
+    "departure_code",
+    "arrival_code",
+    "airline_code",
+    "price",
+    "departure_minute",
+    "arrival_minute",
+)
+_SEARCH_COLUMNS = tuple(col(getattr(Flight, field)) for field in _SEARCH_FIELDS)
+
+# Columns an upsert overwrites on an existing flight
+_UPSERT_COLUMNS = (
+    "airline_name",
+    "airline_code",
+    "departure_airport",
+    "departure_code",
+    "departure_minute",
+    "departure_terminal",
+    "departure_gate",
+    "arrival_airport",
+    "arrival_code",
+    "arrival_time",
+    "arrival_minute",
+    "arrival_terminal",
+    "arrival_gate",
+    "price",
+)
+
 
-def create(session: Session, flight_in: FlightCreate) -> Flight:
+def _schedule_minutes(flight_in: dict[str, Any]) -> dict[str, int]:
     """
-    Create a new flight in the database.
+    Derive the stored minute-of-day columns from departure and arrival times.
     """
-    logger.info(
-        f"Creating new flight with number: {flight_in.flight_number} "
-        f"on {flight_in.flight_date}"
+    minutes = {}
+    if flight_in.get("departure_time") is not None:
+        minutes["departure_minute"] = minute_of_day(flight_in["departure_time"])
+    if flight_in.get("arrival_time") is not None:
+        minutes["arrival_minute"] = minute_of_day(flight_in["arrival_time"])
+    return minutes
+
+
+def _minute_window(start: time, end: time) -> tuple[int, int]:
+    """
+    Convert a time-of-day window to an inclusive minute-of-day range.
+    """
+    start_minute = minute_of_day(start)
+    if start.second or start.microsecond:
+        start_minute += 1
+    return start_minute, minute_of_day(end)
+
+
+def _search_values(flight_db: Flight) -> dict[str, Any]:
+    """
+    Snapshot the flight attributes that search filters on.
+    """
+    return {field: getattr(flight_db, field) for field in _SEARCH_FIELDS}
+
+
+def _route_day(values: dict[str, Any]) -> fare_calendar_crud.RouteDay:
+    return values["departure_code"], values["arrival_code"], values["flight_date"]
+
+
+def _matches_search(values: dict[str, Any], search: FlightSearch) -> bool:
+    """
+    Check whether a flight with the given attributes matches the search filters.
+
+    Mirrors the filters applied by search_flights.
+    """
+    if search.flight_date and values["flight_date"] != search.flight_date:
+        return False
+    if search.departure_code and values["departure_code"] != search.departure_code:
+        return False
+    if search.arrival_code and values["arrival_code"] != search.arrival_code:
+        return False
+    if search.airline_code and values["airline_code"] != search.airline_code:
+        return False
+    if search.start_price is not None and search.end_price is not None:
+        if not search.start_price <= values["price"] <= search.end_price:
+            return False
+
+    departure_start, departure_end = _minute_window(
+        search.departure_start_time, search.departure_end_time
+    )
+    arrival_start, arrival_end = _minute_window(
+        search.arrival_start_time, search.arrival_end_time
+    )
+    return bool(
+        departure_start <= values["departure_minute"] <= departure_end
+        and arrival_start <= values["arrival_minute"] <= arrival_end
     )
 
-    # Check if the flight already exists
-    query = select(Flight).where(
-        Flight.flight_number == flight_in.flight_number,
-        Flight.flight_date == flight_in.flight_date,
-        Flight.departure_time == flight_in.departure_time,
+
+def _invalidate_cached_searches(flight_id: str, *snapshots: dict[str, Any]) -> None:
+    """
+    Drop cached searches that contain the flight or match any of its snapshots.
+    """
+    flight_search_cache.invalidate(
+        flight_id,
+        lambda search: any(_matches_search(values, search) for values in snapshots),
     )
-    existing_flight = session.exec(query).first()
 
-    if existing_flight:
-        logger.warning(
-            f"Flight with number {flight_in.flight_number} on {flight_in.flight_date} "
-            f"at {flight_in.departure_time} already exists"
-        )
-        raise FlightAlreadyExistsError(
-            flight_number=flight_in.flight_number,
-            flight_date=str(flight_in.flight_date),
-        )
+
+def _is_duplicate_flight(error: IntegrityError) -> bool:
+    """
+    Check whether an integrity error comes from the flight unique constraint.
+    """
+    diag = getattr(error.orig, "diag", None)
+    return getattr(diag, "constraint_name", None) == _FLIGHT_UNIQUE_CONSTRAINT
+
+
+def _seat_template(session: Session, flight_in: FlightCreate) -> SeatTemplate:
+    """
+    Get the seat template of a new flight: its aircraft configuration's, or
+    the default layout filled up to available_seats.
+
+    Raises:
+        AircraftConfigurationNotFoundError: If the configuration doesn't exist
+    """
+    if flight_in.aircraft_configuration_id:
+        return seat_templates.get(session, flight_in.aircraft_configuration_id)
+    return default_template(flight_in.available_seats)
+
+
+def create(
+    session: Session, flight_in: FlightCreate, seat_numbers: Sequence[str] = ()
+) -> Flight:
+    """
+    Create a new flight in the database, with the given seats if any.
+
+    The flight and its whole seat map are inserted in one transaction.
+    Duplicates are rejected by the (flight_number, flight_date,
+    departure_time) unique constraint rather than checked up front.
+
+    Raises:
+        FlightAlreadyExistsError: If the flight already exists
+    """
+    logger.info(
+        f"Creating new flight with number: {flight_in.flight_number} "
+        f"on {flight_in.flight_date}"
+    )
 
     try:
-        flight_db = Flight.model_validate(flight_in)
+        flight_db = Flight.model_validate(
+            flight_in,
+            update={
+                **_schedule_minutes(flight_in.model_dump()),
+                "seats_remaining": len(seat_numbers),
+            },
+        )
 
         session.add(flight_db)
+        session.flush()
+        if seat_numbers:
+            seat_crud.create_seat_map(session, flight_db.id, seat_numbers)
+        fare_calendar_crud.refresh_route_days(
+            session, [_route_day(_search_values(flight_db))]
+        )
+        flight_changes.notify(session, [flight_db.id])
         session.commit()
-        session.refresh(flight_db)
+
+        _invalidate_cached_searches(flight_db.id, _search_values(flight_db))
+        flight_index.upsert(flight_db)
+        connection_graph.upsert(flight_db)
 
         logger.info(f"Successfully created flight with ID: {flight_db.id}")
         return flight_db
 
     except IntegrityError as e:
         session.rollback()
+        if _is_duplicate_flight(e):
+            logger.warning(
+                f"Flight with number {flight_in.flight_number} on "
+                f"{flight_in.flight_date} at {flight_in.departure_time} already exists"
+            )
+            raise FlightAlreadyExistsError(
+                flight_number=flight_in.flight_number,
+                flight_date=str(flight_in.flight_date),
+            ) from e
         logger.error(f"Database integrity error during flight creation: {str(e)}")
         raise FlightError(500, f"Failed to create flight: {str(e)}") from e
 
@@ -65,27 +231,29 @@ def create(session: Session, flight_in: FlightCreate) -> Flight:
 def create_with_seats(session: Session, flight_in: FlightCreate) -> Flight:
     """
     Create a new flight and associated seats.
+
+    The seats come from the flight's aircraft configuration, whose seat count
+    becomes the flight's capacity, or else from the default layout filled up
+    to available_seats.
     """
     logger.info(f"Creating flight with number: {flight_in.flight_number}")
 
-    try:
-        # Create the flight
-        flight_db = create(session, flight_in)
-        logger.info(f"Flight created successfully: {flight_db.id}")
-
-        # Create seats
-        for seat_number in generate_seat_numbers(flight_in.available_seats):
-            seat_create = SeatCreate(flight_id=flight_db.id, seat_number=seat_number)
-            seat_db = seat_crud.create(session, seat_create)
-
-            logger.info(f"Seat created successfully: {seat_db.id}")
+    template = _seat_template(session, flight_in)
+    flight_in = flight_in.model_copy(
+        update={"available_seats": len(template.seat_numbers)}
+    )
 
-        # Commit the transaction
-        session.commit()
-        session.refresh(flight_db)
+    try:
+        flight_db = create(session, flight_in, template.seat_numbers)
+        logger.info(
+            f"Flight created successfully: {flight_db.id} "
+            f"with {len(template.seat_numbers)} seats"
+        )
 
         return flight_db
 
+    except FlightError:
+        raise
     except Exception as e:
         session.rollback()
         logger.error(
@@ -94,6 +262,224 @@ def create_with_seats(session: Session, flight_in: FlightCreate) -> Flight:
         raise FlightError(500, f"Failed to create flight: {str(e)}") from e
 
 
+def bulk_create(
+    session: Session, flights_in: Sequence[FlightCreate]
+) -> list[Optional[str]]:
+    """
+    Insert a chunk of new flights and their seat maps in one transaction.
+
+    The flights are written with a batched INSERT ... ON CONFLICT DO NOTHING
+    and their seats with one INSERT ... SELECT per seat layout, so a chunk
+    costs a handful of statements however large it is. Flights that already
+    exist, or whose aircraft configuration doesn't, are skipped and reported
+    rather than failing the chunk.
+
+    Returns:
+        Per input flight, None if it was inserted, else why it wasn't
+
+    Raises:
+        FlightError: If the chunk couldn't be written; none of it is kept
+    """
+    logger.info(f"Bulk creating {len(flights_in)} flights")
+
+    errors: list[Optional[str]] = [None] * len(flights_in)
+    pending: dict[str, tuple[int, Flight, SeatTemplate]] = {}
+    for position, flight_in in enumerate(flights_in):
+        try:
+            template = _seat_template(session, flight_in)
+        except AircraftConfigurationNotFoundError as e:
+            errors[position] = e.detail
+            continue
+
+        flight_db = Flight.model_validate(
+            flight_in,
+            update={
+                **_schedule_minutes(flight_in.model_dump()),
+                "available_seats": len(template.seat_numbers),
+                "seats_remaining": len(template.seat_numbers),
+            },
+        )
+        pending[flight_db.id] = (position, flight_db, template)
+
+    if not pending:
+        return errors
+
+    try:
+        inserted_ids = set(
+            session.scalars(
+                insert(Flight)
+                .on_conflict_do_nothing(constraint=_FLIGHT_UNIQUE_CONSTRAINT)
+                .returning(col(Flight.id)),
+                [flight_db.model_dump() for _, flight_db, _ in pending.values()],
+            ).all()
+        )
+        seat_crud.create_seat_maps(
+            session,
+            {
+                flight_id: template.seat_numbers
+                for flight_id, (_, _, template) in pending.items()
+                if flight_id in inserted_ids
+            },
+        )
+        fare_calendar_crud.refresh_route_days(
+            session,
+            [
+                _route_day(_search_values(flight_db))
+                for flight_id, (_, flight_db, _) in pending.items()
+                if flight_id in inserted_ids
+            ],
+        )
+        flight_changes.notify(session, list(inserted_ids))
+        session.commit()
+
+    except Exception as e:
+        session.rollback()
+        logger.error(f"Error bulk creating flights: {str(e)}")
+        raise FlightError(500, f"Failed to create flights: {str(e)}") from e
+
+    # Searches may match any of the new flights, so start the cache over
+    flight_search_cache.clear()
+    for flight_id, (position, flight_db, _) in pending.items():
+        if flight_id in inserted_ids:
+            flight_index.upsert(flight_db)
+            connection_graph.upsert(flight_db)
+        else:
+            errors[position] = FlightAlreadyExistsError(
+                flight_number=flight_db.flight_number,
+                flight_date=str(flight_db.flight_date),
+            ).detail
+
+    logger.info(f"Bulk created {len(inserted_ids)} of {len(flights_in)} flights")
+    return errors
+
+
+def upsert(
+    session: Session, flights_in: Sequence[FlightCreate]
+) -> list[tuple[Flight, bool]]:
+    """
+    Insert new flights and update existing ones in a single transaction.
+
+    Flights are matched on (flight_number, flight_date, departure_time) by
+    one INSERT ... ON CONFLICT DO UPDATE, so applying the same schedule
+    twice is a no-op and concurrent imports can't create duplicates. The
+    previous values of updated flights are read by the same statement,
+    for refreshing fare aggregates and caches they no longer match.
+
+    New flights get their seat map like create_with_seats. An update only
+    changes the schedule, airline and price; the capacity, aircraft
+    configuration and seats of an existing flight are left alone.
+
+    Returns:
+        List of (flight, whether it was inserted), in input order with
+        duplicate keys collapsed to their last occurrence
+    """
+    logger.info(f"Upserting {len(flights_in)} flights")
+
+    # A statement can't update the same row twice, so the last entry wins
+    latest = {
+        (flight_in.flight_number, flight_in.flight_date, flight_in.departure_time): (
+            flight_in
+        )
+        for flight_in in flights_in
+    }
+    if not latest:
+        return []
+
+    templates = {}
+    rows = []
+    for flight_in in latest.values():
+        template = _seat_template(session, flight_in)
+        flight_db = Flight.model_validate(
+            flight_in,
+            update={
+                **_schedule_minutes(flight_in.model_dump()),
+                "available_seats": len(template.seat_numbers),
+                "seats_remaining": len(template.seat_numbers),
+            },
+        )
+        templates[flight_db.id] = template
+        rows.append(flight_db.model_dump())
+
+    key = sa.tuple_(
+        col(Flight.flight_number), col(Flight.flight_date), col(Flight.departure_time)
+    )
+    previous = (
+        sa.select(col(Flight.id), *_SEARCH_COLUMNS)
+        .where(key.in_(list(latest)))
+        .cte("previous")
+    )
+
+    insert_stmt = insert(Flight).values(rows)
+    upserted = (
+        insert_stmt.on_conflict_do_update(
+            constraint=_FLIGHT_UNIQUE_CONSTRAINT,
+            set_={column: insert_stmt.excluded[column] for column in _UPSERT_COLUMNS},
+        )
+        .returning(
+            *Flight.__table__.columns,  # type: ignore[attr-defined]
+            (sa.literal_column("xmax") == 0).label("inserted"),
+        )
+        .cte("upserted")
+    )
+    flight_alias = aliased(Flight, upserted)
+    query = (
+        sa.select(
+            flight_alias,
+            upserted.c.inserted,
+            *(previous.c[field] for field in _SEARCH_FIELDS),
+        )
+        .outerjoin(previous, previous.c.id == upserted.c.id)
+        .execution_options(populate_existing=True)
+    )
+
+    try:
+        results = session.execute(query).all()
+
+        snapshots: dict[str, list[dict[str, Any]]] = {}
+        route_days: list[fare_calendar_crud.RouteDay] = []
+        for flight_db, inserted, *previous_values in results:
+            snapshots[flight_db.id] = [_search_values(flight_db)]
+            if inserted:
+                seat_crud.create_seat_map(
+                    session, flight_db.id, templates[flight_db.id].seat_numbers
+                )
+            elif previous_values[0] is not None:
+                snapshots[flight_db.id].append(
+                    dict(zip(_SEARCH_FIELDS, previous_values, strict=True))
+                )
+            route_days.extend(_route_day(values) for values in snapshots[flight_db.id])
+
+        fare_calendar_crud.refresh_route_days(session, route_days)
+        flight_changes.notify(session, [flight_db.id for flight_db, *_ in results])
+        session.commit()
+
+    except IntegrityError as e:
+        session.rollback()
+        logger.error(f"Database integrity error during flight upsert: {str(e)}")
+        raise FlightError(500, f"Failed to upsert flights: {str(e)}") from e
+
+    by_key = {
+        (flight_db.flight_number, flight_db.flight_date, flight_db.departure_time): (
+            flight_db,
+            inserted,
+        )
+        for flight_db, inserted, *_ in results
+    }
+    upserted_flights = [by_key[flight_key] for flight_key in latest]
+
+    for flight_db, _ in upserted_flights:
+        _invalidate_cached_searches(flight_db.id, *snapshots[flight_db.id])
+        flight_index.upsert(flight_db)
+        connection_graph.upsert(flight_db)
+
+    inserted_count = sum(inserted for _, inserted in upserted_flights)
+    logger.info(
+        f"Upserted flights: {inserted_count} inserted, "
+        f"{len(upserted_flights) - inserted_count} updated"
+    )
+    return upserted_flights
+
+
 def get_by_id(session: Session, flight_id: str) -> Flight:
     """
     Get flight by ID.
@@ -123,15 +509,37 @@ def get_by_flight_number(
     return session.exec(query).first()
 
 
-def search_flights(session: Session, search: FlightSearch) -> tuple[list[Flight], int]:
+def search_flights(
+    session: Session,
+    search: FlightSearch,
+    count_strategy: CountStrategy = CountStrategy.EXACT,
+) -> Page[Flight]:
     """
     Search for flights with various filters.
 
     Returns:
-        Tuple of (list of flights, count)
+        Page of flights with the total count, if requested
     """
     logger.info("Searching flights with filters")
 
+    cached_page = flight_search_cache.get(search, count_strategy)
+    if cached_page is not None:
+        logger.info(f"Returning {len(cached_page.data)} flights from search cache")
+        return cached_page
+
+    # Read before querying so writes that commit meanwhile prevent caching
+    generation = flight_search_cache.generation
+
+    if settings.FLIGHT_SEARCH_BACKEND == "index" and flight_index.loaded:
+        page = _search_index(session, search, count_strategy)
+        flight_search_cache.put(search, count_strategy, page, generation)
+
+        logger.info(
+            f"Found {page.total} flights in search index, "
+            f"returning {len(page.data)} results"
+        )
+        return page
+
     query = select(Flight)
 
     # Apply filters
@@ -152,30 +560,269 @@ def search_flights(session: Session, search: FlightSearch) -> tuple[list[Flight]
             col(Flight.price).between(search.start_price, search.end_price)
         )
 
+    # Filter on the stored minute-of-day columns so the time windows
+    # can be served by index range scans
     query = query.where(
-        func.cast(col(Flight.departure_time), Time()).between(
-            search.departure_start_time, search.departure_end_time
+        col(Flight.departure_minute).between(
+            *_minute_window(search.departure_start_time, search.departure_end_time)
         )
     )
     query = query.where(
-        func.cast(col(Flight.arrival_time), Time()).between(
-            search.arrival_start_time, search.arrival_end_time
+        col(Flight.arrival_minute).between(
+            *_minute_window(search.arrival_start_time, search.arrival_end_time)
+        )
+    )
+
+    page = paginate(
+        session,
+        query,
+        search.skip,
+        search.limit,
+        count_strategy,
+        order_by=(col(Flight.departure_time), col(Flight.id)),
+        cursor=search.cursor,
+    )
+
+    flight_search_cache.put(search, count_strategy, page, generation)
+
+    logger.info(f"Found {page.total} flights, returning {len(page.data)} results")
+    return page
+
+
+def _search_index(
+    session: Session, search: FlightSearch, count_strategy: CountStrategy
+) -> Page[Flight]:
+    """
+    Search flights with the in-memory index and hydrate the matching page.
+
+    Uses the same ordering and cursor format as the SQL path, and always
+    knows the exact total, so the count strategy only decides whether to
+    return it.
+    """
+    order_by = (col(Flight.departure_time), col(Flight.id))
+    after = None
+    if search.cursor:
+        departure_time, flight_id = decode_cursor(search.cursor, order_by)
+        after = (departure_time, flight_id)
+
+    flight_ids, total = flight_index.search(
+        search,
+        _minute_window(search.departure_start_time, search.departure_end_time),
+        _minute_window(search.arrival_start_time, search.arrival_end_time),
+        after,
+    )
+
+    flights_by_id = load_many(session, Flight, flight_ids)
+    flights = [
+        flights_by_id[flight_id]
+        for flight_id in flight_ids
+        if flight_id in flights_by_id
+    ]
+
+    next_cursor = None
+    if search.limit and len(flight_ids) == search.limit:
+        last = flights_by_id.get(flight_ids[-1])
+        if last is not None:
+            next_cursor = encode_cursor([last.departure_time, last.id])
+
+    return Page(
+        flights, None if count_strategy == CountStrategy.NONE else total, next_cursor
+    )
+
+
+def search_connections(
+    session: Session, search: ConnectionSearch
+) -> list[dict[str, Any]]:
+    """
+    Search for itineraries of up to max_legs connecting flights.
+
+    Itineraries are found on the in-memory connection graph and ranked by
+    total price or duration; the flights of all returned itineraries are
+    then loaded with a single query.
+
+    Returns:
+        List of itineraries, best first
+    """
+    logger.info(
+        f"Searching connections from {search.departure_code} "
+        f"to {search.arrival_code} on {search.departure_date}"
+    )
+
+    if search.departure_code == search.arrival_code:
+        raise FlightError(400, "Departure and arrival airports must differ")
+    if search.min_connection_minutes > search.max_connection_minutes:
+        raise FlightError(
+            400, "Minimum connection time must not exceed maximum connection time"
+        )
+
+    connection_graph.ensure_loaded(session)
+
+    if search.sort_by == ConnectionSort.DURATION:
+
+        def sort_key(price: float, duration: timedelta) -> float:
+            return duration.total_seconds()
+
+    else:
+
+        def sort_key(price: float, duration: timedelta) -> float:
+            return price
+
+    itineraries = connection_graph.search(
+        search.departure_code,
+        search.arrival_code,
+        search.departure_date,
+        search.max_legs,
+        timedelta(minutes=search.min_connection_minutes),
+        timedelta(minutes=search.max_connection_minutes),
+        sort_key,
+        search.limit,
+    )
+
+    flights_by_id = load_many(
+        session,
+        Flight,
+        (leg.flight_id for itinerary in itineraries for leg in itinerary.legs),
+    )
+
+    results = []
+    for itinerary in itineraries:
+        legs = [flights_by_id.get(leg.flight_id) for leg in itinerary.legs]
+        if None in legs:
+            # Deleted by another process since the graph was loaded
+            continue
+        results.append(
+            {
+                "legs": legs,
+                "total_price": itinerary.total_price,
+                "duration_minutes": int(itinerary.duration.total_seconds() // 60),
+                "stops": len(itinerary.legs) - 1,
+            }
+        )
+
+    logger.info(f"Found {len(results)} itineraries")
+    return results
+
+
+def search_round_trips(
+    session: Session, search: RoundTripSearch
+) -> tuple[list[dict[str, Any]], int]:
+    """
+    Search for outbound/inbound flight pairs sorted by combined price.
+
+    Both directions and their pairing are resolved in a single statement.
+    Each direction is first cut down to its ROUND_TRIP_MAX_CANDIDATES
+    cheapest flights, which bounds the number of combinations sorted.
+
+    Returns:
+        Tuple of (page of round trips, total number of pairs)
+    """
+    logger.info(
+        f"Searching round trips {search.departure_code}-{search.arrival_code} "
+        f"on {search.outbound_date} returning {search.return_date}"
+    )
+
+    if search.return_date < search.outbound_date:
+        raise FlightError(400, "Return date must not be before outbound date")
+
+    def candidates(departure_code: str, arrival_code: str, flight_date: date) -> Any:
+        query = select(Flight).where(
+            Flight.departure_code == departure_code,
+            Flight.arrival_code == arrival_code,
+            Flight.flight_date == flight_date,
+        )
+        if search.airline_code:
+            query = query.where(Flight.airline_code == search.airline_code)
+        return (
+            query.order_by(col(Flight.price), col(Flight.id))
+            .limit(settings.ROUND_TRIP_MAX_CANDIDATES)
+            .cte()
         )
+
+    outbound = aliased(
+        Flight,
+        candidates(search.departure_code, search.arrival_code, search.outbound_date),
+        name="outbound",
+    )
+    inbound = aliased(
+        Flight,
+        candidates(search.arrival_code, search.departure_code, search.return_date),
+        name="inbound",
+    )
+    total_price = (col(outbound.price) + col(inbound.price)).label("total_price")
+
+    pairs = sa.select(outbound, inbound, total_price).where(
+        col(inbound.departure_time) > col(outbound.arrival_time)
+    )
+    query = (
+        pairs.add_columns(func.count().over())
+        .order_by(total_price, col(outbound.id), col(inbound.id))
+        .offset(search.skip)
+        .limit(search.limit)
     )
+    rows = session.execute(query).all()
+
+    if rows:
+        total = rows[0][3]
+    elif search.skip:
+        # The page is past the end, so there is no row to carry the window count
+        total = session.exec(select(func.count()).select_from(pairs.subquery())).one()
+    else:
+        total = 0
+
+    round_trips = [
+        {"outbound": outbound_db, "inbound": inbound_db, "total_price": price}
+        for outbound_db, inbound_db, price, _ in rows
+    ]
+
+    logger.info(f"Found {total} round trips, returning {len(round_trips)} results")
+    return round_trips, total
+
+
+def reconcile_seats_remaining(session: Session) -> int:
+    """
+    Repair seats_remaining counters that drifted from the seat table.
+
+    Recounts available seats for all flights in one UPDATE, while holding a
+    share lock on the seat table so no seat changes commit in between.
+
+    Returns:
+        Number of flights whose counter was repaired
+    """
+    logger.info("Reconciling flight seats_remaining counters")
 
-    # Apply sorting
-    query = query.order_by(col(Flight.departure_time).asc())
+    try:
+        session.execute(sa.text("LOCK TABLE seat IN SHARE MODE"))
+
+        available = func.count(col(Seat.id)).filter(col(Seat.is_available) == True)
+        counts = (
+            sa.select(col(Flight.id).label("flight_id"), available.label("available"))
+            .outerjoin(Seat, col(Seat.flight_id) == col(Flight.id))
+            .group_by(col(Flight.id))
+            .subquery()
+        )
+        repair = (
+            sa.update(Flight)
+            .where(
+                col(Flight.id) == counts.c.flight_id,
+                col(Flight.seats_remaining) != counts.c.available,
+            )
+            .values(seats_remaining=counts.c.available)
+            .returning(col(Flight.id))
+            .execution_options(synchronize_session="fetch")
+        )
+        repaired_ids = session.execute(repair).scalars().all()
+        session.commit()
 
-    # Get total count
-    count_stmt = select(func.count()).select_from(query.subquery())
-    count = session.exec(count_stmt).one()
+    except Exception as e:
+        session.rollback()
+        logger.error(f"Error reconciling seats_remaining: {str(e)}")
+        raise FlightError(500, f"Failed to reconcile seats: {str(e)}") from e
 
-    # Apply pagination
-    query = query.offset(search.skip).limit(search.limit)
-    flights = list(session.exec(query).all())
+    if repaired_ids:
+        flight_search_cache.clear()
 
-    logger.info(f"Found {count} flights, returning {len(flights)} results")
-    return flights, count
+    logger.info(f"Repaired seats_remaining for {len(repaired_ids)} flights")
+    return len(repaired_ids)
 
 
 def update(
@@ -189,18 +836,37 @@ def update(
     if isinstance(flight_in, BaseModel):
         flight_in = flight_in.model_dump(exclude_unset=True)
 
+    previous_values = _search_values(flight_db)
+
     try:
-        flight_db.sqlmodel_update(flight_in)
+        flight_db.sqlmodel_update(flight_in, update=_schedule_minutes(flight_in))
 
         session.add(flight_db)
+        session.flush()
+        fare_calendar_crud.refresh_route_days(
+            session,
+            [_route_day(previous_values), _route_day(_search_values(flight_db))],
+        )
+        flight_changes.notify(session, [flight_db.id])
         session.commit()
-        session.refresh(flight_db)
+
+        _invalidate_cached_searches(
+            flight_db.id, previous_values, _search_values(flight_db)
+        )
+        flight_index.upsert(flight_db)
+        connection_graph.upsert(flight_db)
 
         logger.info(f"Successfully updated flight with ID: {flight_db.id}")
         return flight_db
 
     except IntegrityError as e:
         session.rollback()
+        if _is_duplicate_flight(e):
+            logger.warning(f"Flight update would duplicate another flight: {str(e)}")
+            raise FlightAlreadyExistsError(
+                flight_number=flight_in.get("flight_number", flight_db.flight_number),
+                flight_date=str(flight_in.get("flight_date", flight_db.flight_date)),
+            ) from e
         logger.error(f"Database integrity error during flight update: {str(e)}")
         raise FlightError(500, f"Failed to update flight: {str(e)}") from e
 
@@ -211,9 +877,18 @@ def delete(session: Session, flight_db: Flight) -> None:
     """
     logger.info(f"Deleting flight with ID: {flight_db.id}")
 
+    previous_values = _search_values(flight_db)
+
     try:
         session.delete(flight_db)
+        session.flush()
+        fare_calendar_crud.refresh_route_days(session, [_route_day(previous_values)])
+        flight_changes.notify(session, [flight_db.id])
         session.commit()
+
+        _invalidate_cached_searches(flight_db.id, previous_values)
+        flight_index.remove(flight_db.id)
+        connection_graph.remove(flight_db.id)
         logger.info(f"Successfully deleted flight with ID: {flight_db.id}")
 
     except Exception as e:
@@ -0,0 +1,256 @@
+import logging
+import threading
+import time
+from datetime import date, datetime
+from typing import Optional
+
+import numpy as np
+import sqlalchemy as sa
+from sqlmodel import Session, col
+
+from app.domain.models import Flight
+from app.domain.schemas import FlightSearch
+from app.utils import naive_utc
+
+logger = logging.getLogger(__name__)
+
+# Initial capacity of the column arrays, grown by doubling on insert
+_MIN_CAPACITY = 1024
+
+
+class FlightIndex:
+    """
+    Read-optimized columnar copy of the searchable flight attributes.
+
+    Each attribute is held in a NumPy array, with airport and airline codes
+    dictionary-encoded to integers, so search filters are evaluated as
+    vectorized boolean masks and only the matching flight IDs are hydrated
+    from the database. Flight writes are applied incrementally, those of
+    other workers through flight_changes; deleted rows are tombstoned and
+    their slots reused.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._size = 0
+        self._rows: dict[str, int] = {}
+        self._free_rows: list[int] = []
+        self._codes: dict[str, int] = {}
+        self._allocate(_MIN_CAPACITY)
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def load(self, session: Session) -> None:
+        """
+        (Re)build the index from the flight table.
+
+        The new index is built aside and swapped in, so searches keep using
+        the old one meanwhile.
+        """
+        start_time = time.perf_counter()
+
+        query = sa.select(
+            col(Flight.id),
+            col(Flight.flight_date),
+            col(Flight.departure_code),
+            col(Flight.arrival_code),
+            col(Flight.airline_code),
+            col(Flight.departure_time),
+            col(Flight.departure_minute),
+            col(Flight.arrival_minute),
+            col(Flight.price),
+        )
+        rows = session.execute(query).all()
+
+        fresh = FlightIndex()
+        fresh._allocate(max(_MIN_CAPACITY, len(rows)))
+        for row in rows:
+            fresh._write(fresh._size, *row)
+            fresh._rows[row[0]] = fresh._size
+            fresh._size += 1
+
+        with self._lock:
+            for name, value in vars(fresh).items():
+                if name != "_lock":
+                    setattr(self, name, value)
+            self._loaded = True
+
+        logger.info(
+            f"Loaded {len(rows)} flights into the search index "
+            f"in {(time.perf_counter() - start_time) * 1000:.1f} ms"
+        )
+
+    def upsert(self, flight: Flight) -> None:
+        """
+        Add a flight to the index or refresh its searchable attributes.
+        """
+        if not self._loaded:
+            return
+
+        with self._lock:
+            row = self._rows.get(flight.id)
+            if row is None:
+                row = self._free_rows.pop() if self._free_rows else self._append()
+                self._rows[flight.id] = row
+
+            self._write(
+                row,
+                flight.id,
+                flight.flight_date,
+                flight.departure_code,
+                flight.arrival_code,
+                flight.airline_code,
+                flight.departure_time,
+                flight.departure_minute,
+                flight.arrival_minute,
+                flight.price,
+            )
+
+    def remove(self, flight_id: str) -> None:
+        """
+        Remove a flight from the index.
+        """
+        if not self._loaded:
+            return
+
+        with self._lock:
+            row = self._rows.pop(flight_id, None)
+            if row is not None:
+                self._alive[row] = False
+                self._ids[row] = ""
+                self._free_rows.append(row)
+
+    def search(
+        self,
+        search: FlightSearch,
+        departure_window: tuple[int, int],
+        arrival_window: tuple[int, int],
+        after: Optional[tuple[datetime, str]] = None,
+    ) -> tuple[list[str], int]:
+        """
+        Find the flights matching the search, ordered by departure time and ID.
+
+        Returns:
+            Tuple of (IDs of the requested page, total number of matches)
+        """
+        with self._lock:
+            size = self._size
+            mask = self._alive[:size].copy()
+
+            if search.flight_date:
+                mask &= self._flight_date[:size] == np.datetime64(
+                    search.flight_date, "D"
+                )
+
+            for column, code in (
+                (self._departure_code, search.departure_code),
+                (self._arrival_code, search.arrival_code),
+                (self._airline_code, search.airline_code),
+            ):
+                if code:
+                    encoded = self._codes.get(code)
+                    if encoded is None:
+                        return [], 0
+                    mask &= column[:size] == encoded
+
+            if search.start_price is not None and search.end_price is not None:
+                price = self._price[:size]
+                mask &= (price >= search.start_price) & (price <= search.end_price)
+
+            departure_minute = self._departure_minute[:size]
+            mask &= (departure_minute >= departure_window[0]) & (
+                departure_minute <= departure_window[1]
+            )
+            arrival_minute = self._arrival_minute[:size]
+            mask &= (arrival_minute >= arrival_window[0]) & (
+                arrival_minute <= arrival_window[1]
+            )
+
+            total = int(np.count_nonzero(mask))
+
+            if after is not None:
+                departure_time = self._departure_time[:size]
+                after_time = np.datetime64(naive_utc(after[0]), "us")
+                mask &= (departure_time > after_time) | (
+                    (departure_time == after_time) & (self._ids[:size] > after[1])
+                )
+                skip = 0
+            else:
+                skip = search.skip
+
+            rows = np.flatnonzero(mask)
+            order = np.lexsort((self._ids[rows], self._departure_time[rows]))
+            page_rows = rows[order[skip : skip + search.limit]]
+            return [str(flight_id) for flight_id in self._ids[page_rows]], total
+
+    def _allocate(self, capacity: int) -> None:
+        self._alive = np.zeros(capacity, dtype=bool)
+        self._ids = np.empty(capacity, dtype=object)
+        self._flight_date = np.zeros(capacity, dtype="datetime64[D]")
+        self._departure_code = np.zeros(capacity, dtype=np.int32)
+        self._arrival_code = np.zeros(capacity, dtype=np.int32)
+        self._airline_code = np.zeros(capacity, dtype=np.int32)
+        self._departure_time = np.zeros(capacity, dtype="datetime64[us]")
+        self._departure_minute = np.zeros(capacity, dtype=np.int16)
+        self._arrival_minute = np.zeros(capacity, dtype=np.int16)
+        self._price = np.zeros(capacity, dtype=np.float64)
+
+    def _append(self) -> int:
+        if self._size == len(self._alive):
+            capacity = len(self._alive) * 2
+            for name in (
+                "_alive",
+                "_ids",
+                "_flight_date",
+                "_departure_code",
+                "_arrival_code",
+                "_airline_code",
+                "_departure_time",
+                "_departure_minute",
+                "_arrival_minute",
+                "_price",
+            ):
+                column = getattr(self, name)
+                grown = np.zeros(capacity, dtype=column.dtype)
+                grown[: len(column)] = column
+                setattr(self, name, grown)
+
+        row = self._size
+        self._size += 1
+        return row
+
+    def _encode(self, code: str) -> int:
+        return self._codes.setdefault(code, len(self._codes))
+
+    def _write(
+        self,
+        row: int,
+        flight_id: str,
+        flight_date: date,
+        departure_code: str,
+        arrival_code: str,
+        airline_code: str,
+        departure_time: datetime,
+        departure_minute: int,
+        arrival_minute: int,
+        price: float,
+    ) -> None:
+        self._alive[row] = True
+        self._ids[row] = flight_id
+        self._flight_date[row] = np.datetime64(flight_date, "D")
+        self._departure_code[row] = self._encode(departure_code)
+        self._arrival_code[row] = self._encode(arrival_code)
+        self._airline_code[row] = self._encode(airline_code)
+        self._departure_time[row] = np.datetime64(naive_utc(departure_time), "us")
+        self._departure_minute[row] = departure_minute
+        self._arrival_minute[row] = arrival_minute
+        self._price[row] = price
+
+
+flight_index = FlightIndex()
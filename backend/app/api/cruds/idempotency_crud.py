@@ -0,0 +1,124 @@
+import hashlib
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Optional
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import Session, col
+
+from app.common.exceptions import IdempotencyKeyReusedError
+from app.core.config import settings
+from app.domain.models import IdempotencyKey
+
+logger = logging.getLogger(__name__)
+
+
+def fingerprint(*parts: str) -> str:
+    """
+    Hash the parts identifying a request.
+    """
+    return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+
+def begin(
+    session: Session, user_id: str, key: str, request_fingerprint: str
+) -> Optional[dict[str, Any]]:
+    """
+    Register a request under an idempotency key within the caller's
+    transaction.
+
+    The key is inserted with ON CONFLICT DO UPDATE, which only overwrites a
+    row that has expired but not been swept yet, so an expired key counts as
+    unused. While the transaction that registered the key is open, a
+    concurrent request with the same key blocks on the insert, and it sees
+    the committed row once that transaction ends. If the first request
+    rolled back, the retry registers the key itself.
+
+    Returns:
+        The stored response if the key was already used, None if the caller
+        should process the request and save its response
+
+    Raises:
+        IdempotencyKeyReusedError: If the key was used for a different request
+    """
+    now = datetime.now()
+    register = insert(IdempotencyKey).values(
+        user_id=user_id,
+        key=key,
+        fingerprint=request_fingerprint,
+        expires_at=now + timedelta(seconds=settings.IDEMPOTENCY_KEY_TTL_SECONDS),
+    )
+    inserted = session.execute(
+        register.on_conflict_do_update(
+            index_elements=["user_id", "key"],
+            set_={
+                "fingerprint": register.excluded.fingerprint,
+                "response": None,
+                "expires_at": register.excluded.expires_at,
+            },
+            where=col(IdempotencyKey.expires_at) <= now,
+        ).returning(col(IdempotencyKey.key))
+    ).first()
+    if inserted:
+        return None
+
+    existing = session.get(IdempotencyKey, (user_id, key))
+    if existing is None or existing.response is None:
+        # Can't happen with the insert above, but don't replay nothing
+        raise IdempotencyKeyReusedError()
+    if existing.fingerprint != request_fingerprint:
+        logger.warning(f"Idempotency key {key} reused for a different request")
+        raise IdempotencyKeyReusedError()
+
+    logger.info(f"Replaying response for idempotency key {key}")
+    return existing.response
+
+
+def save_response(
+    session: Session, user_id: str, key: str, response: dict[str, Any]
+) -> None:
+    """
+    Store the response of a request registered with begin(), within the
+    transaction that registered it.
+    """
+    session.execute(
+        sa.update(IdempotencyKey)
+        .where(col(IdempotencyKey.user_id) == user_id, col(IdempotencyKey.key) == key)
+        .values(response=response)
+    )
+
+
+def delete_expired(session: Session, batch_size: int) -> int:
+    """
+    Delete expired idempotency keys, one committed batch at a time.
+
+    Returns:
+        Number of keys deleted
+    """
+    total = 0
+    while True:
+        expired = (
+            sa.select(col(IdempotencyKey.user_id), col(IdempotencyKey.key))
+            .where(col(IdempotencyKey.expires_at) <= datetime.now())
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        deleted = session.scalars(
+            sa.delete(IdempotencyKey)
+            .where(
+                sa.tuple_(col(IdempotencyKey.user_id), col(IdempotencyKey.key)).in_(
+                    expired
+                )
+            )
+            .returning(col(IdempotencyKey.key))
+        ).all()
+        session.commit()
+
+        total += len(deleted)
+        if len(deleted) < batch_size:
+            break
+
+    if total:
+        logger.info(f"Deleted {total} expired idempotency keys")
+    return total
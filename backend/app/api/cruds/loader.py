@@ -0,0 +1,42 @@
+import logging
+from collections.abc import Iterable
+from typing import Any, cast
+
+import sqlalchemy as sa
+from sqlalchemy.orm import class_mapper
+from sqlmodel import Session, SQLModel
+
+logger = logging.getLogger(__name__)
+
+
+def load_many[ModelT: SQLModel](
+    session: Session, model: type[ModelT], keys: Iterable[Any]
+) -> dict[Any, ModelT]:
+    """
+    Get rows by primary key with at most one WHERE id IN (...) query.
+
+    Rows already in the session's identity map are not queried again.
+
+    Returns:
+        Found rows by key; missing keys are left out
+    """
+    rows: dict[Any, ModelT] = {}
+    missing = []
+    for key in set(keys):
+        row = session.identity_map.get(session.identity_key(model, key))
+        if row is not None:
+            rows[key] = cast(ModelT, row)
+        else:
+            missing.append(key)
+
+    if not missing:
+        return rows
+
+    mapper = class_mapper(model)
+    primary_key = mapper.primary_key[0]
+    found = session.scalars(sa.select(model).where(primary_key.in_(missing))).all()
+    for row in found:
+        rows[mapper.primary_key_from_instance(row)[0]] = row
+
+    logger.debug(f"Loaded {len(found)} of {len(missing)} {model.__name__} rows")
+    return rows
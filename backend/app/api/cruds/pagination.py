@@ -0,0 +1,238 @@
+import base64
+import binascii
+import json
+import logging
+import threading
+import time
+from collections.abc import Sequence
+from datetime import date, datetime
+from typing import Any, NamedTuple, Optional
+
+from sqlalchemy import Date, DateTime, Float, Integer, String, TypeDecorator
+from sqlmodel import Session, func, select, tuple_
+from sqlmodel.sql.expression import SelectOfScalar
+
+from app.common.exceptions import InvalidCursorError
+from app.core.config import settings
+from app.domain.schemas import CountStrategy
+
+logger = logging.getLogger(__name__)
+
+# Compiled query -> (expiry timestamp, count), shared by request threads
+_count_cache: dict[str, tuple[float, int]] = {}
+_count_cache_lock = threading.Lock()
+
+
+class Page[T](NamedTuple):
+    """A page of results with the total count, if one was requested."""
+
+    data: list[T]
+    total: Optional[int]
+    next_cursor: Optional[str] = None
+
+
+def paginate[T](
+    session: Session,
+    query: SelectOfScalar[T],
+    skip: int = 0,
+    limit: int = 100,
+    count_strategy: CountStrategy = CountStrategy.EXACT,
+    *,
+    order_by: Sequence[Any],
+    cursor: Optional[str] = None,
+    descending: bool = False,
+) -> Page[T]:
+    """
+    Fetch a page of results and count the matching rows using the given strategy.
+
+    Results are ordered by the order_by keys, which must end with a unique
+    column. When a cursor from a previous page is given, the page starts
+    right after the row it encodes and skip is ignored, so deep pages cost
+    an index seek instead of O(skip).
+
+    Exact counts are computed with a count(*) OVER () window in the same
+    statement as the page, so no strategy needs a second scan of the result set.
+    Cursor pages never count: with the exact and cached strategies they
+    return the total stored by the first page while it is cached, so it may
+    be up to COUNT_CACHE_TTL_SECONDS old, and no total once it has expired.
+    """
+    base_query = query
+    if cursor:
+        values = decode_cursor(cursor, order_by)
+        if descending:
+            query = query.where(tuple_(*order_by) < tuple_(*values))
+        else:
+            query = query.where(tuple_(*order_by) > tuple_(*values))
+        skip = 0
+
+    query = query.order_by(
+        *(key.desc() if descending else key.asc() for key in order_by)
+    )
+
+    total: Optional[int] = None
+    if cursor:
+        data = _fetch(session, query, skip, limit)
+        if count_strategy in (CountStrategy.EXACT, CountStrategy.CACHED):
+            total = _get_cached_count(_cache_key(session, base_query))
+        elif count_strategy == CountStrategy.ESTIMATED:
+            total = _estimate_count(session, base_query)
+
+    elif count_strategy == CountStrategy.EXACT:
+        data, total = _fetch_with_count(session, base_query, query, skip, limit)
+        _store_count(_cache_key(session, base_query), total)
+
+    elif count_strategy == CountStrategy.CACHED:
+        key = _cache_key(session, base_query)
+        cached = _get_cached_count(key)
+        if cached is not None:
+            logger.debug(f"Using cached count: {cached}")
+            data, total = _fetch(session, query, skip, limit), cached
+        else:
+            data, total = _fetch_with_count(session, base_query, query, skip, limit)
+            _store_count(key, total)
+
+    else:
+        data = _fetch(session, query, skip, limit)
+        if count_strategy == CountStrategy.ESTIMATED:
+            total = _estimate_count(session, base_query)
+
+    next_cursor = None
+    if limit and len(data) == limit:
+        next_cursor = encode_cursor([getattr(data[-1], key.key) for key in order_by])
+
+    return Page(data, total, next_cursor)
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """
+    Encode the sort key of the last row of a page as an opaque cursor token.
+    """
+    payload = [
+        value.isoformat() if isinstance(value, date | datetime) else value
+        for value in values
+    ]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, order_by: Sequence[Any]) -> list[Any]:
+    """
+    Decode a cursor token back into sort key values for the given keys.
+
+    Raises:
+        InvalidCursorError: If the token is malformed or doesn't match the keys
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        if not isinstance(payload, list) or len(payload) != len(order_by):
+            raise ValueError("cursor does not match the sort keys")
+
+        return [
+            _decode_value(value, key)
+            for value, key in zip(payload, order_by, strict=True)
+        ]
+
+    except (binascii.Error, TypeError, ValueError) as e:
+        logger.warning(f"Invalid pagination cursor: {cursor}")
+        raise InvalidCursorError() from e
+
+
+def _decode_value(value: Any, key: Any) -> Any:
+    """
+    Check a decoded cursor value against the type of its sort key, so a
+    forged cursor can't put arbitrary JSON into the keyset condition.
+    """
+    sql_type = key.type
+    if isinstance(sql_type, TypeDecorator):
+        sql_type = sql_type.impl_instance
+
+    if isinstance(sql_type, DateTime):
+        return datetime.fromisoformat(value)
+    if isinstance(sql_type, Date):
+        return date.fromisoformat(value)
+
+    if isinstance(sql_type, String):
+        valid = isinstance(value, str)
+    elif isinstance(sql_type, Integer):
+        valid = isinstance(value, int) and not isinstance(value, bool)
+    elif isinstance(sql_type, Float):
+        valid = isinstance(value, int | float) and not isinstance(value, bool)
+        value = float(value) if valid else value
+    else:
+        valid = False
+    if not valid:
+        raise ValueError(f"cursor value doesn't match the type of {key.key}")
+    return value
+
+
+def _fetch[T](
+    session: Session, query: SelectOfScalar[T], skip: int, limit: int
+) -> list[T]:
+    return list(session.exec(query.offset(skip).limit(limit)).all())
+
+
+def _fetch_with_count[T](
+    session: Session,
+    base_query: SelectOfScalar[T],
+    query: SelectOfScalar[T],
+    skip: int,
+    limit: int,
+) -> tuple[list[T], int]:
+    windowed = query.add_columns(func.count().over()).offset(skip).limit(limit)
+    rows = session.execute(windowed).all()
+    if rows:
+        return [row[0] for row in rows], rows[0][1]
+
+    if skip == 0 and limit > 0:
+        return [], 0
+
+    # The page is empty or past the end, so no row carries the window count
+    return [], _count(session, base_query)
+
+
+def _count(session: Session, query: SelectOfScalar[Any]) -> int:
+    count_stmt = select(func.count()).select_from(query.subquery())
+    return session.exec(count_stmt).one()
+
+
+def _estimate_count(session: Session, query: SelectOfScalar[Any]) -> int:
+    """
+    Read the planner's row estimate for the query without executing it.
+    """
+    compiled = query.compile(
+        dialect=session.get_bind().dialect,
+        compile_kwargs={"render_postcompile": True},
+    )
+    plan = (
+        session.connection()
+        .exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params)
+        .scalar_one()
+    )
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def _cache_key(session: Session, query: SelectOfScalar[Any]) -> str:
+    compiled = query.compile(dialect=session.get_bind().dialect)
+    return f"{compiled}|{sorted(compiled.params.items())!r}"
+
+
+def _get_cached_count(key: str) -> Optional[int]:
+    with _count_cache_lock:
+        cached = _count_cache.get(key)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+    return None
+
+
+def _store_count(key: str, count: int) -> None:
+    now = time.monotonic()
+    with _count_cache_lock:
+        if len(_count_cache) >= settings.COUNT_CACHE_MAX_ENTRIES:
+            for expired in [
+                k for k, (expiry, _) in _count_cache.items() if expiry <= now
+            ]:
+                del _count_cache[expired]
+        if len(_count_cache) >= settings.COUNT_CACHE_MAX_ENTRIES:
+            del _count_cache[next(iter(_count_cache))]
+        _count_cache[key] = (now + settings.COUNT_CACHE_TTL_SECONDS, count)
@@ -1,17 +1,19 @@
 import logging
-from typing import Any
+from typing import Any, Optional
 
 from pydantic import BaseModel
 from sqlalchemy.exc import IntegrityError
-from sqlmodel import Session, func, select
+from sqlmodel import Session, col, select
 
+from app.api.cruds import booking_crud
+from app.api.cruds.pagination import Page, paginate
 from app.common.exceptions import (
     PassengerError,
     PassengerNotFoundError,
     UnauthorizedPassengerAccessError,
 )
 from app.domain.models import Booking, Passenger, User
-from app.domain.schemas import PassengerCreate, PassengerUpdate
+from app.domain.schemas import CountStrategy, PassengerCreate, PassengerUpdate
 
 logger = logging.getLogger(__name__)
 
@@ -27,7 +29,6 @@ def create(session: Session, passenger_in: PassengerCreate) -> Passenger:
 
         session.add(passenger_db)
         session.commit()
-        session.refresh(passenger_db)
 
         logger.info(f"Successfully created passenger with ID: {passenger_db.id}")
         return passenger_db
@@ -51,62 +52,108 @@ def get_by_id(session: Session, passenger_id: str) -> Passenger:
     return passenger_db
 
 
+def get_owned(
+    session: Session, booking_id: str, passenger_id: str, current_user: User
+) -> Passenger:
+    """
+    Get a passenger of a booking the user can access, joining the booking to
+    check ownership in the same query.
+
+    Raises:
+        PassengerNotFoundError: If the passenger isn't on the booking or the
+        user can't access the booking
+    """
+    logger.debug(f"Getting passenger {passenger_id} of booking {booking_id}")
+
+    query = (
+        select(Passenger)
+        .join(Booking, col(Booking.id) == col(Passenger.booking_id))
+        .where(
+            Passenger.id == passenger_id,
+            Passenger.booking_id == booking_id,
+            booking_crud.owned_by(current_user),
+        )
+    )
+    passenger_db = session.exec(query).first()
+    if not passenger_db:
+        logger.warning(
+            f"Passenger {passenger_id} not found in booking {booking_id} "
+            f"for user {current_user.id}"
+        )
+        raise PassengerNotFoundError(passenger_id=passenger_id)
+    return passenger_db
+
+
 def get_passengers_by_booking(
     session: Session,
     booking_id: str,
     skip: int = 0,
     limit: int = 100,
-) -> tuple[list[Passenger], int]:
+    count_strategy: CountStrategy = CountStrategy.EXACT,
+    cursor: Optional[str] = None,
+    current_user: Optional[User] = None,
+) -> Page[Passenger]:
     """
-    Get all passengers for a specific booking.
+    Get all passengers for a specific booking, optionally only if the user
+    can access the booking.
 
     Returns:
-        Tuple of (list of passengers, count)
+        Page of passengers with the total count, if requested
     """
     logger.info(f"Getting passengers for booking ID: {booking_id}")
 
     query = select(Passenger).where(Passenger.booking_id == booking_id)
+    if current_user is not None:
+        query = query.join(Booking, col(Booking.id) == col(Passenger.booking_id)).where(
+            booking_crud.owned_by(current_user)
+        )
 
-    # Get total count
-    count_stmt = select(func.count()).select_from(query.subquery())
-    count = session.exec(count_stmt).one()
-
-    # Apply pagination
-    query = query.offset(skip).limit(limit)
-    passengers = list(session.exec(query).all())
+    page = paginate(
+        session,
+        query,
+        skip,
+        limit,
+        count_strategy,
+        order_by=(col(Passenger.id),),
+        cursor=cursor,
+    )
 
     logger.info(
-        f"Found {count} passengers for booking {booking_id}, "
-        f"returning {len(passengers)} results"
+        f"Found {page.total} passengers for booking {booking_id}, "
+        f"returning {len(page.data)} results"
     )
-    return passengers, count
+    return page
 
 
 def get_all_passengers(
     session: Session,
     skip: int = 0,
     limit: int = 100,
-) -> tuple[list[Passenger], int]:
+    count_strategy: CountStrategy = CountStrategy.EXACT,
+    cursor: Optional[str] = None,
+) -> Page[Passenger]:
     """
     Get all passengers with optional filters.
 
     Returns:
-        Tuple of (list of passengers, count)
+        Page of passengers with the total count, if requested
     """
     logger.info("Getting all passengers")
 
     query = select(Passenger)
 
-    # Get total count
-    count_stmt = select(func.count()).select_from(query.subquery())
-    count = session.exec(count_stmt).one()
-
-    # Apply pagination
-    query = query.offset(skip).limit(limit)
-    passengers = list(session.exec(query).all())
+    page = paginate(
+        session,
+        query,
+        skip,
+        limit,
+        count_strategy,
+        order_by=(col(Passenger.id),),
+        cursor=cursor,
+    )
 
-    logger.info(f"Found {count} passengers, returning {len(passengers)} results")
-    return passengers, count
+    logger.info(f"Found {page.total} passengers, returning {len(page.data)} results")
+    return page
 
 
 def update(
@@ -127,7 +174,6 @@ def update(
 
         session.add(passenger_db)
         session.commit()
-        session.refresh(passenger_db)
 
         logger.info(f"Successfully updated passenger with ID: {passenger_db.id}")
         return passenger_db
@@ -1,21 +1,38 @@
+import base64
 import logging
+import re
+from collections.abc import Iterable, Mapping, Sequence
 from typing import Any, Optional
 
+import sqlalchemy as sa
+from psycopg import errors as pg_errors
 from pydantic import BaseModel
-from sqlalchemy.exc import IntegrityError
-from sqlmodel import Session, func, select
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.exc import IntegrityError, OperationalError
+from sqlmodel import Session, col, func, select
 
+from app.api.cruds.flight_cache import flight_search_cache
+from app.api.cruds.pagination import Page, paginate
+from app.api.cruds.seat_template import SeatTemplate, grid_template, seat_templates
 from app.common.exceptions import (
     FlightNotFoundError,
     SeatAlreadyExistsError,
     SeatError,
+    SeatNotAvailableError,
     SeatNotFoundError,
 )
 from app.domain.models import Flight, Seat
-from app.domain.schemas import SeatCreate, SeatUpdate
+from app.domain.schemas import CountStrategy, SeatCreate, SeatMapPublic, SeatUpdate
+from app.utils import generate_unique_id
 
 logger = logging.getLogger(__name__)
 
+# Seat numbers laid out on the seat map grid, e.g. "12C" is row 12, column C
+SEAT_NUMBER_PATTERN = re.compile(r"^(\d+)([A-Z])$")
+
+# Times a group seat block is re-planned after losing a race for one of its seats
+_BLOCK_CLAIM_ATTEMPTS = 3
+
 
 def create(session: Session, seat_in: SeatCreate) -> Seat:
     """
@@ -51,8 +68,10 @@ def create(session: Session, seat_in: SeatCreate) -> Seat:
         seat_db = Seat.model_validate(seat_in)
 
         session.add(seat_db)
+        adjust_seats_remaining(session, seat_db.flight_id, int(seat_db.is_available))
         session.commit()
-        session.refresh(seat_db)
+
+        notify_seats_changed(seat_db.flight_id)
 
         logger.info(f"Successfully created seat with ID: {seat_db.id}")
         return seat_db
@@ -63,6 +82,83 @@ def create(session: Session, seat_in: SeatCreate) -> Seat:
         raise SeatError(500, f"Failed to create seat: {str(e)}") from e
 
 
+def create_seat_map(
+    session: Session, flight_id: str, seat_numbers: Sequence[str]
+) -> None:
+    """
+    Insert a flight's seats in bulk within the caller's transaction.
+
+    Seats are written with multi-row INSERTs instead of one round trip per
+    seat. Duplicates are rejected by the (flight_id, seat_number) unique
+    constraint rather than checked up front, and the caller is responsible
+    for setting the flight's seats_remaining.
+    """
+    logger.info(f"Creating {len(seat_numbers)} seats for flight ID: {flight_id}")
+
+    session.execute(
+        sa.insert(Seat),
+        [
+            {
+                "id": generate_unique_id(),
+                "flight_id": flight_id,
+                "seat_number": seat_number,
+                "is_available": True,
+            }
+            for seat_number in seat_numbers
+        ],
+    )
+
+
+def create_seat_maps(session: Session, seat_maps: Mapping[str, Sequence[str]]) -> int:
+    """
+    Insert the seats of many flights within the caller's transaction.
+
+    Meant for bulk imports. Flights sharing a seat layout get their seats
+    from one INSERT ... SELECT over the flight IDs and seat numbers, with the
+    seat IDs generated by the database, so no seat row is built in Python.
+    As with create_seat_map, the caller is responsible for setting the
+    flights' seats_remaining.
+
+    Returns:
+        Number of seats inserted
+    """
+    flights_by_layout: dict[tuple[str, ...], list[str]] = {}
+    for flight_id, seat_numbers in seat_maps.items():
+        if seat_numbers:
+            flights_by_layout.setdefault(tuple(seat_numbers), []).append(flight_id)
+
+    count = 0
+    for seat_numbers, flight_ids in flights_by_layout.items():
+        flights = (
+            sa.func.unnest(sa.literal(flight_ids, ARRAY(sa.String)))
+            .table_valued("flight_id")
+            .render_derived()
+        )
+        seats = (
+            sa.func.unnest(sa.literal(list(seat_numbers), ARRAY(sa.String)))
+            .table_valued("seat_number")
+            .render_derived()
+        )
+        session.execute(
+            sa.insert(Seat).from_select(
+                ["id", "seat_number", "is_available", "flight_id"],
+                sa.select(
+                    sa.cast(sa.func.gen_random_uuid(), sa.String),
+                    seats.c.seat_number,
+                    sa.true(),
+                    flights.c.flight_id,
+                ).select_from(flights.join(seats, sa.true())),
+            )
+        )
+        count += len(seat_numbers) * len(flight_ids)
+
+    logger.info(
+        f"Created {count} seats for {len(seat_maps)} flights "
+        f"in {len(flights_by_layout)} layouts"
+    )
+    return count
+
+
 def get_by_id(session: Session, seat_id: str) -> Seat:
     """
     Get seat by ID.
@@ -97,12 +193,14 @@ def get_seats_by_flight(
     skip: int = 0,
     limit: int = 100,
     available_only: bool = False,
-) -> tuple[list[Seat], int]:
+    count_strategy: CountStrategy = CountStrategy.EXACT,
+    cursor: Optional[str] = None,
+) -> Page[Seat]:
     """
     Get all seats for a specific flight.
 
     Returns:
-        Tuple of (list of seats, count)
+        Page of seats with the total count, if requested
     """
     logger.info(f"Getting seats for flight ID: {flight_id}")
 
@@ -111,18 +209,21 @@ def get_seats_by_flight(
     if available_only:
         query = query.where(Seat.is_available == True)
 
-    # Get total count
-    count_stmt = select(func.count()).select_from(query.subquery())
-    count = session.exec(count_stmt).one()
-
-    # Apply pagination
-    query = query.offset(skip).limit(limit)
-    seats = list(session.exec(query).all())
+    page = paginate(
+        session,
+        query,
+        skip,
+        limit,
+        count_strategy,
+        order_by=(col(Seat.seat_number), col(Seat.id)),
+        cursor=cursor,
+    )
 
     logger.info(
-        f"Found {count} seats for flight {flight_id}, returning {len(seats)} results"
+        f"Found {page.total} seats for flight {flight_id}, "
+        f"returning {len(page.data)} results"
     )
-    return seats, count
+    return page
 
 
 def get_all_seats(
@@ -130,12 +231,14 @@ def get_all_seats(
     skip: int = 0,
     limit: int = 100,
     available_only: bool = False,
-) -> tuple[list[Seat], int]:
+    count_strategy: CountStrategy = CountStrategy.EXACT,
+    cursor: Optional[str] = None,
+) -> Page[Seat]:
     """
     Get all seats with optional filters.
 
     Returns:
-        Tuple of (list of seats, count)
+        Page of seats with the total count, if requested
     """
     logger.info("Getting all seats")
 
@@ -144,16 +247,179 @@ def get_all_seats(
     if available_only:
         query = query.where(Seat.is_available == True)
 
-    # Get total count
-    count_stmt = select(func.count()).select_from(query.subquery())
-    count = session.exec(count_stmt).one()
+    page = paginate(
+        session,
+        query,
+        skip,
+        limit,
+        count_strategy,
+        order_by=(col(Seat.id),),
+        cursor=cursor,
+    )
+
+    logger.info(f"Found {page.total} seats, returning {len(page.data)} results")
+    return page
+
+
+def get_seat_map(session: Session, flight_id: str) -> SeatMapPublic:
+    """
+    Get the compact seat map of a flight.
+
+    The flight's seat map version and all of its seats are read with a
+    single query, and availability is packed into bitsets over the grid of
+    the flight's seat template: its aircraft configuration's, or else one
+    derived from the seat numbers.
+    """
+    logger.info(f"Getting seat map for flight ID: {flight_id}")
+
+    query = (
+        sa.select(
+            col(Flight.seat_map_version),
+            col(Flight.aircraft_configuration_id),
+            col(Seat.seat_number),
+            col(Seat.is_available),
+        )
+        .select_from(Flight)
+        .outerjoin(Seat, col(Seat.flight_id) == col(Flight.id))
+        .where(col(Flight.id) == flight_id)
+    )
+    rows = session.execute(query).all()
+
+    if not rows:
+        logger.warning(f"Flight not found with ID: {flight_id}")
+        raise FlightNotFoundError(flight_id=flight_id)
+
+    version, configuration_id = rows[0][0], rows[0][1]
+    seat_rows = [(row[2], row[3]) for row in rows if row[2] is not None]
+    template = _layout_template(
+        session, configuration_id, (seat_number for seat_number, _ in seat_rows)
+    )
+
+    size = (template.rows * len(template.columns) + 7) // 8
+    seats = bytearray(size)
+    available = bytearray(size)
+    unmapped: dict[str, bool] = {}
+    for seat_number, is_available in seat_rows:
+        grid_position = template.positions.get(seat_number)
+        if grid_position is None:
+            unmapped[seat_number] = is_available
+            continue
+
+        row, column_index = grid_position
+        position = (row - 1) * len(template.columns) + column_index
+        bit = 0x80 >> (position & 7)
+        seats[position >> 3] |= bit
+        if is_available:
+            available[position >> 3] |= bit
+
+    logger.info(
+        f"Built seat map of {len(seat_rows)} seats "
+        f"for flight {flight_id} at version {version}"
+    )
+    return SeatMapPublic(
+        flight_id=flight_id,
+        version=version,
+        rows=template.rows,
+        columns=template.columns,
+        seats=base64.b64encode(seats).decode(),
+        available=base64.b64encode(available).decode(),
+        unmapped=unmapped,
+        layout=template.layout if configuration_id else None,
+        cabins=list(template.cabins),
+    )
+
 
-    # Apply pagination
-    query = query.offset(skip).limit(limit)
-    seats = list(session.exec(query).all())
+def claim_seats(
+    session: Session, flight_id: str, seat_ids: Sequence[str]
+) -> list[Seat]:
+    """
+    Atomically claim a set of seats of a flight within the caller's
+    transaction, all or none.
+
+    The caller is responsible for adjusting the flight's seats_remaining
+    counter.
 
-    logger.info(f"Found {count} seats, returning {len(seats)} results")
-    return seats, count
+    Raises:
+        SeatNotFoundError: If a seat doesn't exist on the flight
+        SeatNotAvailableError: If a seat is already taken
+    """
+    logger.info(f"Claiming {len(seat_ids)} seats for flight ID: {flight_id}")
+
+    claimed = _claim_all(session, flight_id, seat_ids)
+    if claimed or not seat_ids:
+        return claimed
+
+    # Find out which seat is in the way
+    query = sa.select(
+        col(Seat.id), col(Seat.seat_number), col(Seat.is_available)
+    ).where(col(Seat.id).in_(seat_ids), col(Seat.flight_id) == flight_id)
+    found = {row.id: row for row in session.execute(query).all()}
+    for seat_id in seat_ids:
+        if seat_id not in found:
+            logger.warning(f"Seat {seat_id} not found on flight {flight_id}")
+            raise SeatNotFoundError(seat_id=seat_id)
+        if not found[seat_id].is_available:
+            logger.warning(f"Seat {found[seat_id].seat_number} is not available")
+            raise SeatNotAvailableError(seat_number=found[seat_id].seat_number)
+
+    # A concurrent claim came and went between the two statements
+    raise SeatNotAvailableError()
+
+
+def claim_seat_block(session: Session, flight_id: str, count: int) -> list[Seat]:
+    """
+    Atomically claim a block of seats for a group within the caller's
+    transaction.
+
+    The flight's seats are read with one query into per-row runs of available
+    seats that are adjacent on the flight's seat template, so runs don't
+    cross aisles. The best block is picked from those runs: one run in a
+    single row if possible, otherwise runs from as few consecutive rows as
+    possible. The block is claimed with a single all-or-nothing UPDATE, and
+    re-planned if a concurrent booking took one of its seats first. The
+    caller is responsible for adjusting the flight's seats_remaining counter.
+
+    Returns:
+        The claimed seats, or an empty list if the block couldn't be claimed
+    """
+    logger.info(f"Claiming block of {count} seats for flight ID: {flight_id}")
+
+    for attempt in range(1, _BLOCK_CLAIM_ATTEMPTS + 1):
+        query = (
+            sa.select(
+                col(Seat.id),
+                col(Seat.seat_number),
+                col(Seat.is_available),
+                col(Flight.aircraft_configuration_id),
+            )
+            .join(Flight, col(Flight.id) == col(Seat.flight_id))
+            .where(col(Seat.flight_id) == flight_id)
+        )
+        rows = session.execute(query).all()
+
+        configuration_id = rows[0].aircraft_configuration_id if rows else None
+        template = _layout_template(
+            session, configuration_id, (row.seat_number for row in rows)
+        )
+        block = _best_block(rows, count, template)
+        if not block:
+            logger.warning(f"Not enough available seats for flight {flight_id}")
+            return []
+
+        claimed = _claim_all(session, flight_id, block)
+        if claimed:
+            order = {seat_id: index for index, seat_id in enumerate(block)}
+            claimed.sort(key=lambda seat: order[seat.id])
+            logger.info(
+                f"Claimed seats {[seat.seat_number for seat in claimed]} "
+                f"on attempt {attempt}"
+            )
+            return claimed
+
+        logger.info(f"Seat block for flight {flight_id} was taken, re-planning")
+
+    logger.warning(f"Couldn't claim a seat block for flight {flight_id}")
+    return []
 
 
 def update(
@@ -184,12 +450,17 @@ def update(
                 flight_id=seat_db.flight_id,
             )
 
+    was_available = seat_db.is_available
+
     try:
         seat_db.sqlmodel_update(seat_in)
+        delta = int(seat_db.is_available) - int(was_available)
 
         session.add(seat_db)
+        adjust_seats_remaining(session, seat_db.flight_id, delta)
         session.commit()
-        session.refresh(seat_db)
+
+        notify_seats_changed(seat_db.flight_id)
 
         logger.info(f"Successfully updated seat with ID: {seat_db.id}")
         return seat_db
@@ -208,7 +479,9 @@ def delete(session: Session, seat_db: Seat) -> None:
 
     try:
         session.delete(seat_db)
+        adjust_seats_remaining(session, seat_db.flight_id, -int(seat_db.is_available))
         session.commit()
+        notify_seats_changed(seat_db.flight_id)
         logger.info(f"Successfully deleted seat with ID: {seat_db.id}")
 
     except Exception as e:
@@ -217,24 +490,282 @@ def delete(session: Session, seat_db: Seat) -> None:
         raise SeatError(500, f"Failed to delete seat: {str(e)}") from e
 
 
-def find_available_seat(session: Session, flight_id: str) -> Optional[Seat]:
+def claim_seat(session: Session, seat_id: str) -> Seat:
     """
-    Find an available seat for a flight.
+    Atomically mark a seat as taken within the caller's transaction.
+
+    The seat is claimed with a single conditional UPDATE ... RETURNING, so
+    of several concurrent claims on the same seat exactly one succeeds and
+    the others see no row. The caller is responsible for adjusting the
+    flight's seats_remaining counter.
+
+    Raises:
+        SeatNotFoundError: If the seat doesn't exist
+        SeatNotAvailableError: If the seat is already taken
+    """
+    logger.info(f"Claiming seat with ID: {seat_id}")
+
+    claimed = session.scalars(
+        sa.update(Seat)
+        .where(col(Seat.id) == seat_id, col(Seat.is_available))
+        .values(is_available=False)
+        .returning(Seat)
+    ).first()
+
+    if claimed is None:
+        seat_db = get_by_id(session, seat_id)
+        logger.warning(f"Seat {seat_db.seat_number} is not available")
+        raise SeatNotAvailableError(seat_number=seat_db.seat_number)
+
+    return claimed
+
+
+def release_seat(session: Session, seat_id: str) -> Optional[str]:
+    """
+    Mark a taken seat as available again within the caller's transaction.
+
+    Like claim_seat, this is a single conditional UPDATE ... RETURNING, so
+    the seat isn't read first. The caller is responsible for adjusting the
+    flight's seats_remaining counter.
 
     Returns:
-        An available seat or None if no seats are available
+        ID of the seat's flight, or None if the seat doesn't exist or was
+        already available
     """
-    logger.info(f"Finding available seat for flight ID: {flight_id}")
+    logger.info(f"Releasing seat with ID: {seat_id}")
 
-    query = select(Seat).where(
-        Seat.flight_id == flight_id,
-        Seat.is_available == True,
+    return session.scalars(
+        sa.update(Seat)
+        .where(col(Seat.id) == seat_id, ~col(Seat.is_available))
+        .values(is_available=True)
+        .returning(col(Seat.flight_id))
+    ).first()
+
+
+def reserve(session: Session, seat_id: str) -> Seat:
+    """
+    Reserve a seat by claiming it and committing.
+
+    Raises:
+        SeatNotFoundError: If the seat doesn't exist
+        SeatNotAvailableError: If the seat is already taken
+    """
+    logger.info(f"Reserving seat with ID: {seat_id}")
+
+    try:
+        seat_db = claim_seat(session, seat_id)
+        adjust_seats_remaining(session, seat_db.flight_id, -1)
+        session.commit()
+    except SeatError:
+        session.rollback()
+        raise
+
+    notify_seats_changed(seat_db.flight_id)
+
+    logger.info(f"Successfully reserved seat with ID: {seat_id}")
+    return seat_db
+
+
+def claim_available_seat(session: Session, flight_id: str) -> Optional[Seat]:
+    """
+    Atomically claim any available seat of a flight within the caller's
+    transaction.
+
+    The candidate is picked with FOR UPDATE SKIP LOCKED, so concurrent
+    bookers each lock a different seat instead of queueing on, or colliding
+    over, the same first free one. The caller is responsible for adjusting
+    the flight's seats_remaining counter.
+
+    Returns:
+        The claimed seat or None if no seats are available
+    """
+    logger.info(f"Claiming available seat for flight ID: {flight_id}")
+
+    candidate = (
+        sa.select(col(Seat.id))
+        .where(col(Seat.flight_id) == flight_id, col(Seat.is_available))
+        .order_by(col(Seat.seat_number))
+        .limit(1)
+        .with_for_update(skip_locked=True)
+        .scalar_subquery()
     )
-    seat = session.exec(query).first()
+    seat = session.scalars(
+        sa.update(Seat)
+        .where(col(Seat.id) == candidate, col(Seat.is_available))
+        .values(is_available=False)
+        .returning(Seat)
+    ).first()
 
     if seat:
-        logger.info(f"Found available seat: {seat.seat_number}")
+        logger.info(f"Claimed available seat: {seat.seat_number}")
     else:
         logger.warning(f"No available seats found for flight {flight_id}")
 
     return seat
+
+
+def adjust_seats_remaining(session: Session, flight_id: str, delta: int) -> None:
+    """
+    Apply a change in available seats to the flight's seats_remaining counter
+    and bump its seat map version.
+
+    Runs as an atomic increment in the caller's transaction, so the counter
+    and version commit or roll back together with the seat change.
+    """
+    session.execute(
+        sa.update(Flight)
+        .where(col(Flight.id) == flight_id)
+        .values(
+            seats_remaining=col(Flight.seats_remaining) + delta,
+            seat_map_version=col(Flight.seat_map_version) + 1,
+        )
+    )
+
+
+def _seat_position(seat_number: str) -> Optional[tuple[int, str]]:
+    """
+    Parse a seat number into its (row, column) on the seat map grid.
+    """
+    match = SEAT_NUMBER_PATTERN.match(seat_number)
+    if not match or int(match.group(1)) <= 0:
+        return None
+    return int(match.group(1)), match.group(2)
+
+
+def _claim_all(session: Session, flight_id: str, seat_ids: Sequence[str]) -> list[Seat]:
+    """
+    Claim the given seats with one statement, only if all of them are free.
+
+    A CTE locks the seats that are still available, in ID order so that
+    concurrent claims on overlapping seats queue instead of deadlocking, and
+    the UPDATE applies only when that is every one of them.
+
+    Raises:
+        SeatNotAvailableError: If the claim lost a deadlock or serialization
+            conflict with a concurrent transaction
+    """
+    seat_ids = list(set(seat_ids))
+    if not seat_ids:
+        return []
+
+    locked = (
+        sa.select(col(Seat.id))
+        .where(
+            col(Seat.id).in_(seat_ids),
+            col(Seat.flight_id) == flight_id,
+            col(Seat.is_available),
+        )
+        .order_by(col(Seat.id))
+        .with_for_update()
+        .cte("locked")
+    )
+    try:
+        claimed = session.scalars(
+            sa.update(Seat)
+            .where(
+                col(Seat.id).in_(sa.select(locked.c.id)),
+                sa.select(func.count()).select_from(locked).scalar_subquery()
+                == len(seat_ids),
+            )
+            .values(is_available=False)
+            .returning(Seat)
+        ).all()
+    except OperationalError as e:
+        if not isinstance(
+            e.orig, (pg_errors.DeadlockDetected, pg_errors.SerializationFailure)
+        ):
+            raise
+        # The transaction is aborted; the caller rolls back on SeatError
+        logger.warning(f"Seat claim on flight {flight_id} lost a conflict: {str(e)}")
+        raise SeatNotAvailableError() from e
+    return list(claimed)
+
+
+def _layout_template(
+    session: Session, configuration_id: Optional[str], seat_numbers: Iterable[str]
+) -> SeatTemplate:
+    """
+    Get the seat template of a flight: its aircraft configuration's, or else
+    the smallest grid holding all its seat numbers.
+    """
+    if configuration_id:
+        return seat_templates.get(session, configuration_id)
+
+    positions = [position for position in map(_seat_position, seat_numbers) if position]
+    return grid_template(
+        max((row for row, _ in positions), default=0),
+        "".join(sorted({column for _, column in positions})),
+    )
+
+
+def _best_block(
+    rows: Sequence[sa.Row[tuple[str, str, bool, Optional[str]]]],
+    count: int,
+    template: SeatTemplate,
+) -> list[str]:
+    """
+    Pick the IDs of the best block of `count` available seats.
+
+    Blocks are scored by the number of rows they span, then the number of
+    separate runs of adjacent seats they use, then how far back they are.
+    If no group of consecutive rows has enough seats, the first available
+    seats in row order are used.
+    """
+    available = [row for row in rows if row.is_available]
+    if count <= 0 or len(available) < count:
+        return []
+
+    # Runs of adjacent available seats per row, left to right
+    runs_by_row: dict[int, list[list[str]]] = {}
+    unplaced: list[str] = []
+    last: dict[int, int] = {}
+    placed: list[tuple[int, int, str]] = []
+    for row in available:
+        position = template.positions.get(row.seat_number)
+        if position is None:
+            unplaced.append(row.id)
+        else:
+            placed.append((*position, row.id))
+
+    for row_number, index, seat_id in sorted(placed):
+        runs = runs_by_row.setdefault(row_number, [])
+        if runs and template.adjacent(last[row_number], index):
+            runs[-1].append(seat_id)
+        else:
+            runs.append([seat_id])
+        last[row_number] = index
+
+    best: Optional[tuple[tuple[int, int, int], list[str]]] = None
+    row_numbers = sorted(runs_by_row)
+    for start, first_row in enumerate(row_numbers):
+        block: list[str] = []
+        runs_used = 0
+        for offset, row_number in enumerate(row_numbers[start:]):
+            if row_number != first_row + offset:
+                break
+            # Fill from the longest runs so the group is split as little as possible
+            for run in sorted(runs_by_row[row_number], key=len, reverse=True):
+                block.extend(run[: count - len(block)])
+                runs_used += 1
+                if len(block) == count:
+                    break
+            if len(block) == count:
+                score = (offset + 1, runs_used, first_row)
+                if best is None or score < best[0]:
+                    best = (score, block)
+                break
+
+    if best is not None:
+        return best[1]
+
+    scattered = [
+        seat_id for row in row_numbers for run in runs_by_row[row] for seat_id in run
+    ]
+    return (scattered + unplaced)[:count]
+
+
+def notify_seats_changed(flight_id: str) -> None:
+    """
+    Propagate a committed seat availability change to the search cache.
+    """
+    flight_search_cache.invalidate(flight_id)
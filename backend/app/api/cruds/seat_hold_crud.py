@@ -0,0 +1,257 @@
+import logging
+from collections import Counter
+from collections.abc import Sequence
+from datetime import datetime, timedelta
+
+import sqlalchemy as sa
+from sqlmodel import Session, col
+
+from app.api.cruds import seat_crud
+from app.common.exceptions import (
+    FlightError,
+    FlightNotFoundError,
+    SeatError,
+    SeatHoldNotFoundError,
+    SeatNotAvailableError,
+)
+from app.core.config import settings
+from app.domain.models import Flight, Seat, SeatHold
+from app.domain.schemas import SeatHoldCreate, SeatHoldPublic
+from app.utils import generate_unique_id
+
+logger = logging.getLogger(__name__)
+
+
+def create(session: Session, user_id: str, hold_in: SeatHoldCreate) -> SeatHoldPublic:
+    """
+    Hold a set of seats of a flight for SEAT_HOLD_TTL_SECONDS.
+
+    All seats are claimed with one conditional UPDATE, so either every seat
+    is held or none is.
+
+    Raises:
+        SeatError: If no seats or too many seats are requested
+        FlightNotFoundError: If the flight doesn't exist
+        SeatNotAvailableError: If any of the seats is taken or not on the flight
+    """
+    seat_ids = list(dict.fromkeys(hold_in.seat_ids))
+    logger.info(
+        f"User {user_id} holding {len(seat_ids)} seats on flight {hold_in.flight_id}"
+    )
+
+    if not seat_ids:
+        raise SeatError(400, "At least one seat is required")
+    if len(seat_ids) > settings.SEAT_HOLD_MAX_SEATS:
+        raise SeatError(
+            400, f"At most {settings.SEAT_HOLD_MAX_SEATS} seats can be held at once"
+        )
+
+    try:
+        claimed = session.scalars(
+            sa.update(Seat)
+            .where(
+                col(Seat.id).in_(seat_ids),
+                col(Seat.flight_id) == hold_in.flight_id,
+                col(Seat.is_available),
+            )
+            .values(is_available=False)
+            .returning(col(Seat.id))
+        ).all()
+
+        if len(claimed) != len(seat_ids):
+            if not session.get(Flight, hold_in.flight_id):
+                raise FlightNotFoundError(flight_id=hold_in.flight_id)
+            missing = sorted(set(seat_ids) - set(claimed))
+            logger.warning(f"Seats not available for hold: {missing}")
+            raise SeatNotAvailableError()
+
+        hold_token = generate_unique_id()
+        expires_at = datetime.now() + timedelta(seconds=settings.SEAT_HOLD_TTL_SECONDS)
+        session.execute(
+            sa.insert(SeatHold),
+            [
+                {
+                    "seat_id": seat_id,
+                    "hold_token": hold_token,
+                    "user_id": user_id,
+                    "flight_id": hold_in.flight_id,
+                    "expires_at": expires_at,
+                }
+                for seat_id in seat_ids
+            ],
+        )
+        seat_crud.adjust_seats_remaining(session, hold_in.flight_id, -len(seat_ids))
+        session.commit()
+
+    except (FlightError, SeatError):
+        session.rollback()
+        raise
+    except Exception as e:
+        session.rollback()
+        logger.error(f"Error creating seat hold: {str(e)}")
+        raise SeatError(500, f"Failed to hold seats: {str(e)}") from e
+
+    seat_crud.notify_seats_changed(hold_in.flight_id)
+
+    logger.info(f"Created seat hold {hold_token} expiring at {expires_at}")
+    return SeatHoldPublic(
+        hold_token=hold_token,
+        flight_id=hold_in.flight_id,
+        seat_ids=seat_ids,
+        expires_at=expires_at,
+    )
+
+
+def consume(
+    session: Session,
+    hold_token: str,
+    user_id: str,
+    flight_id: str,
+    seat_ids: Sequence[str],
+) -> set[str]:
+    """
+    Turn held seats into sold ones within the caller's transaction.
+
+    The held seats are already unavailable, so consuming a hold only drops
+    its rows. A hold that expired but hasn't been swept yet is still honored.
+    Only seats held on the given flight are consumed.
+
+    Returns:
+        IDs of the given seats that were held on the flight under the token
+        by the user
+    """
+    logger.info(f"Consuming seat hold {hold_token} for user {user_id}")
+
+    consumed = session.scalars(
+        sa.delete(SeatHold)
+        .where(
+            col(SeatHold.hold_token) == hold_token,
+            col(SeatHold.user_id) == user_id,
+            col(SeatHold.flight_id) == flight_id,
+            col(SeatHold.seat_id).in_(seat_ids),
+        )
+        .returning(col(SeatHold.seat_id))
+    ).all()
+
+    logger.info(f"Consumed {len(consumed)} held seats")
+    return set(consumed)
+
+
+def release(session: Session, hold_token: str, user_id: str) -> int:
+    """
+    Release all seats held under a token by the user.
+
+    Returns:
+        Number of seats released
+
+    Raises:
+        SeatHoldNotFoundError: If the user has no seats held under the token
+    """
+    logger.info(f"User {user_id} releasing seat hold {hold_token}")
+
+    released = session.execute(
+        sa.delete(SeatHold)
+        .where(
+            col(SeatHold.hold_token) == hold_token,
+            col(SeatHold.user_id) == user_id,
+        )
+        .returning(col(SeatHold.seat_id), col(SeatHold.flight_id))
+    ).all()
+
+    if not released:
+        logger.warning(f"Seat hold not found: {hold_token}")
+        raise SeatHoldNotFoundError()
+
+    deltas = _free_seats(session, released)
+    session.commit()
+    notify_released(deltas)
+
+    logger.info(f"Released {len(released)} seats of hold {hold_token}")
+    return len(released)
+
+
+def release_expired(session: Session, batch_size: int) -> int:
+    """
+    Release the seats of expired holds, one committed batch at a time.
+
+    Expired holds are found through the expires_at index and picked with
+    SKIP LOCKED, so the sweep never scans the seat table and doesn't block
+    on holds being consumed concurrently.
+
+    Returns:
+        Number of seats released
+    """
+    total = 0
+    while True:
+        expired = (
+            sa.select(col(SeatHold.seat_id))
+            .where(col(SeatHold.expires_at) <= datetime.now())
+            .order_by(col(SeatHold.expires_at))
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        released = session.execute(
+            sa.delete(SeatHold)
+            .where(col(SeatHold.seat_id).in_(expired.scalar_subquery()))
+            .returning(col(SeatHold.seat_id), col(SeatHold.flight_id))
+        ).all()
+
+        if not released:
+            session.commit()
+            break
+
+        deltas = _free_seats(session, released)
+        session.commit()
+        notify_released(deltas)
+
+        total += len(released)
+        if len(released) < batch_size:
+            break
+
+    if total:
+        logger.info(f"Released {total} seats from expired holds")
+    return total
+
+
+def release_for_user(session: Session, user_id: str) -> dict[str, int]:
+    """
+    Release the seats of all holds of a user within the caller's transaction,
+    ahead of deleting the user.
+
+    Returns:
+        Number of seats released per flight, for notify_released() once the
+        transaction commits
+    """
+    released = session.execute(
+        sa.delete(SeatHold)
+        .where(col(SeatHold.user_id) == user_id)
+        .returning(col(SeatHold.seat_id), col(SeatHold.flight_id))
+    ).all()
+    if not released:
+        return {}
+
+    logger.info(f"Releasing {len(released)} held seats of user {user_id}")
+    return _free_seats(session, released)
+
+
+def _free_seats(
+    session: Session, released: Sequence[sa.Row[tuple[str, str]]]
+) -> dict[str, int]:
+    seat_ids = [seat_id for seat_id, _ in released]
+    session.execute(
+        sa.update(Seat).where(col(Seat.id).in_(seat_ids)).values(is_available=True)
+    )
+
+    # Update the counters in a fixed order so concurrent sweeps can't deadlock
+    deltas = Counter(flight_id for _, flight_id in released)
+    for flight_id in sorted(deltas):
+        seat_crud.adjust_seats_remaining(session, flight_id, deltas[flight_id])
+    return dict(deltas)
+
+
+def notify_released(deltas: dict[str, int]) -> None:
+    """
+    Propagate committed seat releases to the search cache.
+    """
+    for flight_id in deltas:
+        seat_crud.notify_seats_changed(flight_id)
@@ -0,0 +1,152 @@
+import functools
+import logging
+import threading
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import NamedTuple, Optional
+
+from sqlmodel import Session
+
+from app.common.exceptions import AircraftConfigurationNotFoundError
+from app.domain.models import AircraftConfiguration
+from app.domain.schemas import CabinZone
+
+logger = logging.getLogger(__name__)
+
+# Layout of flights created without an aircraft configuration
+DEFAULT_LAYOUT = "ABCDEF"
+
+
+class SeatTemplate(NamedTuple):
+    """
+    Compiled, immutable seat layout shared by every flight using it.
+    """
+
+    configuration_id: Optional[str]
+    rows: int
+    layout: str
+    columns: str
+    # Sellable seat numbers in row-major order
+    seat_numbers: tuple[str, ...]
+    # Seat number to (row, column index) on the grid
+    positions: Mapping[str, tuple[int, int]]
+    # Column indices followed by an aisle
+    aisles: frozenset[int]
+    cabins: tuple[CabinZone, ...]
+
+    def adjacent(self, left: int, right: int) -> bool:
+        """
+        Check whether two column indices are side by side, with no aisle
+        between them.
+        """
+        return right == left + 1 and left not in self.aisles
+
+
+def compile_template(
+    rows: int,
+    layout: str,
+    blocked_seats: frozenset[str] = frozenset(),
+    cabins: tuple[CabinZone, ...] = (),
+    configuration_id: Optional[str] = None,
+    seat_count: Optional[int] = None,
+) -> SeatTemplate:
+    """
+    Compile a seat layout into a template, optionally keeping only the first
+    seat_count seats.
+    """
+    columns = layout.replace(" ", "")
+
+    # An aisle follows the last column of every block but the last
+    aisles: set[int] = set()
+    last_index = -1
+    for block in layout.split(" ")[:-1]:
+        last_index += len(block)
+        aisles.add(last_index)
+
+    positions: dict[str, tuple[int, int]] = {}
+    for row in range(1, rows + 1):
+        for index, column in enumerate(columns):
+            seat_number = f"{row}{column}"
+            if seat_number not in blocked_seats:
+                positions[seat_number] = (row, index)
+            if seat_count is not None and len(positions) >= seat_count:
+                break
+        if seat_count is not None and len(positions) >= seat_count:
+            break
+
+    return SeatTemplate(
+        configuration_id=configuration_id,
+        rows=rows,
+        layout=layout,
+        columns=columns,
+        seat_numbers=tuple(positions),
+        positions=MappingProxyType(positions),
+        aisles=frozenset(aisles),
+        cabins=cabins,
+    )
+
+
+@functools.lru_cache(maxsize=128)
+def grid_template(rows: int, columns: str) -> SeatTemplate:
+    """
+    Get the template of a plain rows by columns grid without aisles.
+    """
+    return compile_template(rows, columns)
+
+
+@functools.lru_cache(maxsize=128)
+def default_template(seat_count: int) -> SeatTemplate:
+    """
+    Get the template of a flight without an aircraft configuration: seat_count
+    seats filled row by row into the default layout.
+    """
+    rows = -(-seat_count // len(DEFAULT_LAYOUT))
+    return compile_template(rows, DEFAULT_LAYOUT, seat_count=seat_count)
+
+
+class SeatTemplateCache:
+    """
+    Process-wide cache of compiled aircraft configuration templates.
+
+    Configurations can't be changed once created, so templates are compiled
+    on first use and never invalidated.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._templates: dict[str, SeatTemplate] = {}
+
+    def get(self, session: Session, configuration_id: str) -> SeatTemplate:
+        """
+        Get the template of an aircraft configuration, compiling it on a miss.
+
+        Raises:
+            AircraftConfigurationNotFoundError: If the configuration doesn't exist
+        """
+        template = self._templates.get(configuration_id)
+        if template is not None:
+            return template
+
+        configuration = session.get(AircraftConfiguration, configuration_id)
+        if not configuration:
+            logger.warning(f"Aircraft configuration not found: {configuration_id}")
+            raise AircraftConfigurationNotFoundError(configuration_id=configuration_id)
+
+        template = compile_template(
+            configuration.rows,
+            configuration.layout,
+            frozenset(configuration.blocked_seats),
+            tuple(CabinZone.model_validate(cabin) for cabin in configuration.cabins),
+            configuration_id=configuration.id,
+        )
+        with self._lock:
+            self._templates.setdefault(configuration_id, template)
+
+        logger.info(
+            f"Compiled seat template for aircraft configuration {configuration.name} "
+            f"with {len(template.seat_numbers)} seats"
+        )
+        return template
+
+
+seat_templates = SeatTemplateCache()
@@ -3,18 +3,17 @@ from typing import Any, Optional
 
 from pydantic import BaseModel
 from sqlalchemy.exc import IntegrityError
-from sqlmodel import Session, col, func, select
+from sqlmodel import Session, col, select
 
-from app.api.cruds import seat_crud
+from app.api.cruds import booking_crud, seat_crud
+from app.api.cruds.pagination import Page, paginate
 from app.common.exceptions import (
     NoAvailableSeatsError,
-    SeatNotAvailableError,
-    SeatNotFoundError,
     TicketError,
     TicketNotFoundError,
 )
-from app.domain.models import Passenger, Seat, Ticket
-from app.domain.schemas import TicketCreate, TicketUpdate
+from app.domain.models import Booking, Passenger, Ticket, User
+from app.domain.schemas import CountStrategy, TicketCreate, TicketUpdate
 
 logger = logging.getLogger(__name__)
 
@@ -27,42 +26,27 @@ def create(session: Session, ticket_in: TicketCreate) -> Ticket:
 
     try:
         # Handle seat assignment
-        seat_id = ticket_in.seat_id
-
-        if seat_id:
-            # If a specific seat is requested
-            try:
-                seat_db = seat_crud.get_by_id(session, seat_id)
-            except SeatNotFoundError:
-                logger.warning(f"Seat not found with ID: {seat_id}")
-                raise
-
-            if not seat_db.is_available:
-                logger.warning(f"Seat {seat_db.seat_number} is not available")
-                raise SeatNotAvailableError(seat_number=seat_db.seat_number)
-
-            # Mark seat as unavailable
-            seat_db.is_available = False
-            session.add(seat_db)
+        if ticket_in.seat_id:
+            # Claim the requested seat
+            seat_db = seat_crud.claim_seat(session, ticket_in.seat_id)
 
         else:
-            # Find any available seat
-            seat_db = seat_crud.find_available_seat(session, ticket_in.flight_id)
+            # Claim any available seat and assign it to the ticket
+            seat_db = seat_crud.claim_available_seat(session, ticket_in.flight_id)
             if not seat_db:
                 logger.warning(f"No available seats for flight {ticket_in.flight_id}")
                 raise NoAvailableSeatsError()
 
-            # Mark seat as unavailable and assign to ticket
-            seat_db.is_available = False
-            session.add(seat_db)
             ticket_in.seat_id = seat_db.id
 
         # Create the ticket
         ticket_db = Ticket.model_validate(ticket_in)
 
         session.add(ticket_db)
+        seat_crud.adjust_seats_remaining(session, seat_db.flight_id, -1)
         session.commit()
-        session.refresh(ticket_db)
+
+        seat_crud.notify_seats_changed(seat_db.flight_id)
 
         logger.info(f"Successfully created ticket with ID: {ticket_db.id}")
         return ticket_db
@@ -101,122 +85,194 @@ def get_by_ticket_number(session: Session, ticket_number: str) -> Optional[Ticke
     return ticket
 
 
+def get_owned(
+    session: Session, booking_id: str, ticket_id: str, current_user: User
+) -> Ticket:
+    """
+    Get a ticket of a booking the user can access, joining the passenger and
+    booking to check ownership in the same query.
+
+    Raises:
+        TicketNotFoundError: If the ticket isn't on the booking or the user
+        can't access the booking
+    """
+    logger.debug(f"Getting ticket {ticket_id} of booking {booking_id}")
+
+    query = (
+        select(Ticket)
+        .join(Passenger, col(Passenger.id) == col(Ticket.passenger_id))
+        .join(Booking, col(Booking.id) == col(Passenger.booking_id))
+        .where(
+            Ticket.id == ticket_id,
+            Passenger.booking_id == booking_id,
+            booking_crud.owned_by(current_user),
+        )
+    )
+    ticket_db = session.exec(query).first()
+    if not ticket_db:
+        logger.warning(
+            f"Ticket {ticket_id} not found in booking {booking_id} "
+            f"for user {current_user.id}"
+        )
+        raise TicketNotFoundError(ticket_id=ticket_id)
+    return ticket_db
+
+
 def get_tickets_by_passenger(
-    session: Session, passenger_id: str, skip: int = 0, limit: int = 100
-) -> tuple[list[Ticket], int]:
+    session: Session,
+    passenger_id: str,
+    skip: int = 0,
+    limit: int = 100,
+    count_strategy: CountStrategy = CountStrategy.EXACT,
+    cursor: Optional[str] = None,
+    booking_id: Optional[str] = None,
+    current_user: Optional[User] = None,
+) -> Page[Ticket]:
     """
-    Get all tickets for a specific passenger.
+    Get all tickets for a specific passenger, optionally only if the passenger
+    is on the given booking and the user can access it.
 
     Returns:
-        Tuple of (list of tickets, count)
+        Page of tickets with the total count, if requested
     """
     logger.info(f"Getting tickets for passenger ID: {passenger_id}")
 
     query = select(Ticket).where(Ticket.passenger_id == passenger_id)
-
-    # Get total count
-    count_stmt = select(func.count()).select_from(query.subquery())
-    count = session.exec(count_stmt).one()
-
-    # Apply pagination
-    query = query.offset(skip).limit(limit)
-    tickets = list(session.exec(query).all())
+    if booking_id is not None or current_user is not None:
+        query = query.join(
+            Passenger, col(Passenger.id) == col(Ticket.passenger_id)
+        ).join(Booking, col(Booking.id) == col(Passenger.booking_id))
+    if booking_id is not None:
+        query = query.where(Passenger.booking_id == booking_id)
+    if current_user is not None:
+        query = query.where(booking_crud.owned_by(current_user))
+
+    page = paginate(
+        session,
+        query,
+        skip,
+        limit,
+        count_strategy,
+        order_by=(col(Ticket.id),),
+        cursor=cursor,
+    )
 
     logger.info(
-        f"Found {count} tickets for passenger {passenger_id}, "
-        f"returning {len(tickets)} results"
+        f"Found {page.total} tickets for passenger {passenger_id}, "
+        f"returning {len(page.data)} results"
     )
-    return tickets, count
+    return page
 
 
 def get_tickets_by_booking(
-    session: Session, booking_id: str, skip: int = 0, limit: int = 100
-) -> tuple[list[Ticket], int]:
+    session: Session,
+    booking_id: str,
+    skip: int = 0,
+    limit: int = 100,
+    count_strategy: CountStrategy = CountStrategy.EXACT,
+    cursor: Optional[str] = None,
+    current_user: Optional[User] = None,
+) -> Page[Ticket]:
     """
-    Get all tickets for a specific booking.
+    Get all tickets for a specific booking, optionally only if the user can
+    access the booking.
 
     Returns:
-        Tuple of (list of tickets, count)
+        Page of tickets with the total count, if requested
     """
     logger.info(f"Getting tickets for booking ID: {booking_id}")
 
-    # First get all passengers for this booking
-    passenger_query = select(Passenger.id).where(Passenger.booking_id == booking_id)
-    passenger_ids = list(session.exec(passenger_query).all())
-
-    if not passenger_ids:
-        logger.info(f"No passengers found for booking {booking_id}")
-        return [], 0
-
-    # Then get tickets for these passengers
-    query = select(Ticket).where(col(Ticket.passenger_id).in_(passenger_ids))
-
-    # Get total count
-    count_stmt = select(func.count()).select_from(query.subquery())
-    count = session.exec(count_stmt).one()
-
-    # Apply pagination
-    query = query.offset(skip).limit(limit)
-    tickets = list(session.exec(query).all())
+    query = (
+        select(Ticket)
+        .join(Passenger, col(Passenger.id) == col(Ticket.passenger_id))
+        .where(Passenger.booking_id == booking_id)
+    )
+    if current_user is not None:
+        query = query.join(Booking, col(Booking.id) == col(Passenger.booking_id)).where(
+            booking_crud.owned_by(current_user)
+        )
+
+    page = paginate(
+        session,
+        query,
+        skip,
+        limit,
+        count_strategy,
+        order_by=(col(Ticket.id),),
+        cursor=cursor,
+    )
 
     logger.info(
-        f"Found {count} tickets for booking {booking_id}, "
-        f"returning {len(tickets)} results"
+        f"Found {page.total} tickets for booking {booking_id}, "
+        f"returning {len(page.data)} results"
     )
-    return tickets, count
+    return page
 
 
 def get_tickets_by_flight(
-    session: Session, flight_id: str, skip: int = 0, limit: int = 100
-) -> tuple[list[Ticket], int]:
+    session: Session,
+    flight_id: str,
+    skip: int = 0,
+    limit: int = 100,
+    count_strategy: CountStrategy = CountStrategy.EXACT,
+    cursor: Optional[str] = None,
+) -> Page[Ticket]:
     """
     Get all tickets for a specific flight.
 
     Returns:
-        Tuple of (list of tickets, count)
+        Page of tickets with the total count, if requested
     """
     logger.info(f"Getting tickets for flight ID: {flight_id}")
 
     query = select(Ticket).where(Ticket.flight_id == flight_id)
 
-    # Get total count
-    count_stmt = select(func.count()).select_from(query.subquery())
-    count = session.exec(count_stmt).one()
-
-    # Apply pagination
-    query = query.offset(skip).limit(limit)
-    tickets = list(session.exec(query).all())
+    page = paginate(
+        session,
+        query,
+        skip,
+        limit,
+        count_strategy,
+        order_by=(col(Ticket.id),),
+        cursor=cursor,
+    )
 
     logger.info(
-        f"Found {count} tickets for flight {flight_id}, "
-        f"returning {len(tickets)} results"
+        f"Found {page.total} tickets for flight {flight_id}, "
+        f"returning {len(page.data)} results"
     )
-    return tickets, count
+    return page
 
 
 def get_all_tickets(
-    session: Session, skip: int = 0, limit: int = 100
-) -> tuple[list[Ticket], int]:
+    session: Session,
+    skip: int = 0,
+    limit: int = 100,
+    count_strategy: CountStrategy = CountStrategy.EXACT,
+    cursor: Optional[str] = None,
+) -> Page[Ticket]:
     """
     Get all tickets with pagination.
 
     Returns:
-        Tuple of (list of tickets, count)
+        Page of tickets with the total count, if requested
     """
     logger.info("Getting all tickets")
 
     query = select(Ticket)
 
-    # Get total count
-    count_stmt = select(func.count()).select_from(query.subquery())
-    count = session.exec(count_stmt).one()
-
-    # Apply pagination
-    query = query.offset(skip).limit(limit)
-    tickets = list(session.exec(query).all())
+    page = paginate(
+        session,
+        query,
+        skip,
+        limit,
+        count_strategy,
+        order_by=(col(Ticket.id),),
+        cursor=cursor,
+    )
 
-    logger.info(f"Found {count} tickets, returning {len(tickets)} results")
-    return tickets, count
+    logger.info(f"Found {page.total} tickets, returning {len(page.data)} results")
+    return page
 
 
 def update(
@@ -231,37 +287,30 @@ def update(
         ticket_in = ticket_in.model_dump(exclude_unset=True)
 
     try:
-        # Handle seat change if needed
-        if ticket_in.get("seat_id") != ticket_db.seat_id:
-            new_seat_id = ticket_in["seat_id"]
+        # Change in available seats per flight
+        seat_deltas: dict[str, int] = {}
 
-            try:
-                new_seat = seat_crud.get_by_id(session, new_seat_id)
-            except SeatNotFoundError:
-                logger.warning(f"New seat not found with ID: {new_seat_id}")
-                raise
-
-            # Check if new seat is available
-            if not new_seat.is_available:
-                logger.warning(f"New seat {new_seat.seat_number} is not available")
-                raise SeatNotAvailableError(seat_number=new_seat.seat_number)
-
-            # Mark new seat as unavailable
-            new_seat.is_available = False
-            session.add(new_seat)
+        # Handle seat change if needed
+        if "seat_id" in ticket_in and ticket_in["seat_id"] != ticket_db.seat_id:
+            # Claim the new seat
+            new_seat = seat_crud.claim_seat(session, ticket_in["seat_id"])
+            seat_deltas[new_seat.flight_id] = seat_deltas.get(new_seat.flight_id, 0) - 1
 
             # Mark old seat as available if it exists
             if ticket_db.seat_id:
-                old_seat = session.get(Seat, ticket_db.seat_id)
-                if old_seat:
-                    old_seat.is_available = True
-                    session.add(old_seat)
+                old_flight_id = seat_crud.release_seat(session, ticket_db.seat_id)
+                if old_flight_id:
+                    seat_deltas[old_flight_id] = seat_deltas.get(old_flight_id, 0) + 1
 
         # Update ticket
         ticket_db.sqlmodel_update(ticket_in)
         session.add(ticket_db)
+        for flight_id, delta in seat_deltas.items():
+            seat_crud.adjust_seats_remaining(session, flight_id, delta)
         session.commit()
-        session.refresh(ticket_db)
+
+        for flight_id in seat_deltas:
+            seat_crud.notify_seats_changed(flight_id)
 
         logger.info(f"Successfully updated ticket with ID: {ticket_db.id}")
         return ticket_db
@@ -280,15 +329,17 @@ def delete(session: Session, ticket_db: Ticket) -> None:
 
     try:
         # Mark seat as available if it exists
+        released_flight_id = None
         if ticket_db.seat_id:
-            seat = session.get(Seat, ticket_db.seat_id)
-            if seat:
-                seat.is_available = True
-                session.add(seat)
+            released_flight_id = seat_crud.release_seat(session, ticket_db.seat_id)
+            if released_flight_id:
+                seat_crud.adjust_seats_remaining(session, released_flight_id, 1)
 
         # Delete ticket
         session.delete(ticket_db)
         session.commit()
+        if released_flight_id:
+            seat_crud.notify_seats_changed(released_flight_id)
         logger.info(f"Successfully deleted ticket with ID: {ticket_db.id}")
 
     except Exception as e:
@@ -3,8 +3,10 @@ from typing import Any, Optional
 
 from pydantic import BaseModel
 from sqlalchemy.exc import IntegrityError
-from sqlmodel import Session, func, select
+from sqlmodel import Session, col, select
 
+from app.api.cruds import seat_hold_crud
+from app.api.cruds.pagination import Page, paginate
 from app.common.exceptions import (
     AuthenticationError,
     InactiveUserError,
@@ -14,7 +16,7 @@ from app.common.exceptions import (
 )
 from app.core.security import get_password_hash, verify_password
 from app.domain.models import User
-from app.domain.schemas import UserCreate, UserUpdate, UserUpdateStatus
+from app.domain.schemas import CountStrategy, UserCreate, UserUpdate, UserUpdateStatus
 
 logger = logging.getLogger(__name__)
 
@@ -37,7 +39,6 @@ def create(session: Session, user_in: UserCreate) -> User:
 
         session.add(user_db)
         session.commit()
-        session.refresh(user_db)
 
         logger.info(f"Successfully created user with ID: {user_db.id}")
         return user_db
@@ -77,7 +78,6 @@ def update(
         user_db.sqlmodel_update(new_data)
         session.add(user_db)
         session.commit()
-        session.refresh(user_db)
 
         logger.info(f"Successfully updated user with ID: {user_db.id}")
         return user_db
@@ -91,12 +91,17 @@ def update(
 def delete(session: Session, user_db: User) -> None:
     """
     Delete a user from the database.
+
+    The seats the user is holding are released in the same transaction, as
+    deleting the holds alone would leave them unavailable.
     """
     logger.info(f"Deleting user with ID: {user_db.id}")
 
     try:
+        released = seat_hold_crud.release_for_user(session, user_db.id)
         session.delete(user_db)
         session.commit()
+        seat_hold_crud.notify_released(released)
         logger.info(f"Successfully deleted user with ID: {user_db.id}")
 
     except Exception as e:
@@ -135,12 +140,14 @@ def search_users(
     is_superuser: Optional[bool] = None,
     skip: int = 0,
     limit: int = 100,
-) -> tuple[list[User], int]:
+    count_strategy: CountStrategy = CountStrategy.EXACT,
+    cursor: Optional[str] = None,
+) -> Page[User]:
     """
     Search for users with various filters.
 
     Returns:
-        Tuple of (list of users, count)
+        Page of users with the total count, if requested
     """
     logger.info("Searching users with filters")
 
@@ -155,16 +162,18 @@ def search_users(
     if is_superuser is not None:
         query = query.where(User.is_superuser == is_superuser)
 
-    # Count total matching users
-    count_stmt = select(func.count()).select_from(query.subquery())
-    total = session.exec(count_stmt).one()
-
-    # Get paginated results
-    query = query.offset(skip).limit(limit)
-    users = list(session.exec(query).all())
-
-    logger.info(f"Found {total} users, returning {len(users)} results")
-    return users, total
+    page = paginate(
+        session,
+        query,
+        skip,
+        limit,
+        count_strategy,
+        order_by=(col(User.email), col(User.id)),
+        cursor=cursor,
+    )
+
+    logger.info(f"Found {page.total} users, returning {len(page.data)} results")
+    return page
 
 
 def authenticate(session: Session, email: str, password: str) -> User:
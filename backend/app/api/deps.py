@@ -12,7 +12,7 @@ from app.core.config import settings
 from app.core.database import engine
 from app.core.security import ALGORITHM
 from app.domain.models import User
-from app.domain.schemas import TokenPayload
+from app.domain.schemas import CountStrategy, TokenPayload
 
 oauth2_scheme = OAuth2PasswordBearer(
     tokenUrl=f"{settings.API_V1_STR}/signin/access-token"
@@ -20,7 +20,11 @@ oauth2_scheme = OAuth2PasswordBearer(
 
 
 def get_db() -> Generator[Session, None, None]:
-    with Session(engine) as session:
+    # Objects keep their state after commit, so returning a just-written row
+    # doesn't reload it. ORM bulk UPDATEs only refresh matching objects already
+    # in the session when synchronize_session is left at "auto" or set to
+    # "fetch"; one run with synchronize_session=False leaves them stale.
+    with Session(engine, expire_on_commit=False) as session:
         yield session
 
 
@@ -57,3 +61,14 @@ def get_current_superuser(current_user: CurrentUser) -> User:
 
 
 CurrentSuperuser = Annotated[User, Depends(get_current_superuser)]
+
+
+def get_count_strategy(
+    include_count: bool = True, count_strategy: CountStrategy = CountStrategy.EXACT
+) -> CountStrategy:
+    if not include_count:
+        return CountStrategy.NONE
+    return count_strategy
+
+
+CountStrategyDep = Annotated[CountStrategy, Depends(get_count_strategy)]
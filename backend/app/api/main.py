@@ -1,6 +1,7 @@
 from fastapi import APIRouter
 
 from app.api.routes import (
+    aircraft_configurations,
     bookings,
     flights,
     login,
@@ -16,6 +17,7 @@ api_router.include_router(login.router)
 api_router.include_router(me.router)
 api_router.include_router(users.router)
 api_router.include_router(flights.router)
+api_router.include_router(aircraft_configurations.router)
 api_router.include_router(bookings.router)
 api_router.include_router(passengers.router)
 api_router.include_router(seats.router)
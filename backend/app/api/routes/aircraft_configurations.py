@@ -0,0 +1,77 @@
+import logging
+from typing import Any, Optional
+
+from fastapi import APIRouter, Depends
+
+from app.api.cruds import aircraft_configuration_crud
+from app.api.deps import CountStrategyDep, SessionDep, get_current_superuser
+from app.common.exceptions import FlightError, PaginationError, handle_exception
+from app.domain.schemas import (
+    AircraftConfigurationCreate,
+    AircraftConfigurationPublic,
+    AircraftConfigurationsPublic,
+)
+
+logger = logging.getLogger(__name__)
+router = APIRouter(prefix="/aircraft-configurations", tags=["aircraft-configurations"])
+
+
+@router.get("", response_model=AircraftConfigurationsPublic)
+def read_aircraft_configurations(
+    session: SessionDep,
+    count_strategy: CountStrategyDep,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+) -> Any:
+    """
+    Retrieve aircraft configurations.
+    """
+    try:
+        logger.info("Retrieving aircraft configurations")
+
+        page = aircraft_configuration_crud.get_all(
+            session, skip, limit, count_strategy, cursor=cursor
+        )
+
+        return {"data": page.data, "count": page.total, "next_cursor": page.next_cursor}
+
+    except PaginationError as e:
+        logger.error(f"Error reading aircraft configurations: {str(e)}")
+        raise handle_exception(e) from e
+
+
+@router.post(
+    "",
+    dependencies=[Depends(get_current_superuser)],
+    response_model=AircraftConfigurationPublic,
+)
+def create_aircraft_configuration(
+    session: SessionDep, configuration_in: AircraftConfigurationCreate
+) -> Any:
+    """
+    Create a new aircraft configuration (admin only).
+
+    Configurations can't be changed afterwards, since flights share them.
+    """
+    try:
+        logger.info(f"Creating aircraft configuration: {configuration_in.name}")
+        return aircraft_configuration_crud.create(session, configuration_in)
+
+    except FlightError as e:
+        logger.error(f"Error creating aircraft configuration: {str(e)}")
+        raise handle_exception(e) from e
+
+
+@router.get("/{configuration_id}", response_model=AircraftConfigurationPublic)
+def read_aircraft_configuration(session: SessionDep, configuration_id: str) -> Any:
+    """
+    Get aircraft configuration by ID.
+    """
+    try:
+        logger.info(f"Retrieving aircraft configuration: {configuration_id}")
+        return aircraft_configuration_crud.get_by_id(session, configuration_id)
+
+    except FlightError as e:
+        logger.error(f"Error retrieving aircraft configuration: {str(e)}")
+        raise handle_exception(e) from e
@@ -4,8 +4,13 @@ from typing import Any, Optional
 from fastapi import APIRouter, Depends
 
 from app.api.cruds import ViewFilter, booking_crud
-from app.api.deps import SessionDep, get_current_superuser
-from app.common.exceptions import BookingError, UserError, handle_exception
+from app.api.deps import CountStrategyDep, SessionDep, get_current_superuser
+from app.common.exceptions import (
+    BookingError,
+    PaginationError,
+    UserError,
+    handle_exception,
+)
 from app.domain.models import BookingStatus
 from app.domain.schemas import (
     BookingDetailPublic,
@@ -26,8 +31,10 @@ router = APIRouter(prefix="/bookings", tags=["bookings"])
 )
 def read_bookings(
     session: SessionDep,
+    count_strategy: CountStrategyDep,
     skip: int = 0,
     limit: int = 10,
+    cursor: Optional[str] = None,
     status: Optional[BookingStatus] = None,
     view_filter: ViewFilter = ViewFilter.ACTIVE,
 ) -> Any:
@@ -36,10 +43,15 @@ def read_bookings(
     """
     logger.info("Retrieving bookings with filters")
 
-    bookings, count = booking_crud.get_all_bookings(
-        session, skip, limit, status, view_filter
-    )
-    return {"data": bookings, "count": count}
+    try:
+        page = booking_crud.get_all_bookings(
+            session, skip, limit, status, view_filter, count_strategy, cursor=cursor
+        )
+        return {"data": page.data, "count": page.total, "next_cursor": page.next_cursor}
+
+    except PaginationError as e:
+        logger.error(f"Error reading bookings: {str(e)}")
+        raise handle_exception(e) from e
 
 
 @router.get(
@@ -1,18 +1,33 @@
 import logging
-from typing import Annotated, Any
+from datetime import date
+from typing import Annotated, Any, Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from pydantic import ValidationError
 
-from app.api.cruds import flight_crud
-from app.api.deps import SessionDep, get_current_superuser
-from app.common.exceptions import FlightError, handle_exception
+from app.api.cruds import fare_calendar_crud, flight_crud
+from app.api.cruds.flight_cache import flight_search_cache
+from app.api.deps import CountStrategyDep, SessionDep, get_current_superuser
+from app.common.exceptions import FlightError, PaginationError, handle_exception
+from app.common.json_stream import iter_json_records
+from app.core.config import settings
 from app.domain.schemas import (
+    ConnectionSearch,
+    FareCalendarPublic,
+    FlightBulkImportPublic,
     FlightCreate,
+    FlightImportError,
     FlightPublic,
     FlightSearch,
+    FlightSearchCacheStats,
     FlightsPublic,
+    FlightsUpsertPublic,
     FlightUpdate,
+    ItinerariesPublic,
     Message,
+    RoundTripSearch,
+    RoundTripsPublic,
 )
 
 logger = logging.getLogger(__name__)
@@ -20,14 +35,23 @@ router = APIRouter(prefix="/flights", tags=["flights"])
 
 
 @router.get("", response_model=FlightsPublic)
-def read_flights(session: SessionDep, search: Annotated[FlightSearch, Query()]) -> Any:
+def read_flights(
+    session: SessionDep,
+    search: Annotated[FlightSearch, Query()],
+    count_strategy: CountStrategyDep,
+) -> Any:
     """
     Retrieve flights with filters.
     """
     logger.info("Retrieving flights with filters")
 
-    flights, count = flight_crud.search_flights(session, search)
-    return {"data": flights, "count": count}
+    try:
+        page = flight_crud.search_flights(session, search, count_strategy)
+        return {"data": page.data, "count": page.total, "next_cursor": page.next_cursor}
+
+    except PaginationError as e:
+        logger.error(f"Error reading flights: {str(e)}")
+        raise handle_exception(e) from e
 
 
 @router.post(
@@ -52,6 +76,238 @@ def create_flight(session: SessionDep, flight_in: FlightCreate) -> Any:
         raise handle_exception(e) from e
 
 
+@router.post(
+    "/upsert",
+    dependencies=[Depends(get_current_superuser)],
+    response_model=FlightsUpsertPublic,
+)
+def upsert_flights(session: SessionDep, flights_in: list[FlightCreate]) -> Any:
+    """
+    Create or update flights matched on flight number, date and departure
+    time (admin only).
+    """
+    try:
+        logger.info(f"Upserting {len(flights_in)} flights")
+
+        if len(flights_in) > settings.FLIGHT_UPSERT_MAX_FLIGHTS:
+            raise FlightError(
+                400,
+                f"At most {settings.FLIGHT_UPSERT_MAX_FLIGHTS} flights "
+                "can be upserted at once",
+            )
+
+        results = flight_crud.upsert(session, flights_in)
+        inserted_count = sum(inserted for _, inserted in results)
+
+        logger.info(f"Flights upserted: {inserted_count} inserted")
+        return {
+            "data": [
+                {**flight_db.model_dump(), "inserted": inserted}
+                for flight_db, inserted in results
+            ],
+            "inserted": inserted_count,
+            "updated": len(results) - inserted_count,
+        }
+
+    except FlightError as e:
+        logger.error(f"Error upserting flights: {str(e)}")
+        raise handle_exception(e) from e
+
+
+@router.post(
+    "/bulk",
+    dependencies=[Depends(get_current_superuser)],
+    response_model=FlightBulkImportPublic,
+)
+async def bulk_import_flights(request: Request, session: SessionDep) -> Any:
+    """
+    Import new flights and their seats from a JSON array or, with an
+    application/x-ndjson body, one flight per line (admin only).
+
+    The body is parsed and validated as it streams in and written in chunks
+    of FLIGHT_BULK_CHUNK_SIZE flights, each in its own transaction. Invalid
+    or duplicate flights are reported per row and don't stop the import.
+    """
+    content_type = request.headers.get("content-type", "")
+    ndjson = "ndjson" in content_type or "jsonl" in content_type
+    logger.info(f"Bulk importing flights from {'NDJSON' if ndjson else 'JSON array'}")
+
+    received = 0
+    inserted = 0
+    failed = 0
+    errors: list[FlightImportError] = []
+
+    def report(row: int, flight_number: Optional[str], message: str) -> None:
+        nonlocal failed
+        failed += 1
+        if len(errors) < settings.FLIGHT_BULK_MAX_ERRORS:
+            errors.append(
+                FlightImportError(row=row, flight_number=flight_number, message=message)
+            )
+
+    chunk: list[tuple[int, FlightCreate]] = []
+
+    async def flush() -> None:
+        nonlocal inserted
+        flights_in = [flight_in for _, flight_in in chunk]
+        try:
+            results = await run_in_threadpool(
+                flight_crud.bulk_create, session, flights_in
+            )
+        except FlightError as e:
+            results = [e.detail] * len(chunk)
+
+        for (row, flight_in), error in zip(chunk, results, strict=True):
+            if error is None:
+                inserted += 1
+            else:
+                report(row, flight_in.flight_number, error)
+        chunk.clear()
+
+    async for record in iter_json_records(request.stream(), ndjson):
+        received += 1
+        if record.error is not None:
+            report(record.row, None, record.error)
+            continue
+
+        try:
+            flight_in = FlightCreate.model_validate(record.value)
+        except ValidationError as e:
+            flight_number = (
+                record.value.get("flight_number")
+                if isinstance(record.value, dict)
+                else None
+            )
+            report(
+                record.row,
+                flight_number if isinstance(flight_number, str) else None,
+                "; ".join(
+                    f"{'.'.join(str(part) for part in error['loc']) or 'flight'}: "
+                    f"{error['msg']}"
+                    for error in e.errors()
+                ),
+            )
+            continue
+
+        chunk.append((record.row, flight_in))
+        if len(chunk) >= settings.FLIGHT_BULK_CHUNK_SIZE:
+            await flush()
+
+    if chunk:
+        await flush()
+
+    logger.info(
+        f"Bulk import finished: {received} received, {inserted} inserted, "
+        f"{failed} failed"
+    )
+    return {
+        "received": received,
+        "inserted": inserted,
+        "failed": failed,
+        # Chunk errors are only known after the rows following them
+        "errors": sorted(errors, key=lambda error: error.row),
+    }
+
+
+@router.get("/round-trip", response_model=RoundTripsPublic)
+def read_round_trips(
+    session: SessionDep, search: Annotated[RoundTripSearch, Query()]
+) -> Any:
+    """
+    Retrieve outbound and return flight pairs sorted by combined price.
+    """
+    try:
+        logger.info(
+            f"Retrieving round trips {search.departure_code}-{search.arrival_code}"
+        )
+
+        round_trips, count = flight_crud.search_round_trips(session, search)
+        return {"data": round_trips, "count": count}
+
+    except FlightError as e:
+        logger.error(f"Error retrieving round trips: {str(e)}")
+        raise handle_exception(e) from e
+
+
+@router.get("/connections", response_model=ItinerariesPublic)
+def read_connections(
+    session: SessionDep, search: Annotated[ConnectionSearch, Query()]
+) -> Any:
+    """
+    Retrieve direct and connecting itineraries between two airports.
+    """
+    try:
+        logger.info(
+            f"Retrieving connections from {search.departure_code} "
+            f"to {search.arrival_code}"
+        )
+
+        itineraries = flight_crud.search_connections(session, search)
+        return {"data": itineraries}
+
+    except FlightError as e:
+        logger.error(f"Error retrieving connections: {str(e)}")
+        raise handle_exception(e) from e
+
+
+@router.get("/calendar", response_model=FareCalendarPublic)
+def read_fare_calendar(
+    session: SessionDep,
+    departure_code: str,
+    arrival_code: str,
+    start_date: Annotated[date, Query(alias="from")],
+    end_date: Annotated[date, Query(alias="to")],
+) -> Any:
+    """
+    Retrieve the cheapest price and number of flights per day for a route.
+    """
+    try:
+        logger.info(f"Retrieving fare calendar for {departure_code}-{arrival_code}")
+
+        days = fare_calendar_crud.get_calendar(
+            session, departure_code, arrival_code, start_date, end_date
+        )
+        return {
+            "departure_code": departure_code,
+            "arrival_code": arrival_code,
+            "data": days,
+        }
+
+    except FlightError as e:
+        logger.error(f"Error retrieving fare calendar: {str(e)}")
+        raise handle_exception(e) from e
+
+
+@router.get(
+    "/search-cache",
+    dependencies=[Depends(get_current_superuser)],
+    response_model=FlightSearchCacheStats,
+)
+def read_search_cache_stats() -> Any:
+    """
+    Retrieve flight search cache counters (admin only).
+    """
+    return flight_search_cache.stats()
+
+
+@router.post(
+    "/reconcile-seats",
+    dependencies=[Depends(get_current_superuser)],
+    response_model=Message,
+)
+def reconcile_seats(session: SessionDep) -> Any:
+    """
+    Repair seats remaining counters against the seat table (admin only).
+    """
+    try:
+        repaired = flight_crud.reconcile_seats_remaining(session)
+        return Message(msg=f"Repaired seats remaining for {repaired} flights")
+
+    except FlightError as e:
+        logger.error(f"Error reconciling seats: {str(e)}")
+        raise handle_exception(e) from e
+
+
 @router.get("/{flight_id}", response_model=FlightPublic)
 def read_flight(session: SessionDep, flight_id: str) -> Any:
     """
@@ -1,20 +1,21 @@
 import logging
-from typing import Any, Optional
+from typing import Annotated, Any, Optional
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Header
 from pydantic import BaseModel
 
 from app.api.cruds import (
     ViewFilter,
     booking_crud,
     passenger_crud,
-    seat_crud,
     ticket_crud,
 )
-from app.api.deps import CurrentUser, SessionDep
+from app.api.deps import CountStrategyDep, CurrentUser, SessionDep
 from app.common.exceptions import (
     BookingError,
+    PaginationError,
     PassengerError,
+    SeatError,
     TicketError,
     UnauthorizedBookingAccessError,
     handle_exception,
@@ -29,7 +30,6 @@ from app.domain.schemas import (
     PassengerPublic,
     PassengersPublic,
     PassengerUpdate,
-    SeatUpdate,
     TicketPublic,
     TicketsPublic,
 )
@@ -51,8 +51,10 @@ class BookingResponse(BaseModel):
 def read_user_bookings(
     session: SessionDep,
     current_user: CurrentUser,
+    count_strategy: CountStrategyDep,
     skip: int = 0,
     limit: int = 10,
+    cursor: Optional[str] = None,
     status: Optional[BookingStatus] = None,
     view_filter: ViewFilter = ViewFilter.ACTIVE,
 ) -> Any:
@@ -61,18 +63,38 @@ def read_user_bookings(
     """
     logger.info(f"Retrieving bookings for user ID: {current_user.id}")
 
-    bookings, count = booking_crud.get_bookings_by_user(
-        session, current_user.id, skip, limit, status, view_filter
-    )
-    return {"data": bookings, "count": count}
+    try:
+        page = booking_crud.get_bookings_by_user(
+            session,
+            current_user.id,
+            skip,
+            limit,
+            status,
+            view_filter,
+            count_strategy,
+            cursor=cursor,
+        )
+        return {"data": page.data, "count": page.total, "next_cursor": page.next_cursor}
+
+    except PaginationError as e:
+        logger.error(f"Error retrieving user bookings: {str(e)}")
+        raise handle_exception(e) from e
 
 
 @router.post("", response_model=BookingPublic)
 def create_user_booking(
-    session: SessionDep, current_user: CurrentUser, booking_in: BookingCreate
+    session: SessionDep,
+    current_user: CurrentUser,
+    booking_in: BookingCreate,
+    idempotency_key: Annotated[
+        Optional[str], Header(alias="Idempotency-Key", max_length=255)
+    ] = None,
 ) -> Any:
     """
     Create a booking for the current user with passengers and tickets.
+
+    Requests retried with the same Idempotency-Key header return the booking
+    created by the first one.
     """
     logger.info(f"Creating booking for user ID: {current_user.id}")
     logger.debug(f"Booking data received: {booking_in.model_dump()}")
@@ -97,36 +119,11 @@ def create_user_booking(
                 logger.warning(f"Missing date_of_birth for passenger {i}")
                 raise BookingError(400, f"Missing date_of_birth for passenger {i}")
 
-        # Process seat reservations if needed
-        for seat_id in booking_in.flight_info.seat_ids:
-            if seat_id:
-                try:
-                    # Get seat to check availability and mark as unavailable
-                    seat = seat_crud.get_by_id(session, seat_id)
-                    if not seat.is_available:
-                        logger.warning(f"Seat {seat_id} is already reserved")
-                        # Continue anyway, the booking creation will handle it
-                    else:
-                        # Mark seat as unavailable after booking is created
-                        logger.info(f"Seat {seat_id} will be reserved")
-                except Exception as e:
-                    logger.error(f"Error checking seat {seat_id}: {str(e)}")
-                    # Continue with booking process
-
-        # Create booking with passengers and tickets
-        booking_db = booking_crud.create_detailed_booking(session, booking_in)
-
-        # Mark seats as unavailable after booking is created
-        for seat_id in booking_in.flight_info.seat_ids:
-            if seat_id:
-                try:
-                    seat = seat_crud.get_by_id(session, seat_id)
-                    seat_update = SeatUpdate(is_available=False)
-                    seat_crud.update(session, seat, seat_update)
-                    logger.info(f"Marked seat {seat_id} as unavailable")
-                except Exception as e:
-                    # Log error but don't fail the booking
-                    logger.error(f"Error updating seat {seat_id}: {str(e)}")
+        # Create booking with passengers and tickets; seats are claimed and
+        # marked unavailable inside the booking transaction
+        booking_db = booking_crud.create_detailed_booking(
+            session, booking_in, idempotency_key
+        )
 
         logger.info(f"Booking created successfully: {booking_db.id}")
 
@@ -145,7 +142,7 @@ def create_user_booking(
                 "success": True,
             }
 
-    except BookingError as e:
+    except (BookingError, SeatError, TicketError) as e:
         session.rollback()
         logger.error(f"Error creating booking: {str(e)}")
         raise handle_exception(e) from e
@@ -169,10 +166,7 @@ def read_user_booking(
     )
 
     try:
-        booking_db = booking_crud.get_by_id(session, booking_id)
-
-        # Check permissions
-        booking_crud.verify_user_can_access_booking(booking_db, current_user)
+        booking_db = booking_crud.get_owned(session, booking_id, current_user)
 
         logger.info(f"Booking retrieved successfully: {booking_db.id}")
         return booking_db
@@ -195,8 +189,7 @@ def read_user_booking_details(
     )
 
     try:
-        booking_db = booking_crud.get_by_id(session, booking_id)
-        booking_crud.verify_user_can_access_booking(booking_db, current_user)
+        booking_db = booking_crud.get_owned(session, booking_id, current_user)
 
         booking_details = booking_crud.get_booking_with_details(session, booking_id)
 
@@ -220,10 +213,7 @@ def delete_user_booking(
     )
 
     try:
-        booking_db = booking_crud.get_by_id(session, booking_id)
-
-        # Check permissions
-        booking_crud.verify_user_can_access_booking(booking_db, current_user)
+        booking_db = booking_crud.get_owned(session, booking_id, current_user)
 
         booking_crud.delete(session, booking_db)
 
@@ -245,10 +235,7 @@ def restore_user_booking(
     logger.info(f"Restoring booking with ID: {booking_id}")
 
     try:
-        booking_db = booking_crud.get_by_id(session, booking_id)
-
-        # Check permissions
-        booking_crud.verify_user_can_access_booking(booking_db, current_user)
+        booking_db = booking_crud.get_owned(session, booking_id, current_user)
 
         booking_db = booking_crud.restore(session, booking_db)
 
@@ -272,10 +259,7 @@ def cancel_user_booking(
     )
 
     try:
-        booking_db = booking_crud.get_by_id(session, booking_id)
-
-        # Check permissions
-        booking_crud.verify_user_can_access_booking(booking_db, current_user)
+        booking_db = booking_crud.get_owned(session, booking_id, current_user)
 
         if booking_db.status == BookingStatus.CANCELLED:
             raise BookingError(
@@ -300,9 +284,11 @@ def cancel_user_booking(
 def read_booking_passengers(
     session: SessionDep,
     current_user: CurrentUser,
+    count_strategy: CountStrategyDep,
     booking_id: str,
     skip: int = 0,
     limit: int = 10,
+    cursor: Optional[str] = None,
 ) -> Any:
     """
     Retrieve passengers for a specific booking owned by the current user.
@@ -313,19 +299,23 @@ def read_booking_passengers(
     )
 
     try:
-        booking_db = booking_crud.get_by_id(session, booking_id)
-
-        # Check permissions
-        booking_crud.verify_user_can_access_booking(booking_db, current_user)
-
-        passengers, count = passenger_crud.get_passengers_by_booking(
-            session, booking_id, skip, limit
+        page = passenger_crud.get_passengers_by_booking(
+            session,
+            booking_id,
+            skip,
+            limit,
+            count_strategy,
+            cursor=cursor,
+            current_user=current_user,
         )
+        if not page.data:
+            # Tell an empty page apart from a booking the user can't access
+            booking_crud.get_owned(session, booking_id, current_user)
 
-        logger.info(f"Retrieved {count} passengers for booking: {booking_id}")
-        return {"data": passengers, "count": count}
+        logger.info(f"Retrieved {page.total} passengers for booking: {booking_id}")
+        return {"data": page.data, "count": page.total, "next_cursor": page.next_cursor}
 
-    except (BookingError, PassengerError) as e:
+    except (BookingError, PassengerError, PaginationError) as e:
         logger.error(f"Error retrieving booking passengers: {str(e)}")
         raise handle_exception(e) from e
 
@@ -349,14 +339,9 @@ def read_booking_passenger(
     )
 
     try:
-        booking_db = booking_crud.get_by_id(session, booking_id)
-        booking_crud.verify_user_can_access_booking(booking_db, current_user)
-
-        passenger_db = passenger_crud.get_by_id(session, passenger_id)
-        if passenger_db.booking_id != booking_id:
-            raise PassengerError(
-                404, f"Passenger {passenger_id} not found in booking {booking_id}"
-            )
+        passenger_db = passenger_crud.get_owned(
+            session, booking_id, passenger_id, current_user
+        )
 
         logger.info(f"Passenger retrieved successfully: {passenger_db.id}")
         return passenger_db
@@ -384,14 +369,9 @@ def update_booking_passenger(
     logger.info(f"Updating passenger ID: {passenger_id} from booking ID: {booking_id}")
 
     try:
-        booking_db = booking_crud.get_by_id(session, booking_id)
-        booking_crud.verify_user_can_access_booking(booking_db, current_user)
-
-        passenger_db = passenger_crud.get_by_id(session, passenger_id)
-        if passenger_db.booking_id != booking_id:
-            raise PassengerError(
-                404, f"Passenger {passenger_id} not found in booking {booking_id}"
-            )
+        passenger_db = passenger_crud.get_owned(
+            session, booking_id, passenger_id, current_user
+        )
 
         updated_passenger = passenger_crud.update(session, passenger_db, passenger_in)
 
@@ -407,9 +387,11 @@ def update_booking_passenger(
 def read_booking_tickets(
     session: SessionDep,
     current_user: CurrentUser,
+    count_strategy: CountStrategyDep,
     booking_id: str,
     skip: int = 0,
     limit: int = 10,
+    cursor: Optional[str] = None,
 ) -> Any:
     """
     Retrieve tickets for a specific booking owned by the current user.
@@ -419,17 +401,23 @@ def read_booking_tickets(
     )
 
     try:
-        booking_db = booking_crud.get_by_id(session, booking_id)
-        booking_crud.verify_user_can_access_booking(booking_db, current_user)
-
-        tickets, count = ticket_crud.get_tickets_by_booking(
-            session, booking_id, skip, limit
+        page = ticket_crud.get_tickets_by_booking(
+            session,
+            booking_id,
+            skip,
+            limit,
+            count_strategy,
+            cursor=cursor,
+            current_user=current_user,
         )
+        if not page.data:
+            # Tell an empty page apart from a booking the user can't access
+            booking_crud.get_owned(session, booking_id, current_user)
 
-        logger.info(f"Retrieved {count} tickets for booking: {booking_id}")
-        return {"data": tickets, "count": count}
+        logger.info(f"Retrieved {page.total} tickets for booking: {booking_id}")
+        return {"data": page.data, "count": page.total, "next_cursor": page.next_cursor}
 
-    except (BookingError, TicketError) as e:
+    except (BookingError, TicketError, PaginationError) as e:
         logger.error(f"Error retrieving booking tickets: {str(e)}")
         raise handle_exception(e) from e
 
@@ -446,15 +434,7 @@ def read_booking_ticket(
     logger.info(f"Retrieving ticket ID: {ticket_id} from booking ID: {booking_id}")
 
     try:
-        booking_db = booking_crud.get_by_id(session, booking_id)
-        booking_crud.verify_user_can_access_booking(booking_db, current_user)
-
-        ticket_db = ticket_crud.get_by_id(session, ticket_id)
-        passenger = passenger_crud.get_by_id(session, ticket_db.passenger_id)
-        if passenger.booking_id != booking_id:
-            raise TicketError(
-                404, f"Ticket {ticket_id} not found in booking {booking_id}"
-            )
+        ticket_db = ticket_crud.get_owned(session, booking_id, ticket_id, current_user)
 
         logger.info(f"Ticket retrieved successfully: {ticket_db.id}")
         return ticket_db
@@ -472,10 +452,12 @@ def read_booking_ticket(
 def read_passenger_tickets(
     session: SessionDep,
     current_user: CurrentUser,
+    count_strategy: CountStrategyDep,
     booking_id: str,
     passenger_id: str,
     skip: int = 0,
     limit: int = 10,
+    cursor: Optional[str] = None,
 ) -> Any:
     """
     Retrieve tickets for a specific passenger in a booking owned by the current user.
@@ -485,22 +467,23 @@ def read_passenger_tickets(
     )
 
     try:
-        booking_db = booking_crud.get_by_id(session, booking_id)
-        booking_crud.verify_user_can_access_booking(booking_db, current_user)
-
-        passenger_db = passenger_crud.get_by_id(session, passenger_id)
-        if passenger_db.booking_id != booking_id:
-            raise PassengerError(
-                404, f"Passenger {passenger_id} not found in booking {booking_id}"
-            )
-
-        tickets, count = ticket_crud.get_tickets_by_passenger(
-            session, passenger_id, skip, limit
+        page = ticket_crud.get_tickets_by_passenger(
+            session,
+            passenger_id,
+            skip,
+            limit,
+            count_strategy,
+            cursor=cursor,
+            booking_id=booking_id,
+            current_user=current_user,
         )
+        if not page.data:
+            # Tell an empty page apart from a passenger the user can't access
+            passenger_crud.get_owned(session, booking_id, passenger_id, current_user)
 
-        logger.info(f"Retrieved {count} tickets for passenger: {passenger_id}")
-        return {"data": tickets, "count": count}
+        logger.info(f"Retrieved {page.total} tickets for passenger: {passenger_id}")
+        return {"data": page.data, "count": page.total, "next_cursor": page.next_cursor}
 
-    except (BookingError, PassengerError, TicketError) as e:
+    except (BookingError, PassengerError, TicketError, PaginationError) as e:
         logger.error(f"Error retrieving passenger tickets: {str(e)}")
         raise handle_exception(e) from e
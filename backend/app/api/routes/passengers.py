@@ -4,8 +4,13 @@ from typing import Any, Optional
 from fastapi import APIRouter, Depends
 
 from app.api.cruds import booking_crud, passenger_crud
-from app.api.deps import SessionDep, get_current_superuser
-from app.common.exceptions import BookingError, PassengerError, handle_exception
+from app.api.deps import CountStrategyDep, SessionDep, get_current_superuser
+from app.common.exceptions import (
+    BookingError,
+    PaginationError,
+    PassengerError,
+    handle_exception,
+)
 from app.domain.schemas import (
     Message,
     PassengerCreate,
@@ -23,8 +28,10 @@ router = APIRouter(prefix="/passengers", tags=["passengers"])
 )
 def read_passengers(
     session: SessionDep,
+    count_strategy: CountStrategyDep,
     skip: int = 0,
     limit: int = 10,
+    cursor: Optional[str] = None,
     booking_id: Optional[str] = None,
 ) -> Any:
     """
@@ -34,14 +41,16 @@ def read_passengers(
         logger.info("Retrieving passengers with filters")
 
         if booking_id:
-            passengers, count = passenger_crud.get_passengers_by_booking(
-                session, booking_id, skip, limit
+            page = passenger_crud.get_passengers_by_booking(
+                session, booking_id, skip, limit, count_strategy, cursor=cursor
             )
         else:
-            passengers, count = passenger_crud.get_all_passengers(session, skip, limit)
-        return {"data": passengers, "count": count}
+            page = passenger_crud.get_all_passengers(
+                session, skip, limit, count_strategy, cursor=cursor
+            )
+        return {"data": page.data, "count": page.total, "next_cursor": page.next_cursor}
 
-    except PassengerError as e:
+    except (PassengerError, PaginationError) as e:
         logger.error(f"Error reading passengers: {str(e)}")
         raise handle_exception(e) from e
 
@@ -3,10 +3,29 @@ from typing import Any, Optional
 
 from fastapi import APIRouter, Depends
 
-from app.api.cruds import seat_crud
-from app.api.deps import CurrentUser, SessionDep, get_current_superuser
-from app.common.exceptions import SeatError, SeatNotAvailableError, handle_exception
-from app.domain.schemas import Message, SeatCreate, SeatPublic, SeatsPublic, SeatUpdate
+from app.api.cruds import seat_crud, seat_hold_crud
+from app.api.deps import (
+    CountStrategyDep,
+    CurrentUser,
+    SessionDep,
+    get_current_superuser,
+)
+from app.common.exceptions import (
+    FlightError,
+    PaginationError,
+    SeatError,
+    handle_exception,
+)
+from app.domain.schemas import (
+    Message,
+    SeatCreate,
+    SeatHoldCreate,
+    SeatHoldPublic,
+    SeatMapPublic,
+    SeatPublic,
+    SeatsPublic,
+    SeatUpdate,
+)
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/seats", tags=["seats"])
@@ -15,8 +34,10 @@ router = APIRouter(prefix="/seats", tags=["seats"])
 @router.get("", response_model=SeatsPublic)
 def read_seats(
     session: SessionDep,
+    count_strategy: CountStrategyDep,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
     flight_id: Optional[str] = None,
     available_only: bool = False,
 ) -> Any:
@@ -27,15 +48,23 @@ def read_seats(
         logger.info("Retrieving seats with filters")
 
         if flight_id:
-            seats, count = seat_crud.get_seats_by_flight(
-                session, flight_id, skip, limit, available_only
+            page = seat_crud.get_seats_by_flight(
+                session,
+                flight_id,
+                skip,
+                limit,
+                available_only,
+                count_strategy,
+                cursor=cursor,
             )
         else:
-            seats, count = seat_crud.get_all_seats(session, skip, limit, available_only)
+            page = seat_crud.get_all_seats(
+                session, skip, limit, available_only, count_strategy, cursor=cursor
+            )
 
-        return {"data": seats, "count": count}
+        return {"data": page.data, "count": page.total, "next_cursor": page.next_cursor}
 
-    except SeatError as e:
+    except (SeatError, PaginationError) as e:
         logger.error(f"Error reading seats: {str(e)}")
         raise handle_exception(e) from e
 
@@ -44,8 +73,10 @@ def read_seats(
 def read_seats_by_flight(
     session: SessionDep,
     flight_id: str,
+    count_strategy: CountStrategyDep,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
     available_only: bool = False,
 ) -> Any:
     """
@@ -54,17 +85,75 @@ def read_seats_by_flight(
     try:
         logger.info(f"Retrieving seats for flight: {flight_id}")
 
-        seats, count = seat_crud.get_seats_by_flight(
-            session, flight_id, skip, limit, available_only
+        page = seat_crud.get_seats_by_flight(
+            session,
+            flight_id,
+            skip,
+            limit,
+            available_only,
+            count_strategy,
+            cursor=cursor,
         )
 
-        return {"data": seats, "count": count}
+        return {"data": page.data, "count": page.total, "next_cursor": page.next_cursor}
 
-    except SeatError as e:
+    except (SeatError, PaginationError) as e:
         logger.error(f"Error retrieving seats for flight {flight_id}: {str(e)}")
         raise handle_exception(e) from e
 
 
+@router.get("/flight/{flight_id}/map", response_model=SeatMapPublic)
+def read_seat_map(session: SessionDep, flight_id: str) -> Any:
+    """
+    Retrieve the compact seat map of a flight: its row/column layout with
+    seat and availability bitsets, and a version that changes with any of
+    its seats.
+    """
+    try:
+        logger.info(f"Retrieving seat map for flight: {flight_id}")
+        return seat_crud.get_seat_map(session, flight_id)
+
+    except FlightError as e:
+        logger.error(f"Error retrieving seat map for flight {flight_id}: {str(e)}")
+        raise handle_exception(e) from e
+
+
+@router.post("/holds", response_model=SeatHoldPublic)
+def hold_seats(
+    session: SessionDep, current_user: CurrentUser, hold_in: SeatHoldCreate
+) -> Any:
+    """
+    Hold seats for the current user during checkout.
+
+    The seats stay off sale until the returned hold token is used to create
+    a booking, the hold is released, or it expires.
+    """
+    try:
+        logger.info(f"User {current_user.id} holding seats: {hold_in.seat_ids}")
+        return seat_hold_crud.create(session, current_user.id, hold_in)
+
+    except (SeatError, FlightError) as e:
+        logger.error(f"Error holding seats: {str(e)}")
+        raise handle_exception(e) from e
+
+
+@router.delete("/holds/{hold_token}", response_model=Message)
+def release_seat_hold(
+    session: SessionDep, current_user: CurrentUser, hold_token: str
+) -> Any:
+    """
+    Release the seats held under a hold token by the current user.
+    """
+    try:
+        logger.info(f"User {current_user.id} releasing seat hold: {hold_token}")
+        released = seat_hold_crud.release(session, hold_token, current_user.id)
+        return Message(msg=f"Released {released} held seats")
+
+    except SeatError as e:
+        logger.error(f"Error releasing seat hold: {str(e)}")
+        raise handle_exception(e) from e
+
+
 @router.post(
     "",
     dependencies=[Depends(get_current_superuser)],
@@ -162,16 +251,7 @@ def reserve_seat(session: SessionDep, seat_id: str, current_user: CurrentUser) -
     try:
         logger.info(f"User {current_user.id} reserving seat with ID: {seat_id}")
 
-        seat_db = seat_crud.get_by_id(session, seat_id)
-
-        # Check if seat is available
-        if not seat_db.is_available:
-            logger.error(f"Seat {seat_id} is not available")
-            raise SeatNotAvailableError(seat_number=seat_db.seat_number)
-
-        # Reserve the seat by updating is_available to False
-        update_data = SeatUpdate(is_available=False)
-        updated_seat = seat_crud.update(session, seat_db, update_data)
+        updated_seat = seat_crud.reserve(session, seat_id)
 
         logger.info(f"Seat {seat_id} reserved successfully by user {current_user.id}")
         return updated_seat
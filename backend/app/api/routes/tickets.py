@@ -4,8 +4,13 @@ from typing import Any, Optional
 from fastapi import APIRouter, Depends
 
 from app.api.cruds import passenger_crud, ticket_crud
-from app.api.deps import SessionDep, get_current_superuser
-from app.common.exceptions import PassengerError, TicketError, handle_exception
+from app.api.deps import CountStrategyDep, SessionDep, get_current_superuser
+from app.common.exceptions import (
+    PaginationError,
+    PassengerError,
+    TicketError,
+    handle_exception,
+)
 from app.domain.schemas import (
     Message,
     TicketCreate,
@@ -23,8 +28,10 @@ router = APIRouter(prefix="/tickets", tags=["tickets"])
 )
 def read_tickets(
     session: SessionDep,
+    count_strategy: CountStrategyDep,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
     flight_id: Optional[str] = None,
 ) -> Any:
     """
@@ -34,15 +41,17 @@ def read_tickets(
 
     try:
         if flight_id:
-            tickets, count = ticket_crud.get_tickets_by_flight(
-                session, flight_id, skip, limit
+            page = ticket_crud.get_tickets_by_flight(
+                session, flight_id, skip, limit, count_strategy, cursor=cursor
             )
         else:
-            tickets, count = ticket_crud.get_all_tickets(session, skip, limit)
+            page = ticket_crud.get_all_tickets(
+                session, skip, limit, count_strategy, cursor=cursor
+            )
 
-        return {"data": tickets, "count": count}
+        return {"data": page.data, "count": page.total, "next_cursor": page.next_cursor}
 
-    except TicketError as e:
+    except (TicketError, PaginationError) as e:
         logger.error(f"Error reading tickets: {str(e)}")
         raise handle_exception(e) from e
 
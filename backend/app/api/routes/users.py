@@ -4,8 +4,8 @@ from typing import Any, Optional
 from fastapi import APIRouter, Depends
 
 from app.api.cruds import user_crud
-from app.api.deps import SessionDep, get_current_superuser
-from app.common.exceptions import UserError, handle_exception
+from app.api.deps import CountStrategyDep, SessionDep, get_current_superuser
+from app.common.exceptions import PaginationError, UserError, handle_exception
 from app.core.config import settings
 from app.domain.schemas import Message, UserPublic, UsersPublic, UserUpdateStatus
 
@@ -20,8 +20,10 @@ router = APIRouter(prefix="/users", tags=["users"])
 )
 def read_users(
     session: SessionDep,
+    count_strategy: CountStrategyDep,
     skip: int = 0,
     limit: int = 10,
+    cursor: Optional[str] = None,
     email: Optional[str] = None,
     name: Optional[str] = None,
     is_active: Optional[bool] = None,
@@ -32,10 +34,23 @@ def read_users(
     """
     logger.info(f"Retrieving users list with filters (skip={skip}, limit={limit})")
 
-    users, count = user_crud.search_users(
-        session, email, name, is_active, is_superuser, skip, limit
-    )
-    return {"data": users, "count": count}
+    try:
+        page = user_crud.search_users(
+            session,
+            email,
+            name,
+            is_active,
+            is_superuser,
+            skip,
+            limit,
+            count_strategy,
+            cursor=cursor,
+        )
+        return {"data": page.data, "count": page.total, "next_cursor": page.next_cursor}
+
+    except PaginationError as e:
+        logger.error(f"Error reading users: {str(e)}")
+        raise handle_exception(e) from e
 
 
 @router.get(
@@ -130,6 +130,14 @@ class BookingStatusError(BookingError):
         super().__init__(detail=detail, **kwargs)
 
 
+class IdempotencyKeyReusedError(BookingError):
+    """Exception raised when an idempotency key is reused for another request."""
+
+    status_code = status.HTTP_409_CONFLICT
+    detail = "Idempotency key was already used for a different request"
+    error_code = "idempotency_key_reused"
+
+
 class UnauthorizedBookingAccessError(BookingError):
     """Exception raised when user tries to access a booking they don't own."""
 
@@ -215,6 +223,32 @@ class FlightAlreadyExistsError(FlightError):
         super().__init__(**kwargs)
 
 
+class AircraftConfigurationNotFoundError(FlightError):
+    """Exception raised when an aircraft configuration is not found."""
+
+    status_code = status.HTTP_404_NOT_FOUND
+    detail = "Aircraft configuration not found"
+    error_code = "aircraft_configuration_not_found"
+
+    def __init__(self, configuration_id: str, **kwargs: Any) -> None:
+        self.detail = f"Aircraft configuration not found with ID: {configuration_id}"
+        self.configuration_id = configuration_id
+        super().__init__(**kwargs)
+
+
+class AircraftConfigurationAlreadyExistsError(FlightError):
+    """Exception raised when trying to create a duplicate aircraft configuration."""
+
+    status_code = status.HTTP_409_CONFLICT
+    detail = "Aircraft configuration already exists"
+    error_code = "aircraft_configuration_already_exists"
+
+    def __init__(self, name: str, **kwargs: Any) -> None:
+        self.detail = f"Aircraft configuration '{name}' already exists"
+        self.name = name
+        super().__init__(**kwargs)
+
+
 # Seat related errors
 class SeatError(AppError):
     """Base class for seat-related exceptions."""
@@ -271,6 +305,14 @@ class SeatNotAvailableError(SeatError):
         super().__init__(**kwargs)
 
 
+class SeatHoldNotFoundError(SeatError):
+    """Exception raised when a seat hold is not found or has been released."""
+
+    status_code = status.HTTP_404_NOT_FOUND
+    detail = "Seat hold not found"
+    error_code = "seat_hold_not_found"
+
+
 # Ticket related errors
 class TicketError(AppError):
     """Base class for ticket-related exceptions."""
@@ -308,6 +350,22 @@ class NoAvailableSeatsError(TicketError):
     error_code = "no_available_seats"
 
 
+# Pagination related errors
+class PaginationError(AppError):
+    """Base class for pagination-related exceptions."""
+
+    status_code = status.HTTP_400_BAD_REQUEST
+    detail = "Pagination error"
+    error_code = "pagination_error"
+
+
+class InvalidCursorError(PaginationError):
+    """Exception raised when a pagination cursor cannot be decoded."""
+
+    detail = "Invalid pagination cursor"
+    error_code = "invalid_cursor"
+
+
 def handle_exception(error: Exception) -> HTTPException:
     """
     Convert application exceptions to FastAPI HTTPExceptions and log appropriately.
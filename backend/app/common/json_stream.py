@@ -0,0 +1,199 @@
+import codecs
+import json
+from collections.abc import AsyncIterable, AsyncIterator
+from typing import Any, NamedTuple, Optional
+
+# Most undecodable text buffered while waiting for a JSON array element to end
+MAX_ELEMENT_SIZE = 1024 * 1024
+
+# Longest NDJSON line in bytes; longer lines fail without being buffered
+MAX_LINE_SIZE = 1024 * 1024
+
+# Characters that can end a number or literal inside a JSON array
+_SCALAR_ENDS = frozenset(" \t\r\n,]")
+
+
+class JsonRecord(NamedTuple):
+    """A record parsed from a JSON stream, or the error that replaced it."""
+
+    # 1-based line number for NDJSON, element position for a JSON array
+    row: int
+    value: Any
+    error: Optional[str] = None
+
+
+class _LineParser:
+    """
+    Incremental parser for newline-delimited JSON, one record per line.
+
+    A malformed or overlong line only fails its own record. Blank lines are
+    skipped but still counted, so rows match line numbers.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = b""
+        self._row = 0
+        # Whether the rest of an overlong line is being discarded
+        self._skipping = False
+
+    def feed(self, chunk: bytes) -> list[JsonRecord]:
+        *lines, self._buffer = (self._buffer + chunk).split(b"\n")
+        records = []
+        for line in lines:
+            if self._skipping:
+                # The end of a line that already failed
+                self._skipping = False
+            elif record := self._parse(line):
+                records.append(record)
+
+        if len(self._buffer) > MAX_LINE_SIZE:
+            if not self._skipping:
+                self._row += 1
+                records.append(self._too_long())
+                self._skipping = True
+            self._buffer = b""
+        return records
+
+    def close(self) -> list[JsonRecord]:
+        line = b"" if self._skipping else self._buffer
+        record = self._parse(line) if line.strip() else None
+        self._buffer = b""
+        self._skipping = False
+        return [record] if record else []
+
+    def _parse(self, line: bytes) -> Optional[JsonRecord]:
+        self._row += 1
+        if not line.strip():
+            return None
+        if len(line) > MAX_LINE_SIZE:
+            return self._too_long()
+        try:
+            return JsonRecord(self._row, json.loads(line))
+        except ValueError as e:
+            return JsonRecord(self._row, None, f"Invalid JSON: {e}")
+
+    def _too_long(self) -> JsonRecord:
+        return JsonRecord(self._row, None, f"Line exceeds {MAX_LINE_SIZE} bytes")
+
+
+class _ArrayParser:
+    """
+    Incremental parser for the elements of a top-level JSON array.
+
+    Elements are decoded as soon as they are complete, so the array is never
+    held in memory as a whole. A syntax error ends the stream, since there is
+    no reliable way to find the next element after it. So does anything but
+    whitespace after the closing bracket.
+    """
+
+    def __init__(self) -> None:
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._row = 0
+        self._started = False
+        self._need_comma = False
+        self._closed = False
+        self._finished = False
+
+    def feed(self, chunk: bytes) -> list[JsonRecord]:
+        self._buffer += self._text.decode(chunk)
+        return self._drain(final=False)
+
+    def close(self) -> list[JsonRecord]:
+        self._buffer += self._text.decode(b"", final=True)
+        records = self._drain(final=True)
+        if not self._finished and not self._closed:
+            records.append(self._fail("Unexpected end of JSON array"))
+        return records
+
+    def _drain(self, final: bool) -> list[JsonRecord]:
+        records: list[JsonRecord] = []
+        position = 0
+        while not self._finished:
+            position = _skip_whitespace(self._buffer, position)
+            if position >= len(self._buffer):
+                break
+
+            if self._closed:
+                records.append(self._fail("Unexpected data after JSON array"))
+                break
+
+            if not self._started:
+                if self._buffer[position] != "[":
+                    records.append(self._fail("Expected a JSON array"))
+                    break
+                self._started = True
+                position += 1
+                continue
+
+            if self._buffer[position] == "]":
+                self._closed = True
+                position += 1
+                continue
+
+            if self._need_comma:
+                if self._buffer[position] != ",":
+                    records.append(self._fail("Expected ',' between array elements"))
+                    break
+                self._need_comma = False
+                position += 1
+                continue
+
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, position)
+            except json.JSONDecodeError as e:
+                if final or len(self._buffer) - position > MAX_ELEMENT_SIZE:
+                    records.append(self._fail(f"Invalid JSON: {e}"))
+                # Otherwise the element may just be incomplete
+                break
+
+            if not final and _may_continue(self._buffer, end, value):
+                # A number or literal may continue in the next chunk
+                break
+
+            self._row += 1
+            self._need_comma = True
+            records.append(JsonRecord(self._row, value))
+            position = end
+
+        self._buffer = self._buffer[position:]
+        return records
+
+    def _fail(self, error: str) -> JsonRecord:
+        self._finished = True
+        self._buffer = ""
+        return JsonRecord(self._row + 1, None, error)
+
+
+def _may_continue(text: str, end: int, value: Any) -> bool:
+    """
+    Whether a number or literal decoded up to `end` may be the prefix of a
+    longer one, e.g. 1 out of "1." before the chunk holding "5" arrives.
+    """
+    if isinstance(value, (dict, list, str)):
+        return False
+    if len(text) - end > MAX_ELEMENT_SIZE:
+        return False
+    return not any(char in _SCALAR_ENDS for char in text[end:])
+
+
+def _skip_whitespace(text: str, position: int) -> int:
+    while position < len(text) and text[position] in " \t\r\n":
+        position += 1
+    return position
+
+
+async def iter_json_records(
+    chunks: AsyncIterable[bytes], ndjson: bool
+) -> AsyncIterator[JsonRecord]:
+    """
+    Parse records from a byte stream holding either newline-delimited JSON
+    or a single JSON array, without reading the whole stream first.
+    """
+    parser = _LineParser() if ndjson else _ArrayParser()
+    async for chunk in chunks:
+        for record in parser.feed(chunk):
+            yield record
+    for record in parser.close():
+        yield record
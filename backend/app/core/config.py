@@ -1,5 +1,5 @@
 import secrets
-from typing import Annotated, Any
+from typing import Annotated, Any, Literal
 
 from pydantic import AnyUrl, BeforeValidator, EmailStr, PostgresDsn, computed_field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -70,6 +70,41 @@ class Settings(BaseSettings):
             path=self.POSTGRES_DB,
         )
 
+    # Pagination settings
+    COUNT_CACHE_TTL_SECONDS: int = 30
+    COUNT_CACHE_MAX_ENTRIES: int = 1024
+
+    # Flight search cache settings (0 entries disables the cache)
+    FLIGHT_SEARCH_CACHE_TTL_SECONDS: int = 30
+    FLIGHT_SEARCH_CACHE_MAX_ENTRIES: int = 2048
+
+    # Flight search backend: "sql" queries Postgres, "index" evaluates filters
+    # against the in-memory columnar index loaded at startup
+    FLIGHT_SEARCH_BACKEND: Literal["sql", "index"] = "sql"
+
+    # Cheapest flights per direction that round-trip search pairs up
+    ROUND_TRIP_MAX_CANDIDATES: int = 200
+
+    # Seat hold settings: how long a checkout holds seats, and how often and
+    # in what batch size expired holds are released
+    SEAT_HOLD_TTL_SECONDS: int = 600
+    SEAT_HOLD_MAX_SEATS: int = 9
+    SEAT_HOLD_SWEEP_INTERVAL_SECONDS: int = 30
+    SEAT_HOLD_SWEEP_BATCH_SIZE: int = 500
+
+    # How long booking responses are kept for Idempotency-Key replays
+    IDEMPOTENCY_KEY_TTL_SECONDS: int = 60 * 60 * 24
+    IDEMPOTENCY_KEY_SWEEP_BATCH_SIZE: int = 1000
+
+    # Most flights accepted by one upsert request
+    FLIGHT_UPSERT_MAX_FLIGHTS: int = 1000
+
+    # Flights written per transaction by a bulk import. Every flight takes
+    # about 25 bind parameters and Postgres allows 65535 per statement.
+    FLIGHT_BULK_CHUNK_SIZE: int = 1000
+    # Most row errors reported back by a bulk import; later ones are counted
+    FLIGHT_BULK_MAX_ERRORS: int = 1000
+
     # User settings
     FIRST_SUPERUSER: EmailStr
     FIRST_SUPERUSER_PASSWORD: str
@@ -1,6 +1,10 @@
+from .aircraft_configuration_model import AircraftConfiguration
 from .booking_model import Booking, BookingStatus
 from .flight_model import Flight
+from .idempotency_key_model import IdempotencyKey
 from .passenger_model import Passenger
+from .route_day_fare_model import RouteDayFare
+from .seat_hold_model import SeatHold
 from .seat_model import Seat
 from .ticket_model import Ticket
 from .user_model import User
@@ -0,0 +1,25 @@
+from typing import Any
+
+from sqlalchemy import JSON, Column
+from sqlmodel import Field, SQLModel
+
+from app.utils import generate_unique_id
+
+
+class AircraftConfiguration(SQLModel, table=True):
+    """
+    Seat layout of an aircraft type, shared by the flights that use it.
+
+    Configurations are immutable once created, so their compiled seat
+    templates can be cached for the lifetime of the process.
+    """
+
+    __tablename__ = "aircraft_configuration"
+
+    id: str = Field(default_factory=generate_unique_id, primary_key=True)
+    name: str = Field(unique=True)
+    rows: int
+    layout: str  # Seat columns left to right, with spaces for aisles: "ABC DEF"
+    seat_count: int  # Sellable seats, after blocked seats
+    blocked_seats: list[str] = Field(default_factory=list, sa_column=Column(JSON))
+    cabins: list[dict[str, Any]] = Field(default_factory=list, sa_column=Column(JSON))
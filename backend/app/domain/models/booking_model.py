@@ -2,7 +2,7 @@ from datetime import datetime
 from enum import Enum
 from typing import TYPE_CHECKING, Optional
 
-from sqlmodel import Field, Relationship, SQLModel
+from sqlmodel import Field, Index, Relationship, SQLModel
 
 from app.utils import generate_booking_number, generate_unique_id
 
@@ -18,6 +18,11 @@ class BookingStatus(str, Enum):
 
 
 class Booking(SQLModel, table=True):
+    __table_args__ = (
+        Index("ix_booking_date_id", "booking_date", "id"),
+        Index("ix_booking_user_date_id", "user_id", "booking_date", "id"),
+    )
+
     id: str = Field(default_factory=generate_unique_id, primary_key=True)
     booking_number: str = Field(
         default_factory=generate_booking_number,
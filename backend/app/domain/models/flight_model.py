@@ -1,7 +1,7 @@
 from datetime import date, datetime
 from typing import TYPE_CHECKING, Optional
 
-from sqlmodel import Field, Relationship, SQLModel
+from sqlmodel import Field, Index, Relationship, SQLModel, UniqueConstraint
 
 from app.utils import generate_unique_id
 
@@ -11,9 +11,28 @@ if TYPE_CHECKING:
 
 
 class Flight(SQLModel, table=True):
+    __table_args__ = (
+        Index(
+            "ix_flight_route_date_departure",
+            "departure_code",
+            "arrival_code",
+            "flight_date",
+            "departure_minute",
+        ),
+        Index("ix_flight_airline_date", "airline_code", "flight_date"),
+        Index("ix_flight_date_departure", "flight_date", "departure_minute"),
+        Index("ix_flight_departure_time_id", "departure_time", "id"),
+        UniqueConstraint(
+            "flight_number",
+            "flight_date",
+            "departure_time",
+            name="uq_flight_number_date_departure",
+        ),
+    )
+
     id: str = Field(default_factory=generate_unique_id, primary_key=True)
     flight_number: str
-    flight_date: date = Field(index=True)
+    flight_date: date
     airline_name: str
     airline_code: str
 
@@ -21,6 +40,7 @@ class Flight(SQLModel, table=True):
     departure_airport: str
     departure_code: str
     departure_time: datetime
+    departure_minute: int  # Minute of day of departure_time, for index range scans
     departure_terminal: Optional[str] = None
     departure_gate: Optional[str] = None
 
@@ -28,12 +48,18 @@ class Flight(SQLModel, table=True):
     arrival_airport: str
     arrival_code: str
     arrival_time: datetime
+    arrival_minute: int  # Minute of day of arrival_time
     arrival_terminal: Optional[str] = None
     arrival_gate: Optional[str] = None
 
     # Price and seat availability
     price: float
-    available_seats: int
+    available_seats: int  # Seat capacity set at creation
+    seats_remaining: int = 0  # Live count of available seats
+    seat_map_version: int = 0  # Bumped on every change to the flight's seats
+    aircraft_configuration_id: Optional[str] = Field(
+        default=None, foreign_key="aircraft_configuration.id"
+    )
 
     # Relationships
     seats: list["Seat"] = Relationship(back_populates="flight")
@@ -0,0 +1,23 @@
+from datetime import datetime
+from typing import Any, Optional
+
+from sqlalchemy import JSON, Column
+from sqlmodel import Field, SQLModel
+
+
+class IdempotencyKey(SQLModel, table=True):
+    """
+    Outcome of a request made with an Idempotency-Key header.
+
+    The row is inserted in the same transaction as the request's writes, so
+    a concurrent retry waits on it and then replays the stored response.
+    Rows are deleted once they expire.
+    """
+
+    __tablename__ = "idempotency_key"
+
+    user_id: str = Field(foreign_key="user.id", primary_key=True, ondelete="CASCADE")
+    key: str = Field(primary_key=True, max_length=255)
+    fingerprint: str  # SHA-256 of the request, to reject reuse for another request
+    response: Optional[dict[str, Any]] = Field(default=None, sa_column=Column(JSON))
+    expires_at: datetime = Field(index=True)
@@ -1,7 +1,7 @@
 from datetime import date
 from typing import TYPE_CHECKING, Optional
 
-from sqlmodel import Field, Relationship, SQLModel
+from sqlmodel import Field, Index, Relationship, SQLModel
 
 from app.utils import generate_unique_id
 
@@ -11,6 +11,8 @@ if TYPE_CHECKING:
 
 
 class Passenger(SQLModel, table=True):
+    __table_args__ = (Index("ix_passenger_booking_id", "booking_id", "id"),)
+
     id: str = Field(default_factory=generate_unique_id, primary_key=True)
     first_name: str
     last_name: str
@@ -0,0 +1,20 @@
+from datetime import date
+
+from sqlmodel import Field, SQLModel
+
+
+class RouteDayFare(SQLModel, table=True):
+    """
+    Cheapest price and number of flights per route and day.
+
+    Aggregate of the flight table, refreshed by flight_crud writes in the
+    same transaction so the fare calendar is a single range read.
+    """
+
+    __tablename__ = "route_day_fare"
+
+    departure_code: str = Field(primary_key=True)
+    arrival_code: str = Field(primary_key=True)
+    flight_date: date = Field(primary_key=True)
+    min_price: float
+    flight_count: int
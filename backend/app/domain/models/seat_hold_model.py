@@ -0,0 +1,23 @@
+from datetime import datetime
+
+from sqlmodel import Field, SQLModel
+
+
+class SeatHold(SQLModel, table=True):
+    """
+    Temporary hold on a seat during checkout.
+
+    A held seat is marked unavailable like a sold one, so every other claim
+    path skips it. The hold is either consumed by a booking made with its
+    token or released by the sweeper once it expires, which keeps the table
+    down to the holds currently in flight.
+    """
+
+    __tablename__ = "seat_hold"
+
+    seat_id: str = Field(foreign_key="seat.id", primary_key=True, ondelete="CASCADE")
+    hold_token: str = Field(index=True)
+    # Not cascaded, so the held seats are released before the user goes
+    user_id: str = Field(foreign_key="user.id")
+    flight_id: str = Field(foreign_key="flight.id", ondelete="CASCADE")
+    expires_at: datetime = Field(index=True)
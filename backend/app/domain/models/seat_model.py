@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING, Optional
 
-from sqlmodel import Field, Relationship, SQLModel
+from sqlmodel import Field, Index, Relationship, SQLModel, UniqueConstraint
 
 from app.utils import generate_unique_id
 
@@ -10,6 +10,11 @@ if TYPE_CHECKING:
 
 
 class Seat(SQLModel, table=True):
+    __table_args__ = (
+        UniqueConstraint("flight_id", "seat_number", name="uq_seat_flight_seat_number"),
+        Index("ix_seat_flight_number_id", "flight_id", "seat_number", "id"),
+    )
+
     id: str = Field(default_factory=generate_unique_id, primary_key=True)
     seat_number: str
     is_available: bool = True
@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING
 
-from sqlmodel import Field, Relationship, SQLModel
+from sqlmodel import Field, Index, Relationship, SQLModel, UniqueConstraint
 
 from app.utils import generate_ticket_number, generate_unique_id
 
@@ -11,6 +11,12 @@ if TYPE_CHECKING:
 
 
 class Ticket(SQLModel, table=True):
+    __table_args__ = (
+        Index("ix_ticket_passenger_id", "passenger_id", "id"),
+        Index("ix_ticket_flight_id", "flight_id", "id"),
+        UniqueConstraint("seat_id", name="uq_ticket_seat_id"),
+    )
+
     id: str = Field(default_factory=generate_unique_id, primary_key=True)
     ticket_number: str = Field(default_factory=generate_ticket_number)
 
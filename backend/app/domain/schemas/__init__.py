@@ -1,3 +1,10 @@
+from .aircraft_configuration_schema import (
+    AircraftConfigurationBase,
+    AircraftConfigurationCreate,
+    AircraftConfigurationPublic,
+    AircraftConfigurationsPublic,
+    CabinZone,
+)
 from .booking_schema import (
     BookingBase,
     BookingCreate,
@@ -9,12 +16,26 @@ from .booking_schema import (
     BookingUpdate,
 )
 from .flight_schema import (
+    ConnectionSearch,
+    ConnectionSort,
+    FareCalendarDay,
+    FareCalendarPublic,
     FlightBase,
+    FlightBulkImportPublic,
     FlightCreate,
+    FlightImportError,
     FlightPublic,
     FlightSearch,
+    FlightSearchCacheStats,
     FlightsPublic,
+    FlightsUpsertPublic,
     FlightUpdate,
+    FlightUpsertPublic,
+    ItinerariesPublic,
+    ItineraryPublic,
+    RoundTripPublic,
+    RoundTripSearch,
+    RoundTripsPublic,
 )
 from .passenger_schema import (
     PassengerBase,
@@ -28,6 +49,9 @@ from .passenger_schema import (
 from .seat_schema import (
     SeatBase,
     SeatCreate,
+    SeatHoldCreate,
+    SeatHoldPublic,
+    SeatMapPublic,
     SeatPublic,
     SeatsPublic,
     SeatUpdate,
@@ -51,6 +75,7 @@ from .user_schema import (
     UserUpdateStatus,
 )
 from .util_schema import (
+    CountStrategy,
     Message,
     Token,
     TokenPayload,
@@ -0,0 +1,64 @@
+import re
+from typing import Optional
+
+from pydantic import BaseModel, Field, model_validator
+
+# Seat column letters, optionally separated by single-space aisles
+LAYOUT_PATTERN = re.compile(r"^[A-Z]+( [A-Z]+)*$")
+
+
+class CabinZone(BaseModel):
+    name: str
+    first_row: int = Field(ge=1)
+    last_row: int = Field(ge=1)
+
+
+class AircraftConfigurationBase(BaseModel):
+    name: str
+    rows: int = Field(ge=1, le=200)
+    layout: str = Field(description='Seat columns with spaces for aisles, "ABC DEF"')
+    blocked_seats: list[str] = Field(
+        default=[], description="Seat numbers that aren't sold, e.g. crew rests"
+    )
+    cabins: list[CabinZone] = []
+
+
+class AircraftConfigurationCreate(AircraftConfigurationBase):
+    @model_validator(mode="after")
+    def validate_layout(self) -> "AircraftConfigurationCreate":
+        """Check the layout, blocked seats and cabins fit the seat grid"""
+        if not LAYOUT_PATTERN.match(self.layout):
+            raise ValueError('Layout must be column letters and aisles, e.g. "ABC DEF"')
+
+        columns = self.layout.replace(" ", "")
+        if len(set(columns)) != len(columns):
+            raise ValueError("Layout columns must be unique")
+
+        seat_numbers = {
+            f"{row}{column}" for row in range(1, self.rows + 1) for column in columns
+        }
+        unknown = sorted(set(self.blocked_seats) - seat_numbers)
+        if unknown:
+            raise ValueError(f"Blocked seats are not in the layout: {unknown}")
+
+        covered: set[int] = set()
+        for cabin in self.cabins:
+            if not cabin.first_row <= cabin.last_row <= self.rows:
+                raise ValueError(f"Cabin {cabin.name} rows are out of range")
+            rows = set(range(cabin.first_row, cabin.last_row + 1))
+            if rows & covered:
+                raise ValueError(f"Cabin {cabin.name} overlaps another cabin")
+            covered |= rows
+
+        return self
+
+
+class AircraftConfigurationPublic(AircraftConfigurationBase):
+    id: str
+    seat_count: int
+
+
+class AircraftConfigurationsPublic(BaseModel):
+    data: list[AircraftConfigurationPublic]
+    count: Optional[int]
+    next_cursor: Optional[str] = None
@@ -20,6 +20,10 @@ class BookingFlightInfo(BaseModel):
     seat_ids: list[str | None] = Field(
         description="Optional seat IDs to assign. Must match number of passengers.",
     )
+    hold_token: Optional[str] = Field(
+        default=None,
+        description="Token of a seat hold whose seats this booking consumes.",
+    )
 
 
 class BookingCreate(BookingBase):
@@ -57,4 +61,5 @@ class BookingDetailPublic(BookingPublic):
 
 class BookingsPublic(BaseModel):
     data: list[BookingPublic]
-    count: int
+    count: Optional[int]
+    next_cursor: Optional[str] = None
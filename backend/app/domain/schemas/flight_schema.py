@@ -1,4 +1,5 @@
 from datetime import date, datetime, time
+from enum import Enum
 from typing import Optional
 
 from pydantic import BaseModel, Field
@@ -24,7 +25,10 @@ class FlightBase(BaseModel):
 
 
 class FlightCreate(FlightBase):
-    pass
+    aircraft_configuration_id: Optional[str] = Field(
+        default=None,
+        description="Seat layout to use; its seat count overrides available_seats",
+    )
 
 
 class FlightUpdate(BaseModel):
@@ -48,16 +52,44 @@ class FlightUpdate(BaseModel):
 
 class FlightPublic(FlightBase):
     id: str
+    seats_remaining: int
+    aircraft_configuration_id: Optional[str] = None
 
 
 class FlightsPublic(BaseModel):
     data: list[FlightPublic]
-    count: int
+    count: Optional[int]
+    next_cursor: Optional[str] = None
+
+
+class FlightUpsertPublic(FlightPublic):
+    inserted: bool
+
+
+class FlightsUpsertPublic(BaseModel):
+    data: list[FlightUpsertPublic]
+    inserted: int
+    updated: int
+
+
+class FlightImportError(BaseModel):
+    # 1-based line number for NDJSON, element position for a JSON array
+    row: int
+    flight_number: Optional[str] = None
+    message: str
+
+
+class FlightBulkImportPublic(BaseModel):
+    received: int
+    inserted: int
+    failed: int
+    errors: list[FlightImportError]
 
 
 class FlightSearch(BaseModel):
     skip: int = Field(default=0, ge=0)
     limit: int = Field(default=10, ge=0)
+    cursor: Optional[str] = None
     flight_date: Optional[date] = None
     airline_code: Optional[str] = None
     departure_code: Optional[str] = None
@@ -68,3 +100,75 @@ class FlightSearch(BaseModel):
     arrival_end_time: time = time.max
     start_price: Optional[float] = Field(default=None, ge=0)
     end_price: Optional[float] = Field(default=None, ge=0)
+
+
+class RoundTripSearch(BaseModel):
+    skip: int = Field(default=0, ge=0)
+    limit: int = Field(default=10, ge=0, le=100)
+    departure_code: str
+    arrival_code: str
+    outbound_date: date
+    return_date: date
+    airline_code: Optional[str] = None
+
+
+class RoundTripPublic(BaseModel):
+    outbound: FlightPublic
+    inbound: FlightPublic
+    total_price: float
+
+
+class RoundTripsPublic(BaseModel):
+    data: list[RoundTripPublic]
+    count: int
+
+
+class ConnectionSort(str, Enum):
+    """How connection search ranks itineraries."""
+
+    PRICE = "price"
+    DURATION = "duration"
+
+
+class ConnectionSearch(BaseModel):
+    departure_code: str
+    arrival_code: str
+    departure_date: date
+    max_legs: int = Field(default=2, ge=1, le=3)
+    min_connection_minutes: int = Field(default=45, ge=0)
+    max_connection_minutes: int = Field(default=360, ge=0)
+    sort_by: ConnectionSort = ConnectionSort.PRICE
+    limit: int = Field(default=10, ge=1, le=50)
+
+
+class ItineraryPublic(BaseModel):
+    legs: list[FlightPublic]
+    total_price: float
+    duration_minutes: int
+    stops: int
+
+
+class ItinerariesPublic(BaseModel):
+    data: list[ItineraryPublic]
+
+
+class FareCalendarDay(BaseModel):
+    flight_date: date
+    min_price: float
+    flight_count: int
+
+
+class FareCalendarPublic(BaseModel):
+    departure_code: str
+    arrival_code: str
+    data: list[FareCalendarDay]
+
+
+class FlightSearchCacheStats(BaseModel):
+    size: int
+    max_entries: int
+    ttl_seconds: float
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
@@ -66,4 +66,5 @@ class PassengerWithDetails(PassengerPublic):
 
 class PassengersPublic(BaseModel):
     data: list[PassengerPublic]
-    count: int
+    count: Optional[int]
+    next_cursor: Optional[str] = None
@@ -1,7 +1,10 @@
+from datetime import datetime
 from typing import Optional
 
 from pydantic import BaseModel
 
+from .aircraft_configuration_schema import CabinZone
+
 
 class SeatBase(BaseModel):
     seat_number: str
@@ -24,4 +27,42 @@ class SeatPublic(SeatBase):
 
 class SeatsPublic(BaseModel):
     data: list[SeatPublic]
-    count: int
+    count: Optional[int]
+    next_cursor: Optional[str] = None
+
+
+class SeatMapPublic(BaseModel):
+    """
+    Compact seat map of a flight.
+
+    Seats are laid out on a grid of `rows` rows (numbered from 1) by the
+    `columns` letters. `seats` and `available` are base64-encoded bitsets
+    over that grid in row-major order, most significant bit first: a set bit
+    in `seats` means the position holds a seat, and in `available` that the
+    seat can be booked. Seats whose number doesn't follow the row/column
+    pattern are listed in `unmapped` with their availability. Flights with an
+    aircraft configuration also get its `layout`, which marks aisles with
+    spaces, and its cabin zones.
+    """
+
+    flight_id: str
+    version: int
+    rows: int
+    columns: str
+    seats: str
+    available: str
+    unmapped: dict[str, bool] = {}
+    layout: Optional[str] = None
+    cabins: list[CabinZone] = []
+
+
+class SeatHoldCreate(BaseModel):
+    flight_id: str
+    seat_ids: list[str]
+
+
+class SeatHoldPublic(BaseModel):
+    hold_token: str
+    flight_id: str
+    seat_ids: list[str]
+    expires_at: datetime
@@ -28,4 +28,5 @@ class TicketWithSeat(TicketPublic):
 
 class TicketsPublic(BaseModel):
     data: list[TicketPublic]
-    count: int
+    count: Optional[int]
+    next_cursor: Optional[str] = None
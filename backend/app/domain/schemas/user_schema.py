@@ -34,7 +34,8 @@ class UserPublic(BaseUser):
 
 class UsersPublic(BaseModel):
     data: list[UserPublic]
-    count: int
+    count: int | None
+    next_cursor: str | None = None
 
 
 class UpdatePassword(BaseModel):
@@ -1,3 +1,5 @@
+from enum import Enum
+
 from pydantic import BaseModel
 
 
@@ -12,3 +14,12 @@ class TokenPayload(BaseModel):
 
 class Message(BaseModel):
     msg: str
+
+
+class CountStrategy(str, Enum):
+    """How list endpoints compute the total number of matching rows."""
+
+    EXACT = "exact"
+    ESTIMATED = "estimated"
+    CACHED = "cached"
+    NONE = "none"
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import time
 from collections.abc import AsyncGenerator
@@ -7,12 +8,36 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from sqlmodel import Session
 
+from app.api.cruds import idempotency_crud, seat_hold_crud
+from app.api.cruds.flight_changes import flight_change_listener
+from app.api.cruds.flight_index import flight_index
 from app.api.main import api_router
 from app.common.logging import setup_logging
 from app.core.config import settings
 from app.core.database import engine, init_db
 
 
+def _sweep_expired_rows() -> None:
+    with Session(engine) as session:
+        seat_hold_crud.release_expired(session, settings.SEAT_HOLD_SWEEP_BATCH_SIZE)
+        idempotency_crud.delete_expired(
+            session, settings.IDEMPOTENCY_KEY_SWEEP_BATCH_SIZE
+        )
+
+
+async def sweep_expired_rows() -> None:
+    """
+    Periodically release expired seat holds and delete expired idempotency keys.
+    """
+    logger = logging.getLogger(__name__)
+    while True:
+        await asyncio.sleep(settings.SEAT_HOLD_SWEEP_INTERVAL_SECONDS)
+        try:
+            await asyncio.to_thread(_sweep_expired_rows)
+        except Exception as e:
+            logger.error("Failed to sweep expired rows: %s", str(e))
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """
@@ -39,12 +64,27 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         logger.error("Failed to initialize database: %s", str(e), exc_info=True)
         raise
 
+    # Follow flight writes of other workers before loading anything they
+    # could change, so none falls in between
+    await flight_change_listener.start(engine)
+
+    # Load the in-memory flight index when it serves searches
+    if settings.FLIGHT_SEARCH_BACKEND == "index":
+        logger.info("Loading flight search index...")
+        with Session(engine) as session:
+            flight_index.load(session)
+
     startup_time = time.time() - start_time
     logger.info("Application startup completed in %.2f seconds", startup_time)
 
+    # Release expired seat holds and idempotency keys in the background
+    sweeper = asyncio.create_task(sweep_expired_rows())
+
     yield
 
     logger.info("Shutting down application %s", settings.PROJECT_NAME)
+    sweeper.cancel()
+    flight_change_listener.stop()
 
 
 app = FastAPI(
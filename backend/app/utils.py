@@ -1,7 +1,7 @@
 import random
 import string
 import uuid
-from datetime import datetime
+from datetime import UTC, datetime, time
 
 
 def generate_unique_id() -> str:
@@ -18,17 +18,14 @@ def generate_ticket_number() -> str:
     return "".join(random.choices(string.ascii_uppercase + string.digits, k=6))
 
 
-def generate_seat_numbers(num_seats: int, num_seats_per_row: int = 6) -> list[str]:
-    seat_numbers = []
-    i = 0
-    while i < num_seats:
-        for j in range(num_seats_per_row):
-            row = i // num_seats_per_row + 1
-            col = chr(65 + j)
-            seat_numbers.append(f"{row}{col}")
+def minute_of_day(value: datetime | time) -> int:
+    return value.hour * 60 + value.minute
 
-            i += 1
-            if i >= num_seats:
-                break
 
-    return seat_numbers
+def naive_utc(value: datetime) -> datetime:
+    """
+    Convert to the naive UTC timestamps stored in the database.
+    """
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(UTC).replace(tzinfo=None)
@@ -1,12 +1,80 @@
+import argparse
 import json
+import os
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
 import requests
+from requests.adapters import HTTPAdapter
 
+API_PREFIX = "/api/v1"
 
-def load_flights(json_file):
-    """Load flights data from JSON file"""
-    with open(json_file, encoding='utf-8') as f:
-        return json.load(f)
+# Bytes read from the input file at a time while stream-parsing it
+READ_SIZE = 64 * 1024
+
+# Responses worth retrying; anything else is final
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+def iter_flights(json_file, skip=0):
+    """
+    Yield the flights of a JSON array file one at a time, without loading
+    the whole file, skipping the first skip flights.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    position = 0
+    started = False
+    index = 0
+
+    with open(json_file, encoding="utf-8") as f:
+        eof = False
+        while True:
+            # Drop the consumed part before reading on
+            buffer = buffer[position:]
+            position = 0
+            if not eof:
+                chunk = f.read(READ_SIZE)
+                eof = not chunk
+                buffer += chunk
+
+            while True:
+                position = _skip_separators(buffer, position, started)
+                if position >= len(buffer):
+                    break
+                if not started:
+                    if buffer[position] != "[":
+                        raise ValueError(f"{json_file} doesn't hold a JSON array")
+                    started = True
+                    position += 1
+                    continue
+                if buffer[position] == "]":
+                    return
+
+                try:
+                    flight, end = decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                    # The flight continues in the next chunk
+                    break
+
+                if index >= skip:
+                    yield flight
+                index += 1
+                position = end
+
+            if eof:
+                raise ValueError(f"Unexpected end of {json_file}")
+
+
+def _skip_separators(text, position, started):
+    separators = " \t\r\n," if started else " \t\r\n"
+    while position < len(text) and text[position] in separators:
+        position += 1
+    return position
 
 
 def transform_flight(flight_data):
@@ -31,79 +99,323 @@ def transform_flight(flight_data):
     }
 
 
-def import_flights(base_url, admin_token, flights_data):
-    """Import flights data to API"""
-    headers = {
-        "Authorization": f"Bearer {admin_token}",
-        "Content-Type": "application/json",
-    }
+class Checkpoint:
+    """
+    Number of leading flights of the input file already imported.
+
+    Batches finish out of order, so the checkpoint only moves past a batch
+    once every batch before it has finished too. Resuming may resend the
+    batches that were in flight; the API reports those as already existing.
+    """
+
+    def __init__(self, path, json_file):
+        self.path = path
+        self.json_file = os.path.abspath(json_file)
+        self.done = 0
+        self._finished = {}
+        self._lock = threading.Lock()
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return 0
+        with open(self.path, encoding="utf-8") as f:
+            state = json.load(f)
+        if state.get("file") != self.json_file:
+            raise ValueError(
+                f"Checkpoint {self.path} belongs to {state.get('file')}, "
+                "use --restart to start over"
+            )
+        self.done = state["done"]
+        return self.done
+
+    def finish(self, start, count):
+        """Record that the batch of count flights starting at start is done"""
+        with self._lock:
+            self._finished[start] = count
+            moved = False
+            while self.done in self._finished:
+                self.done += self._finished.pop(self.done)
+                moved = True
+            if moved:
+                self._save()
+
+    def clear(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def _save(self):
+        temporary = f"{self.path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as f:
+            json.dump({"file": self.json_file, "done": self.done}, f)
+        os.replace(temporary, self.path)
+
 
-    success_count = 0
-    error_count = 0
+class Stats:
+    """Thread-safe import counters and request latencies"""
 
-    for flight in flights_data:
+    def __init__(self):
+        self.imported = 0
+        self.skipped = 0
+        self.failed = 0
+        self.latencies = []
+        self._lock = threading.Lock()
+
+    def record(self, imported=0, skipped=0, failed=0):
+        with self._lock:
+            self.imported += imported
+            self.skipped += skipped
+            self.failed += failed
+
+    def request_took(self, seconds):
+        with self._lock:
+            self.latencies.append(seconds)
+
+    def percentile(self, percent):
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+
+class FlightImporter:
+    """Send flights to the API in concurrent batches over pooled connections"""
+
+    def __init__(self, base_url, token, concurrency, retries, stats):
+        self.base_url = base_url.rstrip("/")
+        self.retries = retries
+        self.stats = stats
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=concurrency)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers["Authorization"] = f"Bearer {token}"
+        self.bulk = self._has_bulk_endpoint()
+
+    def _has_bulk_endpoint(self):
         try:
-            transformed_flight = transform_flight(flight)
-            response = requests.post(
-                f"{base_url}/api/v1/flights/", headers=headers, json=transformed_flight
+            response = self.session.get(f"{self.base_url}{API_PREFIX}/openapi.json")
+            return f"{API_PREFIX}/flights/bulk" in response.json().get("paths", {})
+        except (requests.RequestException, ValueError):
+            return False
+
+    def post(self, path, **kwargs):
+        """POST with retries and exponential backoff on transient failures"""
+        url = f"{self.base_url}{API_PREFIX}{path}"
+        for attempt in range(self.retries + 1):
+            started = time.perf_counter()
+            try:
+                response = self.session.post(url, timeout=300, **kwargs)
+            except requests.RequestException as e:
+                error = str(e)
+                response = None
+            else:
+                error = f"{response.status_code} - {response.text[:200]}"
+            finally:
+                self.stats.request_took(time.perf_counter() - started)
+
+            if response is not None and response.status_code not in RETRY_STATUSES:
+                return response
+            if attempt < self.retries:
+                delay = min(30.0, 0.5 * 2**attempt) * random.uniform(0.5, 1.5)
+                print(f"Retrying {path} in {delay:.1f}s after error: {error}")
+                time.sleep(delay)
+
+        raise RuntimeError(f"Giving up on {path} after {self.retries + 1} attempts")
+
+    def import_batch(self, start, flights):
+        """Import a batch of flights starting at input position start"""
+        if self.bulk:
+            self._import_bulk(start, flights)
+        else:
+            for offset, flight in enumerate(flights):
+                self._import_one(start + offset, flight)
+
+    def _import_bulk(self, start, flights):
+        body = "\n".join(json.dumps(flight) for flight in flights)
+        response = self.post(
+            "/flights/bulk",
+            data=body.encode("utf-8"),
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+        if response.status_code != 200:
+            self.stats.record(failed=len(flights))
+            print(
+                f"Failed to import flights {start + 1}-{start + len(flights)}: "
+                f"{response.status_code} - {response.text}"
             )
+            return
 
-            if response.status_code == 200 or response.status_code == 201:
-                success_count += 1
-                print(
-                    f"Successfully imported flight {transformed_flight['flight_number']} on {transformed_flight['flight_date']}"
-                )
+        result = response.json()
+        skipped = 0
+        for error in result["errors"]:
+            if "already exists" in error["message"]:
+                skipped += 1
             else:
-                error_count += 1
                 print(
-                    f"Failed to import flight {transformed_flight['flight_number']}: {response.status_code} - {response.text}"
+                    f"Failed to import flight {start + error['row']}: "
+                    f"{error['message']}"
                 )
-        except Exception as e:
-            error_count += 1
+        self.stats.record(
+            imported=result["inserted"],
+            skipped=skipped,
+            failed=result["failed"] - skipped,
+        )
+
+    def _import_one(self, position, flight):
+        response = self.post("/flights", json=flight)
+        if response.status_code in (200, 201):
+            self.stats.record(imported=1)
+        elif response.status_code == 409:
+            self.stats.record(skipped=1)
+        else:
+            self.stats.record(failed=1)
             print(
-                f"Error processing flight {flight.get('flight_number', 'unknown')}: {str(e)}"
+                f"Failed to import flight {position + 1} "
+                f"({flight.get('flight_number')}): "
+                f"{response.status_code} - {response.text}"
             )
 
-    print(
-        f"\nImport completed: {success_count} flights imported successfully, {error_count} errors"
+
+def get_token(base_url, username, password):
+    response = requests.post(
+        f"{base_url.rstrip('/')}{API_PREFIX}/signin/access-token",
+        data={"username": username, "password": password},
+        timeout=30,
     )
+    response.raise_for_status()
+    return response.json()["access_token"]
 
 
-def main():
-    # Configuration
-    base_url = "http://localhost:8000"
-    admin_token = ""
-    flight_json_file = "vietnam_flights_2025.json"
+def iter_batches(flights, start, batch_size):
+    """Group flights into (input position, flights) batches"""
+    batch = []
+    for flight in flights:
+        batch.append(flight)
+        if len(batch) == batch_size:
+            yield start, batch
+            start += len(batch)
+            batch = []
+    if batch:
+        yield start, batch
 
-    # Get admin token if not provided
-    if not admin_token:
-        username = "admin@example.com"
-        password = "changethis"
 
-        try:
-            response = requests.post(
-                f"{base_url}/api/v1/signin/access-token",
-                data={"username": username, "password": password},
-            )
+def import_flights(importer, checkpoint, batches, concurrency):
+    """Import batches with at most concurrency requests in flight"""
+    failures = []
 
-            if response.status_code == 200:
-                admin_token = response.json()["access_token"]
-                print("Successfully obtained token")
-            else:
-                print(
-                    f"Failed to obtain token: {response.status_code} - {response.text}"
-                )
-                return
+    def run(start, flights):
+        importer.import_batch(start, flights)
+        checkpoint.finish(start, len(flights))
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        in_flight = set()
+
+        def collect(futures):
+            for future in futures:
+                if future.exception() is not None:
+                    failures.append(future.exception())
+
+        for start, flights in batches:
+            in_flight.add(executor.submit(run, start, flights))
+            # Keep reading the input only as fast as batches get sent
+            if len(in_flight) >= concurrency * 2:
+                finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                collect(finished)
+            if failures:
+                break
+
+        collect(wait(in_flight).done)
+
+    if failures:
+        raise failures[0]
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Import flights into the API")
+    parser.add_argument("json_file", nargs="?", default="vietnam_flights_2025.json")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--username", default="admin@example.com")
+    parser.add_argument("--password", default="changethis")
+    parser.add_argument("--token", help="admin access token, instead of signing in")
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--retries", type=int, default=5)
+    parser.add_argument(
+        "--checkpoint", help="progress file, by default <json_file>.checkpoint"
+    )
+    parser.add_argument(
+        "--restart", action="store_true", help="ignore an existing checkpoint"
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    token = args.token
+    if not token:
+        try:
+            token = get_token(args.base_url, args.username, args.password)
+            print("Successfully obtained token")
         except Exception as e:
             print(f"Error authenticating: {str(e)}")
-            return
+            return 1
+
+    checkpoint = Checkpoint(
+        args.checkpoint or f"{args.json_file}.checkpoint", args.json_file
+    )
+    if args.restart:
+        checkpoint.clear()
+    try:
+        resume_from = checkpoint.load()
+    except ValueError as e:
+        print(str(e))
+        return 1
+    if resume_from:
+        print(f"Resuming after {resume_from} flights already imported")
+
+    stats = Stats()
+    importer = FlightImporter(
+        args.base_url, token, args.concurrency, args.retries, stats
+    )
+    mode = (
+        f"in batches of {args.batch_size}" if importer.bulk else "one flight at a time"
+    )
+    print(f"Importing {args.json_file} {mode} with concurrency {args.concurrency}")
+
+    flights = (
+        transform_flight(flight) for flight in iter_flights(args.json_file, resume_from)
+    )
+    batches = iter_batches(flights, resume_from, args.batch_size)
+
+    started = time.perf_counter()
+    try:
+        import_flights(importer, checkpoint, batches, args.concurrency)
+        completed = True
+    except Exception as e:
+        print(f"Import stopped: {str(e)}")
+        print(f"Rerun to resume after flight {checkpoint.done}")
+        completed = False
+    elapsed = time.perf_counter() - started
 
-    # Load and import flights
-    flights_data = load_flights(flight_json_file)
-    print(f"Loaded {len(flights_data)} flights from {flight_json_file}")
+    processed = stats.imported + stats.skipped + stats.failed
+    print(
+        f"\nImport {'completed' if completed else 'interrupted'}: "
+        f"{stats.imported} flights imported, {stats.skipped} already present, "
+        f"{stats.failed} errors"
+    )
+    print(
+        f"{processed} flights in {elapsed:.1f}s "
+        f"({processed / elapsed if elapsed else 0:.0f} flights/s), "
+        f"{len(stats.latencies)} requests, "
+        f"latency p50 {stats.percentile(50) * 1000:.0f} ms, "
+        f"p99 {stats.percentile(99) * 1000:.0f} ms"
+    )
 
-    import_flights(base_url, admin_token, flights_data)
+    if completed:
+        checkpoint.clear()
+    return 0 if completed else 1
 
 
 if __name__ == "__main__":
-    main()
+    raise SystemExit(main())
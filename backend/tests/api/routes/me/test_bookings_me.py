@@ -0,0 +1,46 @@
+from collections.abc import Callable
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.api.cruds import seat_crud
+from app.core.config import settings
+from app.domain.models import Flight, User
+from tests.utils import booking_in
+
+
+# Statements per request, including the user lookup. A lone passenger
+# without a chosen seat skips the seat block planner, so the auto-assigned
+# case starts at two passengers.
+@pytest.mark.parametrize(
+    ("choose_seats", "passengers", "expected"),
+    [(True, 1, 6), (True, 5, 6), (False, 2, 7), (False, 5, 7)],
+)
+def test_create_booking_statement_count(
+    client: TestClient,
+    db: Session,
+    user: User,
+    user_token_headers: dict[str, str],
+    create_flight: Callable[..., Flight],
+    count_statements: list[str],
+    choose_seats: bool,
+    passengers: int,
+    expected: int,
+) -> None:
+    flight = create_flight()
+    seats = seat_crud.get_seats_by_flight(db, flight.id).data
+    seat_ids: list[str | None] = (
+        [seat.id for seat in seats[:passengers]]
+        if choose_seats
+        else [None] * passengers
+    )
+    body = booking_in(user.id, flight.id, seat_ids).model_dump(mode="json")
+
+    count_statements.clear()
+    response = client.post(
+        f"{settings.API_V1_STR}/me/bookings", headers=user_token_headers, json=body
+    )
+
+    assert response.status_code == 200, response.text
+    assert len(count_statements) == expected, "\n".join(count_statements)
@@ -0,0 +1,46 @@
+import asyncio
+from collections.abc import AsyncIterator
+
+from app.common.json_stream import MAX_LINE_SIZE, JsonRecord, iter_json_records
+
+
+def parse(chunks: list[bytes], ndjson: bool) -> list[JsonRecord]:
+    async def stream() -> AsyncIterator[bytes]:
+        for chunk in chunks:
+            yield chunk
+
+    async def collect() -> list[JsonRecord]:
+        return [record async for record in iter_json_records(stream(), ndjson)]
+
+    return asyncio.run(collect())
+
+
+def test_array_number_split_across_chunks() -> None:
+    records = parse([b"[1.", b"5, tr", b"ue, 2", b"0]"], ndjson=False)
+
+    assert records == [
+        JsonRecord(1, 1.5),
+        JsonRecord(2, True),
+        JsonRecord(3, 20),
+    ]
+
+
+def test_array_data_after_closing_bracket() -> None:
+    records = parse([b'[{"a": 1}]  ', b'\n{"b": 2}'], ndjson=False)
+
+    assert records[0] == JsonRecord(1, {"a": 1})
+    assert records[1:] == [JsonRecord(2, None, "Unexpected data after JSON array")]
+
+
+def test_overlong_line_fails_only_its_record() -> None:
+    long_line = b'{"a": "' + b"x" * MAX_LINE_SIZE + b'"}'
+    chunks = [b'{"a": 1}\n', long_line[:1000], long_line[1000:], b'\n{"a": 2}\n']
+
+    records = parse(chunks, ndjson=True)
+
+    assert [(record.row, record.value) for record in records] == [
+        (1, {"a": 1}),
+        (2, None),
+        (3, {"a": 2}),
+    ]
+    assert records[1].error == f"Line exceeds {MAX_LINE_SIZE} bytes"
@@ -0,0 +1,124 @@
+from collections.abc import Callable, Generator
+from datetime import datetime, timedelta
+from typing import Any
+
+import pytest
+import sqlalchemy as sa
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlmodel import Session, col
+
+from app.api.cruds import fare_calendar_crud, flight_crud, user_crud
+from app.core.config import settings
+from app.core.database import engine, init_db
+from app.core.security import create_access_token
+from app.domain.models import Booking, Flight, Passenger, Seat, SeatHold, Ticket, User
+from app.domain.schemas import FlightCreate, UserCreate
+from app.main import app
+from app.utils import generate_unique_id
+
+
+@pytest.fixture(scope="session")
+def db() -> Generator[Session, None, None]:
+    with Session(engine, expire_on_commit=False) as session:
+        init_db(session)
+        yield session
+
+
+@pytest.fixture(scope="session")
+def client() -> TestClient:
+    # Not entered as a context manager, so startup tasks don't run
+    return TestClient(app)
+
+
+@pytest.fixture
+def user(db: Session) -> Generator[User, None, None]:
+    user = user_crud.create(
+        db,
+        UserCreate(
+            email=f"{generate_unique_id()}@example.com",
+            name="Test User",
+            password="changethis",
+        ),
+    )
+    yield user
+
+    bookings = sa.select(col(Booking.id)).where(col(Booking.user_id) == user.id)
+    passengers = sa.select(col(Passenger.id)).where(
+        col(Passenger.booking_id).in_(bookings)
+    )
+    db.rollback()
+    db.execute(sa.delete(Ticket).where(col(Ticket.passenger_id).in_(passengers)))
+    db.execute(sa.delete(Passenger).where(col(Passenger.booking_id).in_(bookings)))
+    db.execute(sa.delete(Booking).where(col(Booking.user_id) == user.id))
+    db.execute(sa.delete(SeatHold).where(col(SeatHold.user_id) == user.id))
+    db.execute(sa.delete(User).where(col(User.id) == user.id))
+    db.commit()
+
+
+@pytest.fixture
+def user_token_headers(user: User) -> dict[str, str]:
+    token = create_access_token(
+        user.id, timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    )
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+def create_flight(db: Session) -> Generator[Callable[..., Flight], None, None]:
+    """
+    Factory for flights with seat maps, removed again after the test.
+    """
+    flights: list[Flight] = []
+
+    def create(available_seats: int = 12, **changes: Any) -> Flight:
+        departure = datetime(2030, 1, 1, 8, 0) + timedelta(days=len(flights))
+        flight_in = {
+            "flight_number": f"TS{generate_unique_id()[:6]}",
+            "flight_date": departure.date(),
+            "airline_name": "Test Airline",
+            "airline_code": "TS",
+            "departure_airport": "Test Departure",
+            "departure_code": "TSD",
+            "departure_time": departure,
+            "arrival_airport": "Test Arrival",
+            "arrival_code": "TSA",
+            "arrival_time": departure + timedelta(hours=2),
+            "price": 100.0,
+            "available_seats": available_seats,
+        }
+        flight = flight_crud.create_with_seats(
+            db, FlightCreate.model_validate({**flight_in, **changes})
+        )
+        flights.append(flight)
+        return flight
+
+    yield create
+
+    db.rollback()
+    flight_ids = [flight.id for flight in flights]
+    route_days: list[fare_calendar_crud.RouteDay] = [
+        (flight.departure_code, flight.arrival_code, flight.flight_date)
+        for flight in flights
+    ]
+    db.execute(sa.delete(Ticket).where(col(Ticket.flight_id).in_(flight_ids)))
+    db.execute(sa.delete(SeatHold).where(col(SeatHold.flight_id).in_(flight_ids)))
+    db.execute(sa.delete(Seat).where(col(Seat.flight_id).in_(flight_ids)))
+    db.execute(sa.delete(Flight).where(col(Flight.id).in_(flight_ids)))
+    fare_calendar_crud.refresh_route_days(db, route_days)
+    db.commit()
+
+
+@pytest.fixture
+def count_statements() -> Generator[list[str], None, None]:
+    """
+    Collect the SQL statements executed while the test runs.
+    """
+    statements: list[str] = []
+
+    def record(*args: object) -> None:
+        statements.append(str(args[2]))
+
+    event.listen(engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(engine, "before_cursor_execute", record)
@@ -0,0 +1,57 @@
+import asyncio
+import time
+from collections.abc import Callable
+
+import psycopg
+import sqlalchemy as sa
+from sqlmodel import Session
+
+from app.api.cruds import flight_changes
+from app.api.cruds.flight_changes import FlightChangeListener
+from app.api.cruds.flight_index import flight_index
+from app.core.database import engine
+from app.domain.models import Flight
+
+
+def test_flight_write_notifies_on_commit(
+    create_flight: Callable[..., Flight],
+) -> None:
+    conninfo = engine.url.set(drivername="postgresql").render_as_string(
+        hide_password=False
+    )
+    with psycopg.connect(conninfo, autocommit=True) as connection:
+        connection.execute(f"LISTEN {flight_changes.CHANNEL}")
+        flight = create_flight()
+        notifications = list(connection.notifies(timeout=5, stop_after=1))
+
+    assert len(notifications) == 1
+    assert notifications[0].payload.endswith(f":{flight.id}")
+
+
+def test_listener_applies_changes_of_other_workers(
+    db: Session, create_flight: Callable[..., Flight]
+) -> None:
+    flight_index.load(db)
+    flight = create_flight()
+    # As if another worker had created it
+    flight_index.remove(flight.id)
+    indexed = len(flight_index)
+
+    async def follow() -> None:
+        listener = FlightChangeListener()
+        await listener.start(engine)
+        try:
+            db.execute(
+                sa.text("SELECT pg_notify(:channel, :payload)"),
+                {"channel": flight_changes.CHANNEL, "payload": f"other:{flight.id}"},
+            )
+            db.commit()
+            deadline = time.monotonic() + 5
+            while len(flight_index) == indexed and time.monotonic() < deadline:
+                await asyncio.sleep(0.05)
+        finally:
+            listener.stop()
+
+    asyncio.run(follow())
+
+    assert len(flight_index) == indexed + 1
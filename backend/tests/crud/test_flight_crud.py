@@ -0,0 +1,52 @@
+from collections.abc import Callable
+from datetime import date, datetime, timedelta, timezone
+
+from sqlmodel import Session
+
+from app.api.cruds import flight_crud
+from app.api.cruds.connection_graph import connection_graph
+from app.domain.models import Flight
+from app.domain.schemas import ConnectionSearch
+
+
+def test_connection_search_after_creating_flight_with_offset_time(
+    db: Session, create_flight: Callable[..., Flight]
+) -> None:
+    connection_graph.load(db)
+    create_flight()  # A naive leg already in the graph at TSD
+
+    # 15:00 at UTC+7 is 08:00 UTC, as stored in the database
+    departure = datetime(2030, 1, 1, 15, 0, tzinfo=timezone(timedelta(hours=7)))
+    first = create_flight(
+        flight_date=date(2030, 1, 1),
+        departure_time=departure,
+        arrival_code="TSX",
+        arrival_time=departure + timedelta(hours=2),
+    )
+    second = create_flight(
+        flight_date=date(2030, 1, 1),
+        departure_code="TSX",
+        departure_time=datetime(2030, 1, 1, 11, 0),
+        arrival_time=datetime(2030, 1, 1, 13, 0),
+    )
+
+    itineraries = flight_crud.search_connections(
+        db,
+        ConnectionSearch(
+            departure_code="TSD", arrival_code="TSA", departure_date=date(2030, 1, 1)
+        ),
+    )
+
+    legs = [[leg.id for leg in itinerary["legs"]] for itinerary in itineraries]
+    assert [first.id, second.id] in legs
+
+
+def test_reconcile_updates_flights_in_session(
+    db: Session, create_flight: Callable[..., Flight]
+) -> None:
+    flight = create_flight(available_seats=6)
+    flight.seats_remaining = 9
+    db.commit()
+
+    assert flight_crud.reconcile_seats_remaining(db) >= 1
+    assert flight.seats_remaining == 6
@@ -0,0 +1,39 @@
+from datetime import datetime, timedelta
+
+import pytest
+import sqlalchemy as sa
+from sqlmodel import Session, col
+
+from app.api.cruds import idempotency_crud
+from app.common.exceptions import IdempotencyKeyReusedError
+from app.domain.models import IdempotencyKey, User
+
+
+def test_expired_key_is_registered_again(db: Session, user: User) -> None:
+    assert idempotency_crud.begin(db, user.id, "retry", "first") is None
+    idempotency_crud.save_response(db, user.id, "retry", {"id": "first"})
+    db.commit()
+
+    with pytest.raises(IdempotencyKeyReusedError):
+        idempotency_crud.begin(db, user.id, "retry", "second")
+    db.rollback()
+
+    db.execute(
+        sa.update(IdempotencyKey)
+        .where(col(IdempotencyKey.user_id) == user.id)
+        .values(expires_at=datetime.now() - timedelta(seconds=1))
+    )
+    db.commit()
+
+    # Not yet swept, but expired: processed as a new request
+    assert idempotency_crud.begin(db, user.id, "retry", "second") is None
+    db.commit()
+
+    stored = db.scalars(
+        sa.select(IdempotencyKey)
+        .where(col(IdempotencyKey.user_id) == user.id)
+        .execution_options(populate_existing=True)
+    ).one()
+    assert stored.fingerprint == "second"
+    assert stored.response is None
+    assert stored.expires_at > datetime.now()
@@ -0,0 +1,49 @@
+import base64
+import json
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any
+
+import pytest
+from sqlmodel import Session, col, select
+
+from app.api.cruds.pagination import decode_cursor, encode_cursor, paginate
+from app.common.exceptions import InvalidCursorError
+from app.domain.models import Flight
+
+
+def test_exact_count_of_empty_page(
+    db: Session, create_flight: Callable[..., Flight]
+) -> None:
+    flight = create_flight()
+    query = select(Flight).where(col(Flight.id) == flight.id)
+
+    page = paginate(db, query, limit=0, order_by=(col(Flight.id),))
+
+    assert page.data == []
+    assert page.total == 1
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        [{}, "id"],
+        ["2030-01-01T08:00:00", ["id"]],
+        ["2030-01-01T08:00:00", 1],
+        [1, "id"],
+        ["2030-01-01T08:00:00"],
+        {"id": "id"},
+    ],
+)
+def test_decode_cursor_rejects_mismatched_values(payload: Any) -> None:
+    cursor = base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor, (col(Flight.departure_time), col(Flight.id)))
+
+
+def test_decode_cursor_round_trip() -> None:
+    order_by = (col(Flight.departure_time), col(Flight.price), col(Flight.id))
+    values = [datetime(2030, 1, 1, 8, 0), 99.5, "id"]
+
+    assert decode_cursor(encode_cursor(values), order_by) == values
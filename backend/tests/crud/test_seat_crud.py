@@ -0,0 +1,28 @@
+from collections.abc import Callable
+
+import pytest
+from sqlmodel import Session
+
+from app.api.cruds import seat_crud
+from app.common.exceptions import SeatNotAvailableError
+from app.core.database import engine
+from app.domain.models import Flight
+
+
+def test_claim_losing_serialization_conflict_is_not_available(
+    db: Session, create_flight: Callable[..., Flight]
+) -> None:
+    flight = create_flight()
+    seat = seat_crud.get_seats_by_flight(db, flight.id).data[0]
+
+    with Session(engine) as other:
+        # Take a snapshot in which the seat is still free
+        other.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+        assert seat_crud.get_by_id(other, seat.id).is_available
+
+        seat_crud.claim_seats(db, flight.id, [seat.id])
+        db.commit()
+
+        with pytest.raises(SeatNotAvailableError):
+            seat_crud.claim_seats(other, flight.id, [seat.id])
+        other.rollback()
@@ -0,0 +1,55 @@
+from collections.abc import Callable
+
+import pytest
+import sqlalchemy as sa
+from sqlmodel import Session, col
+
+from app.api.cruds import booking_crud, seat_crud, seat_hold_crud
+from app.common.exceptions import FlightNotFoundError, SeatError
+from app.domain.models import Flight, Seat, SeatHold, Ticket, User
+from app.domain.schemas import SeatHoldCreate
+from app.utils import generate_unique_id
+from tests.utils import booking_in
+
+
+def test_booking_cannot_consume_hold_on_another_flight(
+    db: Session, user: User, create_flight: Callable[..., Flight]
+) -> None:
+    flight = create_flight()
+    other_flight = create_flight()
+    held_seat = seat_crud.get_seats_by_flight(db, other_flight.id).data[0]
+    hold = seat_hold_crud.create(
+        db, user.id, SeatHoldCreate(flight_id=other_flight.id, seat_ids=[held_seat.id])
+    )
+
+    with pytest.raises(SeatError):
+        booking_crud.create_detailed_booking(
+            db, booking_in(user.id, flight.id, [held_seat.id], hold.hold_token)
+        )
+
+    # The hold on the other flight is untouched and nothing was sold
+    assert (
+        db.scalar(
+            sa.select(col(SeatHold.hold_token)).where(
+                col(SeatHold.seat_id) == held_seat.id
+            )
+        )
+        == hold.hold_token
+    )
+    assert not db.scalar(
+        sa.select(col(Seat.is_available)).where(col(Seat.id) == held_seat.id)
+    )
+    assert not db.scalars(
+        sa.select(Ticket).where(col(Ticket.flight_id) == flight.id)
+    ).all()
+
+
+def test_create_hold_on_missing_flight_rolls_back(db: Session, user: User) -> None:
+    with pytest.raises(FlightNotFoundError):
+        seat_hold_crud.create(
+            db,
+            user.id,
+            SeatHoldCreate(flight_id=generate_unique_id(), seat_ids=["missing"]),
+        )
+
+    assert not db.in_transaction()
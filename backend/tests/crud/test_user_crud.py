@@ -0,0 +1,32 @@
+from collections.abc import Callable
+
+import sqlalchemy as sa
+from sqlmodel import Session, col
+
+from app.api.cruds import seat_crud, seat_hold_crud, user_crud
+from app.domain.models import Flight, Seat, SeatHold, User
+from app.domain.schemas import SeatHoldCreate
+
+
+def test_delete_user_releases_held_seats(
+    db: Session, user: User, create_flight: Callable[..., Flight]
+) -> None:
+    flight = create_flight(available_seats=4)
+    seat_ids = [seat.id for seat in seat_crud.get_seats_by_flight(db, flight.id).data]
+    seat_hold_crud.create(
+        db, user.id, SeatHoldCreate(flight_id=flight.id, seat_ids=seat_ids[:2])
+    )
+
+    user_crud.delete(db, user)
+
+    assert not db.scalars(
+        sa.select(SeatHold).where(col(SeatHold.flight_id) == flight.id)
+    ).all()
+    available = db.scalars(
+        sa.select(col(Seat.id)).where(
+            col(Seat.flight_id) == flight.id, col(Seat.is_available)
+        )
+    ).all()
+    assert sorted(available) == sorted(seat_ids)
+    db.refresh(flight)
+    assert flight.seats_remaining == 4
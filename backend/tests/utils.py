@@ -0,0 +1,27 @@
+from datetime import date
+
+from app.domain.schemas import BookingCreate, BookingFlightInfo, PassengerInfo
+
+
+def booking_in(
+    user_id: str,
+    flight_id: str,
+    seat_ids: list[str | None],
+    hold_token: str | None = None,
+) -> BookingCreate:
+    return BookingCreate(
+        user_id=user_id,
+        total_price=100.0 * len(seat_ids),
+        passengers=[
+            PassengerInfo(
+                first_name=f"Passenger{index}",
+                last_name="Test",
+                nationality="VN",
+                date_of_birth=date(1990, 1, 1),
+            )
+            for index in range(len(seat_ids))
+        ],
+        flight_info=BookingFlightInfo(
+            flight_id=flight_id, seat_ids=seat_ids, hold_token=hold_token
+        ),
+    )